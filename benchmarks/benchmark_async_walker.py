@@ -0,0 +1,111 @@
+"""Walk time of `walk_tiff`, `walk_tiff_async` and `walk_tiff_parallel` over a synthetic
+`/TIFF` tree, where each directory listing waits `--latency` ms, like a network
+filesystem does.
+
+Run it from the repository root, e.g.:
+
+    $ python -m benchmarks.benchmark_async_walker --size 5000 --latency 2 --concurrency 8 32
+"""
+
+from argparse import ArgumentParser
+from asyncio import run
+from json import dump
+from os import makedirs, scandir
+from os.path import dirname, join
+from tempfile import TemporaryDirectory
+from time import perf_counter, sleep
+
+from src.cdsr_pack import walk_tiff, walk_tiff_async, walk_tiff_parallel
+from src.cdsr_pack import walker
+from src.cdsr_pack.walker import partition_report
+
+from .fixtures import synthetic_paths
+
+
+def create_tree(top: str, size: int) -> None:
+    """Creates the empty assets of `size` synthetic paths inside `top`."""
+
+    for path in synthetic_paths(size):
+        path = join(top, path[len('/TIFF/'):])
+        makedirs(dirname(path), exist_ok=True)
+
+        with open(path, 'w', encoding='utf-8'):
+            pass
+
+
+async def _walk_async(top: str, concurrency: int) -> int:
+    """Returns the number of assets found by `walk_tiff_async`."""
+
+    count = 0
+
+    async for _ in walk_tiff_async(top, concurrency=concurrency):
+        count += 1
+
+    return count
+
+
+def main(argv=None) -> None:
+    """Prints the walk time of `walk_tiff` and of the other walkers with each concurrency,
+    and the slowest partitions of `walk_tiff_parallel`."""
+
+    parser = ArgumentParser(description='Walk time of `walk_tiff`, `walk_tiff_async` and '
+                                        '`walk_tiff_parallel`.')
+    parser.add_argument('-s', '--size', type=int, default=5000,
+                        help='number of assets (default: 5000).')
+    parser.add_argument('-l', '--latency', type=float, default=2.0,
+                        help='latency of each directory listing, in ms (default: 2).')
+    parser.add_argument('-c', '--concurrency', type=int, nargs='+', default=[8, 32, 128],
+                        help='numbers of directories listed at once by `walk_tiff_async` '
+                             'and of threads of `walk_tiff_parallel` (default: 8 32 128).')
+    parser.add_argument('-o', '--output', help='JSON file to save the results into.')
+    args = parser.parse_args(argv)
+
+    def slow_scandir(path):
+        sleep(args.latency / 1000)
+        return scandir(path)
+
+    with TemporaryDirectory() as temp_dir:
+        top = join(temp_dir, 'TIFF')
+        create_tree(top, args.size)
+
+        # all walkers list the directories by `walker.scandir`
+        walker.scandir = slow_scandir
+
+        try:
+            start = perf_counter()
+            count = sum(1 for _ in walk_tiff(top))
+            results = [{'walker': 'walk_tiff', 'assets': count,
+                        'seconds': perf_counter() - start}]
+
+            for concurrency in args.concurrency:
+                start = perf_counter()
+                count = run(_walk_async(top, concurrency))
+                results.append({'walker': f'walk_tiff_async({concurrency})', 'assets': count,
+                                'seconds': perf_counter() - start})
+
+            for concurrency in args.concurrency:
+                timings = []
+                start = perf_counter()
+                count = sum(1 for _ in walk_tiff_parallel(top, workers=concurrency,
+                                                          onpartition=timings.append))
+                results.append({'walker': f'walk_tiff_parallel({concurrency})',
+                                'assets': count, 'seconds': perf_counter() - start})
+        finally:
+            walker.scandir = scandir
+
+    print(f'{args.size:,} assets, {args.latency} ms per listing')
+    print(f"{'walker':>28}{'assets':>10}{'seconds':>10}{'speedup':>10}")
+    for result in results:
+        print(f"{result['walker']:>28}{result['assets']:>10}{result['seconds']:>10.2f}"
+              f"{results[0]['seconds'] / result['seconds']:>10.1f}")
+
+    print('\nslowest partitions of the last `walk_tiff_parallel` run')
+    print(partition_report(timings, limit=5))
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as file:
+            dump(results, file, indent=2)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,87 @@
+"""Memory of a synthetic catalog of decoded records and collections, without and with
+interning of the metadata values and memoization of the collection names.
+
+Run it from the repository root, e.g.:
+
+    $ python -m benchmarks.benchmark_memory --size 1000000
+"""
+
+from argparse import ArgumentParser
+from gc import collect
+from json import dump
+from time import perf_counter
+from tracemalloc import get_traced_memory, start, stop
+
+from src.cdsr_pack import build_collection, decode_path
+from src.cdsr_pack.interning import disable_interning, enable_interning
+
+from .fixtures import synthetic_paths
+
+
+def _measure(paths: list, repeat: int) -> dict:
+    """Decodes the paths into records and builds their collections, returning
+    the memory they hold and the best time it took in `repeat` runs. Time is measured
+    in runs without `tracemalloc`, since tracing slows down allocations a lot."""
+
+    seconds = float('inf')
+
+    for _ in range(repeat):
+        begin = perf_counter()
+        records = [decode_path(path, record=True) for path in paths]
+        collections = [build_collection(record) for record in records]
+        seconds = min(seconds, perf_counter() - begin)
+
+        del records, collections
+        collect()
+
+    start()
+
+    records = [decode_path(path, record=True) for path in paths]
+    collections = [build_collection(record) for record in records]
+
+    current, _ = get_traced_memory()
+    stop()
+
+    # the catalog is kept alive until the memory is measured
+    del records, collections
+
+    return {'bytes': current, 'seconds': seconds}
+
+
+def main(argv=None) -> None:
+    """Prints the memory of the catalog without and with interning."""
+
+    parser = ArgumentParser(description='Memory of a synthetic catalog, with and without '
+                                        'interning.')
+    parser.add_argument('-s', '--size', type=int, default=200000,
+                        help='number of records (default: 200000).')
+    parser.add_argument('-r', '--repeat', type=int, default=5,
+                        help='number of timed runs, of which the best one is kept '
+                             '(default: 5).')
+    parser.add_argument('-o', '--output', help='JSON file to save the results into.')
+    args = parser.parse_args(argv)
+
+    paths = synthetic_paths(args.size)
+
+    results = {'size': args.size, 'plain': _measure(paths, args.repeat)}
+
+    enable_interning()
+    try:
+        results['interning'] = _measure(paths, args.repeat)
+    finally:
+        disable_interning()
+
+    print(f'{args.size:,} records')
+    print(f"{'':>10}{'MiB':>10}{'bytes/record':>14}{'seconds':>10}")
+    for name in ('plain', 'interning'):
+        result = results[name]
+        print(f"{name:>10}{result['bytes'] / 2 ** 20:>10.1f}"
+              f"{result['bytes'] / args.size:>14.1f}{result['seconds']:>10.2f}")
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as file:
+            dump(results, file, indent=2)
+
+
+if __name__ == '__main__':
+    main()
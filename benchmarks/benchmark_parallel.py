@@ -0,0 +1,64 @@
+"""Speedup curve of `decode_paths_parallel` by number of workers.
+
+Run it from the repository root, e.g.:
+
+    $ python -m benchmarks.benchmark_parallel --size 1000000 --workers 1 2 4 8
+"""
+
+from argparse import ArgumentParser
+from json import dump
+from os import cpu_count
+from time import perf_counter
+
+from src.cdsr_pack import decode_paths, decode_paths_parallel
+
+from .fixtures import synthetic_paths
+
+
+def main(argv=None) -> None:
+    """Decodes a synthetic listing sequentially and then with each number of workers,
+    printing the throughput and the speedup over the sequential `decode_paths`."""
+
+    parser = ArgumentParser(description='Speedup curve of `decode_paths_parallel`.')
+    parser.add_argument('-s', '--size', type=int, default=200000,
+                        help='number of paths (default: 200000).')
+    parser.add_argument('-w', '--workers', type=int, nargs='+',
+                        default=sorted({1, 2, 4, cpu_count() or 1}),
+                        help='numbers of workers (default: 1 2 4 and the number of CPUs).')
+    parser.add_argument('-c', '--chunk-size', type=int, default=10000,
+                        help='number of paths per chunk (default: 10000).')
+    parser.add_argument('-o', '--output', help='JSON file to save the results into.')
+    args = parser.parse_args(argv)
+
+    paths = synthetic_paths(args.size)
+
+    start = perf_counter()
+    decode_paths(paths)
+    sequential = perf_counter() - start
+
+    results = [{'workers': 0, 'seconds': sequential, 'paths_per_sec': args.size / sequential,
+                'speedup': 1.0}]
+
+    for workers in args.workers:
+        start = perf_counter()
+        for _ in decode_paths_parallel(paths, workers=workers, chunk_size=args.chunk_size):
+            pass
+        seconds = perf_counter() - start
+
+        results.append({'workers': workers, 'seconds': seconds,
+                        'paths_per_sec': args.size / seconds, 'speedup': sequential / seconds})
+
+    print(f'{args.size:,} paths, {cpu_count()} CPUs, chunks of {args.chunk_size:,} paths')
+    print(f"{'workers':>8}{'seconds':>10}{'paths/sec':>12}{'speedup':>9}")
+    for result in results:
+        # 0 workers stands for the sequential `decode_paths`
+        print(f"{result['workers'] or 'seq.':>8}{result['seconds']:>10.2f}"
+              f"{result['paths_per_sec']:>12,.0f}{result['speedup']:>9.2f}")
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as file:
+            dump(results, file, indent=2)
+
+
+if __name__ == '__main__':
+    main()
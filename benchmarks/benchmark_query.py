@@ -0,0 +1,150 @@
+"""Build time, memory and query latency of the in-memory query engine with a synthetic
+catalog of items, optionally against a linear scan of the same records.
+
+Run it from the repository root, e.g.:
+
+    $ python -m benchmarks.benchmark_query --size 10000000
+"""
+
+from argparse import ArgumentParser
+from datetime import date as Date, timedelta
+from json import dump
+from random import Random
+from resource import RUSAGE_SELF, getrusage
+from statistics import median
+from time import perf_counter
+from typing import Iterator
+
+from src.cdsr_pack import Metadata, QueryEngine, build_collection
+
+
+# satellite, sensor, geo. processing and radio. processing of the synthetic collections
+COLLECTIONS = [
+    ('CBERS4A', 'WFI', '4', 'SR'), ('CBERS4A', 'WFI', '4', 'DN'), ('CBERS4A', 'WFI', '2', 'DN'),
+    ('CBERS4A', 'MUX', '4', 'SR'), ('CBERS4A', 'MUX', '2', 'DN'), ('CBERS4', 'MUX', '4', 'SR'),
+    ('CBERS4', 'AWFI', '4', 'SR'), ('CBERS4', 'PAN5M', '2', 'DN'), ('AMAZONIA1', 'WFI', '4', 'SR'),
+    ('AMAZONIA1', 'WFI', '2B', 'DN'), ('LANDSAT7', 'ETM', '2', 'DN'), ('CBERS2B', 'CCD', '2', 'DN')
+]
+
+# queries of a STAC-like API
+QUERIES = {
+    'latest_path_rows': {'collection': 'CBERS4A_WFI_L4_SR', 'path': 215, 'row': (120, 140),
+                         'limit': 10},
+    'path_row_month': {'path': '215', 'row': '130', 'start_date': '2020-01-01',
+                       'end_date': '2020-01-31'},
+    'collection_month': {'collection': 'CBERS4_MUX_L4_SR', 'start_date': '2020-01-01',
+                         'end_date': '2020-01-31'},
+    'satellite_antenna': {'satellite': 'AMAZONIA1', 'antenna': 'CP5', 'limit': 100},
+    'latest': {'limit': 10},
+    'oldest_rows': {'row': (1, 10), 'order': 'date', 'limit': 100}
+}
+
+
+def synthetic_records(size: int, seed: int = 42) -> Iterator[Metadata]:
+    """Yields `size` decoded assets, whose items are almost all distinct, over ten years."""
+
+    generator = Random(seed)
+    first_day = Date(2012, 1, 1)
+    dates = [(first_day + timedelta(days)).isoformat() for days in range(3653)]
+    numbers = [f'{number:03d}' for number in range(1000)]
+
+    for _ in range(size):
+        satellite, sensor, geo_processing, radio_processing = generator.choice(COLLECTIONS)
+
+        yield Metadata(satellite, sensor, numbers[generator.randint(1, 300)],
+                       numbers[generator.randint(1, 200)], generator.choice(dates),
+                       geo_processing, radio_processing,
+                       generator.choice(('CB11', 'CP5', 'ETC2')))
+
+
+def linear_scan(records: list, limit=None, order='-date', **filters) -> list:
+    """Answers a query by scanning all records, like the API did."""
+
+    def matches(record: Metadata) -> bool:
+        for key, value in filters.items():
+            if key == 'collection':
+                if build_collection(record) != value:
+                    return False
+            elif key in ('path', 'row'):
+                low, high = value if isinstance(value, tuple) else (value, value)
+                if not int(low) <= int(getattr(record, key)) <= int(high):
+                    return False
+            elif key == 'start_date':
+                if record.date < value:
+                    return False
+            elif key == 'end_date':
+                if record.date > value:
+                    return False
+            elif getattr(record, key) != value:
+                return False
+        return True
+
+    return sorted((record for record in records if matches(record)),
+                  key=lambda record: record.date, reverse=order == '-date')[:limit]
+
+
+def _time(function, repeat: int) -> float:
+    """Returns the median time of `repeat` calls, in milliseconds."""
+
+    times = []
+
+    for _ in range(repeat):
+        begin = perf_counter()
+        function()
+        times.append((perf_counter() - begin) * 1000)
+
+    return median(times)
+
+
+def main(argv=None) -> None:
+    """Prints the build time, the memory and the latency of each query."""
+
+    parser = ArgumentParser(description='Build time, memory and query latency of the '
+                                        'in-memory query engine.')
+    parser.add_argument('-s', '--size', type=int, default=10000000,
+                        help='number of assets (default: 10000000).')
+    parser.add_argument('-r', '--repeat', type=int, default=20,
+                        help='number of runs of each query (default: 20).')
+    parser.add_argument('-b', '--baseline', action='store_true',
+                        help='also time a linear scan of the records, which are kept in memory.')
+    parser.add_argument('-o', '--output', help='JSON file to save the results into.')
+    args = parser.parse_args(argv)
+
+    records = list(synthetic_records(args.size)) if args.baseline else None
+
+    begin = perf_counter()
+    engine = QueryEngine(records if args.baseline else synthetic_records(args.size))
+    add_seconds = perf_counter() - begin
+
+    # the indexes are built by the first query
+    begin = perf_counter()
+    engine.items(limit=1)
+    index_seconds = perf_counter() - begin
+
+    results = {'size': args.size, 'items': len(engine), 'add_seconds': add_seconds,
+               'index_seconds': index_seconds,
+               'max_rss_mib': getrusage(RUSAGE_SELF).ru_maxrss / 1024, 'queries': {}}
+
+    print(f'{args.size:,} assets, {len(engine):,} items: added in {add_seconds:.1f} s, '
+          f"indexed in {index_seconds:.1f} s, max. RSS {results['max_rss_mib']:,.0f} MiB")
+    print(f"{'query':>20}{'results':>10}{'engine ms':>12}" +
+          (f"{'scan ms':>12}" if args.baseline else ''))
+
+    for name, query in QUERIES.items():
+        result = {'results': len(engine.items(**query)),
+                  'engine_ms': _time(lambda query=query: engine.items(**query), args.repeat)}
+
+        if args.baseline:
+            result['scan_ms'] = _time(lambda query=query: linear_scan(records, **query), 1)
+
+        results['queries'][name] = result
+        print(f"{name:>20}{result['results']:>10}{result['engine_ms']:>12.3f}" +
+              (f"{result['scan_ms']:>12.1f}" if args.baseline else ''))
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as file:
+            dump(results, file, indent=2)
+
+
+if __name__ == '__main__':
+    main()
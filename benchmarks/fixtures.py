@@ -0,0 +1,106 @@
+"""Paths used by the benchmarks, one set per satellite family found in the test cases."""
+
+from random import Random
+
+
+# valid level 7 paths (i.e. assets), valid level 6 paths and invalid paths by family
+FAMILIES = {
+    'AMAZONIA1': {
+        'asset': ('/TIFF/AMAZONIA1/2021_03/AMAZONIA_1_WFI_DRD_2021_03_03.12_57_40_CB11/'
+                  '217_015_0/2_BC_LCC_WGS84/AMAZONIA_1_WFI_20210303_217_015_L2_BAND4.tif'),
+        'path': ('/TIFF/AMAZONIA1/2021_04/AMAZONIA_1_WFI_DRD_2021_04_01.13_22_45_CP5_COROT/'
+                 '035_016_0/4_BC_LCC_WGS84'),
+        'invalid': ('/TIFF/AMAZONIA1/2021_03/AMAZONIA_1_WFI_DRD_2021_03_03.12_57_40_XYZ/'
+                    '217_015_0/2_BC_LCC_WGS84/AMAZONIA_1_WFI_20210303_217_015_L2_BAND4.tif')
+    },
+    'CBERS2B': {
+        'asset': ('/TIFF/CBERS2B/2010_03/CBERS2B_HRC_20100301.130915/151_B_141_5_0/'
+                  '2_BC_UTM_WGS84/CBERS_2B_HRC_20100301_151_B_141_5_L2_BAND1.tif'),
+        'path': '/TIFF/CBERS2B/2010_03/CBERS2B_CCD_20100301.130915/151_098_0/2_BC_UTM_WGS84',
+        'invalid': ('/TIFF/CBERS2B/2010_03/CBERS2B_CCD_201001.130915/151_098_0/'
+                    '2_BC_UTM_WGS84/CBERS_2B_CCD2XS_20100301_151_098_L2_BAND1.tif')
+    },
+    'CBERS4': {
+        'asset': ('/TIFF/CBERS4/2020_07/CBERS_4_MUX_DRD_2020_07_31.13_07_00_CB11/155_103_0/'
+                  '4_BC_UTM_WGS84/CBERS_4_MUX_20200731_155_103_L4_BAND5_GRID_SURFACE.tif'),
+        'path': '/TIFF/CBERS4/2021_02/CBERS_4_AWFI_DRD_2021_02_01.13_07_00_CB11/154_117_0/'
+                '4_BC_UTM_WGS84',
+        'invalid': ('/TIFF/CBERS4/2021_02/CBERS_4_AWFI_DRD_2021_02_01.13_07_00_CB11/'
+                    'CBERS_4_AWFI_20210201_154_117_L4_BAND13.tif')
+    },
+    'CBERS4A': {
+        'asset': ('/TIFF/CBERS4A/2021_01/CBERS_4A_MUX_RAW_2021_01_01.13_48_30_ETC2/209_110_0/'
+                  '2_BC_UTM_WGS84/CBERS_4A_MUX_20210101_209_110_L2_BAND5.tif'),
+        'path': '/TIFF/CBERS4A/2020_12/CBERS_4A_WFI_RAW_2020_12_22.13_35_00_ETC2/211_108_0/'
+                '2B_BC_UTM_WGS84',
+        'invalid': ('/TIFF/CBERS4A/2021_01/CBERS_4A_MUX_RAW_2021_01_01.13_48_30_ETC2/'
+                    '209_110_0_1/2_BC_UTM_WGS84/CBERS_4A_MUX_20210101_209_110_L2_BAND5.tif')
+    },
+    'LANDSAT1': {
+        'asset': ('/TIFF/LANDSAT1/1973_05/LANDSAT1_MSS_19730521.120000/237_059_0/'
+                  '2_BC_UTM_WGS84/LANDSAT_1_MSS_19730521_237_059_L2_BAND4.tif'),
+        'path': '/TIFF/LANDSAT1/1973_05/LANDSAT1_MSS_19730521.120000/237_059_0/2_BC_UTM_WGS84',
+        'invalid': ('/TIFF/LANDSAT1/1973_05/LANDSAT1_MSS_19730521.120000/237_059_0/'
+                    '2_BC_UTM_WGS84/LANDSAT_1_MSS_1973521_237_059_L2_BAND4.tif')
+    },
+    'LANDSAT2': {
+        'asset': ('/TIFF/LANDSAT2/1982_02/LANDSAT2_MSS_19820201.120000/005_055_0/'
+                  '2_BC_UTM_WGS84/LANDSAT_2_MSS_19820201_005_055_L2_BAND4.xml'),
+        'path': '/TIFF/LANDSAT2/1982_02/LANDSAT2_MSS_19820201.120000/005_055_0/2_BC_UTM_WGS84',
+        'invalid': ('/TIFF/LANDSAT2/1982_02/LANDSAT2_MSS_19820201.1200/005_055_0/'
+                    '2_BC_UTM_WGS84/LANDSAT_2_MSS_19820201_005_055_L2_BAND4.xml')
+    },
+    'LANDSAT3': {
+        'asset': ('/TIFF/LANDSAT3/1978_04/LANDSAT3_MSS_19780405.120000/235_075_0/'
+                  '2_BC_UTM_WGS84/LANDSAT_3_MSS_19780405_235_075_L2_BAND4.tif'),
+        'path': '/TIFF/LANDSAT3/1978_04/LANDSAT3_MSS_19780405.120000/235_075_0/2_BC_UTM_WGS84',
+        'invalid': ('/TIFF/LANDSAT3/1978_04/LANDSAT3_MSS_19780405.120000/235_075_0/'
+                    '8_BC_UTM_WGS84/LANDSAT_3_MSS_19780405_235_075_L8_BAND4.tif')
+    },
+    'LANDSAT5': {
+        'asset': ('/TIFF/LANDSAT5/2011_11/LANDSAT5_TM_20111101.140950/233_054_0/'
+                  '2_BC_UTM_WGS84/LANDSAT_5_TM_20111101_233_054_L2_BAND1.tif'),
+        'path': '/TIFF/LANDSAT5/2011_11/LANDSAT5_TM_20111101.140950/233_054_0/2_BC_UTM_WGS84',
+        'invalid': ('/TIFF/LANDSAT5/2011_11/LANDSAT5_TM_20111101.140950/233_054_0/'
+                    '2_BC_UTM_WGS84/LANDSAT_5_TM_20111101_233_054_L2_BAND1')
+    },
+    'LANDSAT7': {
+        'asset': ('/TIFF/LANDSAT7/1999_07/LANDSAT7_ETM_19990731.144148/004_072_0/'
+                  '2_BC_UTM_WGS84/LANDSAT_7_ETMXS_19990731_004_072_L2_BAND1.tif'),
+        'path': '/TIFF/LANDSAT7/1999_07/LANDSAT7_ETM_19990731.144148/004_072_0/2_BC_UTM_WGS84',
+        'invalid': ('/TIFF/LANDSAT7/1999_07/LANDSAT7_ETM_19990731.144148/004_072_0_1/'
+                    '2_BC_UTM_WGS84/LANDSAT_7_ETMXS_19990731_004_072_L2_BAND1.tif')
+    }
+}
+
+
+# templates of asset paths used to create synthetic listings
+TEMPLATES = (
+    '/TIFF/AMAZONIA1/{Y}_{m}/AMAZONIA_1_WFI_DRD_{Y}_{m}_{d}.12_57_40_CB11/{path}_{row}_0/'
+    '{geo}_BC_LCC_WGS84/AMAZONIA_1_WFI_{Y}{m}{d}_{path}_{row}_L{geo}_BAND{band}.{ext}',
+    '/TIFF/CBERS2B/{Y}_{m}/CBERS2B_CCD_{Y}{m}{d}.130915/{path}_{row}_0/'
+    '{geo}_BC_UTM_WGS84/CBERS_2B_CCD2XS_{Y}{m}{d}_{path}_{row}_L{geo}_BAND{band}.{ext}',
+    '/TIFF/CBERS4/{Y}_{m}/CBERS_4_MUX_DRD_{Y}_{m}_{d}.13_07_00_CB11/{path}_{row}_0/'
+    '{geo}_BC_UTM_WGS84/CBERS_4_MUX_{Y}{m}{d}_{path}_{row}_L{geo}_BAND{band}.{ext}',
+    '/TIFF/CBERS4A/{Y}_{m}/CBERS_4A_WFI_RAW_{Y}_{m}_{d}.13_48_30_ETC2/{path}_{row}_0/'
+    '{geo}_BC_UTM_WGS84/CBERS_4A_WFI_{Y}{m}{d}_{path}_{row}_L{geo}_BAND{band}.{ext}',
+    '/TIFF/LANDSAT5/{Y}_{m}/LANDSAT5_TM_{Y}{m}{d}.140950/{path}_{row}_0/'
+    '{geo}_BC_UTM_WGS84/LANDSAT_5_TM_{Y}{m}{d}_{path}_{row}_L{geo}_BAND{band}.{ext}'
+)
+
+
+def synthetic_paths(size: int, seed: int = 0) -> list:
+    """Returns `size` valid asset paths based on `TEMPLATES`, with random
+    dates, paths, rows, geo. processing levels and bands."""
+
+    randomizer = Random(seed)
+
+    return [
+        randomizer.choice(TEMPLATES).format(
+            Y=randomizer.randint(2000, 2021), m=f'{randomizer.randint(1, 12):02d}',
+            d=f'{randomizer.randint(1, 28):02d}', path=f'{randomizer.randint(1, 250):03d}',
+            row=f'{randomizer.randint(1, 250):03d}', geo=randomizer.choice('234'),
+            band=randomizer.randint(1, 16), ext=randomizer.choice(('tif', 'xml'))
+        )
+        for _ in range(size)
+    ]
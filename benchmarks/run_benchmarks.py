@@ -0,0 +1,122 @@
+"""Micro-benchmarks of the decoder and builder functions.
+
+Run it from the repository root, e.g.:
+
+    $ python -m benchmarks.run_benchmarks --output benchmark.json
+"""
+
+from argparse import ArgumentParser
+from json import dump
+from platform import platform, python_version
+from timeit import Timer
+
+from src.cdsr_pack import CDSRBuilderException, build_collection, build_collections, \
+                          build_item, build_items, decode_path, decode_paths, set_engine
+from src.cdsr_pack.decoder import DECODE_ERRORS, decode_asset, decode_scene_dir
+
+from .fixtures import FAMILIES
+
+
+def _ignore_errors(function, errors):
+    """Returns a function that calls `function` ignoring the expected `errors`,
+    in order to benchmark invalid inputs."""
+
+    def wrapper(argument):
+        try:
+            function(argument)
+        except errors:
+            pass
+
+    return wrapper
+
+
+def _benchmark_cases():
+    """Yields the benchmark cases: (benchmark, family, case, function, argument)."""
+
+    for family, paths in FAMILIES.items():
+        # `asset` is a level 7 path and `path` is a level 6 one
+        yield 'decode_path', family, 'level_7', decode_path, paths['asset']
+        yield 'decode_path', family, 'level_6', decode_path, paths['path']
+        yield 'decode_path', family, 'invalid', \
+            _ignore_errors(decode_path, DECODE_ERRORS), paths['invalid']
+
+        scene_dir, asset = paths['asset'].split('/')[4], paths['asset'].split('/')[-1]
+
+        yield 'decode_scene_dir', family, 'valid', decode_scene_dir, scene_dir
+        yield 'decode_scene_dir', family, 'invalid', \
+            _ignore_errors(decode_scene_dir, DECODE_ERRORS), scene_dir.replace('.', '.X_')
+        yield 'decode_asset', family, 'valid', decode_asset, asset
+        yield 'decode_asset', family, 'invalid', \
+            _ignore_errors(decode_asset, DECODE_ERRORS), asset.split('.')[0]
+
+        metadata = decode_path(paths['asset'])
+        record = decode_path(paths['asset'], record=True)
+        # level 6 paths have not got `date` and `radio_processing`
+        invalid_metadata = decode_path(paths['path'])
+
+        for builder in (build_collection, build_item):
+            yield builder.__name__, family, 'dict', builder, metadata
+            yield builder.__name__, family, 'record', builder, record
+            yield builder.__name__, family, 'invalid', \
+                _ignore_errors(builder, CDSRBuilderException), invalid_metadata
+
+        # the batch builders are timed by call, i.e. to 1000 rows at once
+        columns = decode_paths([paths['asset']] * 1000)
+
+        for batch_builder in (build_collections, build_items):
+            yield batch_builder.__name__, family, 'columns_1000', batch_builder, columns
+
+
+def run_benchmarks(repeat: int = 5, name_filter: str = '') -> list:
+    """Runs the benchmarks, returning their results. Each benchmark runs `repeat`
+    times and the best time is kept, since it is the least disturbed one."""
+
+    results = []
+
+    for benchmark, family, case, function, argument in _benchmark_cases():
+        if name_filter not in f'{benchmark}.{family}.{case}':
+            continue
+
+        timer = Timer(lambda f=function, a=argument: f(a))
+        # get a number of loops that takes at least 0.2 seconds
+        loops, _ = timer.autorange()
+        best = min(timer.repeat(repeat=repeat, number=loops)) / loops
+
+        results.append({
+            'benchmark': benchmark, 'family': family, 'case': case,
+            'ops_per_sec': round(1 / best), 'ns_per_op': round(best * 1e9, 1), 'loops': loops
+        })
+
+    return results
+
+
+def main(argv=None) -> None:
+    """Runs the benchmarks, printing them as a table and saving them as JSON."""
+
+    parser = ArgumentParser(description='Micro-benchmarks of the decoder and builder functions.')
+    parser.add_argument('-o', '--output', help='JSON file to save the results into.')
+    parser.add_argument('-e', '--engine', default='split', choices=('split', 'regex'),
+                        help='decoding engine used by `decode_path` (default: split).')
+    parser.add_argument('-r', '--repeat', type=int, default=5,
+                        help='number of times each benchmark runs (default: 5).')
+    parser.add_argument('-f', '--filter', default='',
+                        help='just run the benchmarks whose `benchmark.family.case` '
+                             'name contains this string.')
+    args = parser.parse_args(argv)
+
+    set_engine(args.engine)
+    results = run_benchmarks(args.repeat, args.filter)
+
+    print(f"{'benchmark':<18}{'family':<11}{'case':<9}{'ops/sec':>12}{'ns/op':>10}")
+    for result in results:
+        print(f"{result['benchmark']:<18}{result['family']:<11}{result['case']:<9}"
+              f"{result['ops_per_sec']:>12,}{result['ns_per_op']:>10,.1f}")
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as file:
+            dump({'python': python_version(), 'platform': platform(), 'engine': args.engine,
+                  'results': results}, file, indent=2)
+
+
+if __name__ == '__main__':
+    main()
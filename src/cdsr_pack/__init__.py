@@ -2,5 +2,64 @@
 
 __version__ = '0.0.3a2'
 
-from .builder import CDSRBuilderException, build_collection, build_item
-from .decoder import CDSRDecoderException, decode_path
+from importlib import import_module
+
+from .builder import CDSRBuilderException, build_collection, build_collections, build_item, \
+                     build_items
+from .decoder import CDSRDecoderException, decode_path, decode_paths, get_engine, set_engine
+from .families import SceneDirLayout, get_layouts, load_layouts, register_layout, \
+                       unregister_layout
+from .metadata import Metadata
+from .tokens import get_antennas, get_sr_markers, set_antennas, set_sr_markers
+from .result_decoder import DecodeErrorCode, DecodeResult, decode_path_result
+
+# register the `regex` decoding engine
+from . import regex_decoder
+
+from .profiling import enable_from_environment
+
+# submodules of the names that are not needed to decode paths, which are just imported
+# when one of their names is used, then `import cdsr_pack` keeps fast to who just decodes
+# paths, without importing e.g. `sqlite3`, `multiprocessing`, `asyncio` and `ctypes`
+_LAZY_NAMES = {
+    'aggregate_collections': 'aggregator',
+    'aggregate_items': 'aggregator',
+    'decode_asset_name': 'aggregator',
+    'CDSREncoderException': 'encoder',
+    'decode_collection_id': 'encoder',
+    'decode_item_id': 'encoder',
+    'encode_dir_prefixes': 'encoder',
+    'encode_scene_dir_prefixes': 'encoder',
+    'find_dirs': 'encoder',
+    'incremental_scan': 'incremental',
+    'scan_changes': 'incremental',
+    'QueryEngine': 'query',
+    'CatalogIndex': 'index',
+    'decode_paths_parallel': 'parallel',
+    'walk_tiff_async': 'async_walker',
+    'walk_tiff': 'walker',
+    'walk_tiff_parallel': 'walker',
+    'TiffWatcher': 'watcher',
+    'WatchEvent': 'watcher'
+}
+
+
+def __getattr__(name: str):
+    """Imports the submodule of a lazy name when it is used for the first time."""
+
+    if name not in _LAZY_NAMES:
+        raise AttributeError(f'module `{__name__}` has no attribute `{name}`')
+
+    value = getattr(import_module(f'.{_LAZY_NAMES[name]}', __name__), name)
+    globals()[name] = value
+
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_NAMES))
+
+
+
+# profile the decoders and builders if `CDSR_PACK_PROFILE` is set
+enable_from_environment()
@@ -0,0 +1,140 @@
+"""aggregator.py module.
+
+Groups assets into items and collections in a single pass over their paths."""
+
+from os.path import basename, dirname, splitext
+from typing import Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+from .builder import build_collection, build_item
+from .decoder import DECODE_ERRORS, CDSRDecoderException, decode_path
+from .metadata import Metadata
+
+
+class AssetName(NamedTuple):
+    """Band and product decoded from an asset file name."""
+
+    # e.g. `BAND5`, or `None` to products without band (e.g. `EVI`) and to scene files
+    band: Optional[str]
+    # e.g. `GRID_SURFACE`, `EVI` and `NDVI`, or `None` to the bands themselves
+    product: Optional[str]
+    # e.g. `tif` and `xml`
+    extension: str
+
+
+class ItemAsset(NamedTuple):
+    """Asset of an item."""
+
+    path: str
+    band: Optional[str]
+    product: Optional[str]
+    extension: str
+
+
+class Item(NamedTuple):
+    """Item with its assets."""
+
+    collection: str
+    item: str
+    # metadata of the first asset of the item
+    metadata: Metadata
+    assets: List[ItemAsset]
+
+
+def decode_asset_name(asset: str) -> AssetName:
+    """Decodes the band and the product from an asset file name, which come after its
+    geo. processing part (e.g. `L4`).
+    Asset examples:
+    - `CBERS_4A_MUX_20210101_209_110_L4_BAND5.tif`: (`BAND5`, `None`, `tif`)
+    - `CBERS_4A_MUX_20210101_209_110_L4_BAND5_GRID_SURFACE.tif`: (`BAND5`, `GRID_SURFACE`, `tif`)
+    - `CBERS_4_MUX_20200731_155_103_L4_EVI.tif`: (`None`, `EVI`, `tif`)
+    - `CBERS_4_PAN10M_20210201_073_113.png`: (`None`, `None`, `png`), since assets without
+      geo. processing part (e.g. quicklooks) do not have band and product"""
+
+    stem, extension = splitext(asset)
+
+    if not extension:
+        raise CDSRDecoderException('An asset must have an extension.')
+
+    parts = stem.split('_')
+
+    # the geo. processing part is the last one like `L2`, `L2B`, `L3` or `L4`
+    index = next((i for i in range(len(parts) - 1, -1, -1)
+                  if parts[i] in ('L2', 'L2B', 'L3', 'L4')), None)
+
+    if index is None:
+        return AssetName(None, None, extension[1:])
+
+    band, *product = parts[index + 1:] or [None]
+
+    if band is not None and not band.startswith('BAND'):
+        band, product = None, [band, *product]
+
+    return AssetName(band, '_'.join(product) or None, extension[1:])
+
+
+def _decode_item_asset(path: str) -> Tuple[Tuple[str, str], Metadata, ItemAsset]:
+    """Decodes an asset path, returning its `(collection, item)` key, its metadata
+    and its asset."""
+
+    metadata = decode_path(path, record=True)
+
+    if metadata.date is None:
+        raise CDSRDecoderException(f'Just assets can be grouped into items, not directories: '
+                                   f'`{path}`.')
+
+    asset_name = decode_asset_name(basename(path))
+
+    return (build_collection(metadata), build_item(metadata)), metadata, \
+        ItemAsset(path, *asset_name)
+
+
+def aggregate_items(paths: Iterable[str], ordered: bool = True,
+                    onerror: Optional[Callable[[Exception], None]] = None) -> Iterator[Item]:
+    """Groups asset paths into items, yielding each item with its assets.
+
+    If `ordered` is True, then paths are expected to be grouped by directory (e.g. the
+    output of `walk_tiff` or of a sorted listing) and the items of a directory are
+    yielded as soon as the directory ends, then memory is bounded by the largest
+    directory. Otherwise, items are just yielded after all paths have been read.
+
+    Paths that cannot be decoded are reported to the `onerror` callback, if it exists."""
+
+    # (collection, item) -> item, in the order they are found
+    items: Dict[Tuple[str, str], Item] = {}
+    current_dir = None
+
+    for path in paths:
+        try:
+            key, metadata, asset = _decode_item_asset(path)
+        except DECODE_ERRORS as error:
+            if onerror is not None:
+                onerror(error)
+            continue
+
+        if ordered:
+            path_dir = dirname(path)
+
+            if path_dir != current_dir:
+                yield from items.values()
+                items.clear()
+                current_dir = path_dir
+
+        item = items.get(key)
+
+        if item is None:
+            items[key] = Item(*key, metadata, [asset])
+        else:
+            item.assets.append(asset)
+
+    yield from items.values()
+
+
+def aggregate_collections(items: Iterable[Item]) -> Dict[str, List[str]]:
+    """Groups items into collections, returning the item names of each collection."""
+
+    collections = {}
+
+    for item in items:
+        collections.setdefault(item.collection, []).append(item.item)
+
+    return collections
@@ -0,0 +1,204 @@
+"""arrays.py module.
+
+Export of decoded metadata to NumPy structured arrays, where filters run vectorized.
+NumPy is an optional dependency: `pip install cdsr_pack[numpy]`."""
+
+from json import dump, load
+from operator import itemgetter
+from os.path import splitext
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple, Union
+
+try:
+    import numpy as np
+except ImportError as import_error:
+    raise ImportError('NumPy is required by `cdsr_pack.arrays`, install it with '
+                      '`pip install cdsr_pack[numpy]`.') from import_error
+
+from .decoder import METADATA_KEYS
+from .metadata import Metadata
+
+
+# dictionary encoded fields, whose values are codes of `CatalogArray.categories`, in the
+# order the values are found
+CATEGORICAL_FIELDS = ('satellite', 'sensor', 'geo_processing', 'radio_processing', 'antenna')
+
+# structured array type. Path and row are ints (e.g. `015` becomes 15) and level 6
+# paths have not got a date (i.e. `NaT`)
+CATALOG_DTYPE = np.dtype([
+    ('satellite', np.uint8), ('sensor', np.uint8), ('path', np.uint16), ('row', np.uint16),
+    ('date', 'datetime64[D]'), ('geo_processing', np.uint8), ('radio_processing', np.uint8),
+    ('antenna', np.uint8)
+])
+
+
+class CatalogArray(NamedTuple):
+    """Decoded metadata as a structured array, with the values of the categorical fields
+    (i.e. the value of code `i` of a field is `categories[field][i]`)."""
+
+    records: np.ndarray
+    categories: Dict[str, List[Optional[str]]]
+
+    def decode(self, index: int) -> Metadata:
+        """Decodes a record back into `Metadata`."""
+
+        record = self.records[index]
+        date = record['date']
+
+        return Metadata(
+            *(self.categories[key][record[key]] for key in ('satellite', 'sensor')),
+            f"{record['path']:03d}", f"{record['row']:03d}",
+            None if np.isnat(date) else str(date),
+            *(self.categories[key][record[key]]
+              for key in ('geo_processing', 'radio_processing', 'antenna'))
+        )
+
+    def filter(self, **filters) -> 'CatalogArray':
+        """Returns the records that match all filters (see `filter_mask`)."""
+
+        return CatalogArray(self.records[filter_mask(self, **filters)], self.categories)
+
+
+def _factorize(column: list) -> Tuple[list, np.ndarray]:
+    """Returns the distinct values of a column, in the order they are found, and the
+    position of each value of the column inside them."""
+
+    positions = {}
+    codes = np.fromiter((positions.setdefault(value, len(positions)) for value in column),
+                        dtype=np.intp, count=len(column))
+
+    return list(positions), codes
+
+
+def columns_to_array(columns: Dict[str, list]) -> CatalogArray:
+    """Converts columnar metadata (e.g. the output of `decode_paths`) to a `CatalogArray`.
+    Rows with errors are skipped, then they must be removed from the paths as well to
+    match the records with their paths by position."""
+
+    errors = columns.get('error')
+
+    if errors is not None and any(error is not None for error in errors):
+        valid = [error is None for error in errors]
+        columns = {key: [value for value, ok in zip(columns[key], valid) if ok]
+                   for key in METADATA_KEYS}
+
+    records = np.empty(len(columns['satellite']), dtype=CATALOG_DTYPE)
+    categories = {}
+
+    for key in CATEGORICAL_FIELDS:
+        # `None` (e.g. `radio_processing` of level 6 paths) is a category as well
+        categories[key], records[key] = _factorize(columns[key])
+
+        if len(categories[key]) > 256:
+            raise ValueError(f'There are more than 256 `{key}` values.')
+
+    # catalogs have got few distinct paths, rows and dates, then each one is converted once
+    for key in ('path', 'row'):
+        uniques, codes = _factorize(columns[key])
+        records[key] = np.array([int(value) for value in uniques], dtype=np.uint16)[codes]
+
+    uniques, codes = _factorize(columns['date'])
+    records['date'] = np.array(uniques, dtype='datetime64[D]')[codes]
+
+    return CatalogArray(records, categories)
+
+
+def to_array(metadata: Iterable[Union[dict, Metadata]]) -> CatalogArray:
+    """Converts decoded metadata (dicts returned by `decode_path` or `Metadata` records)
+    to a `CatalogArray`."""
+
+    # dicts are read by key, since their keys may be in any order (e.g. loaded from JSON)
+    get_values = itemgetter(*METADATA_KEYS)
+    rows = [get_values(value) if isinstance(value, dict) else value for value in metadata]
+
+    if not rows:
+        return columns_to_array({key: [] for key in METADATA_KEYS})
+
+    return columns_to_array(dict(zip(METADATA_KEYS, map(list, zip(*rows)))))
+
+
+def _categories_path(file_path: str) -> str:
+    """Returns the path of the file with the categories of an `.npy` file."""
+
+    return f'{splitext(file_path)[0]}.categories.json'
+
+
+def save_array(file_path: str, catalog: CatalogArray) -> None:
+    """Saves a `CatalogArray` into an `.npy` file, and its categories into a JSON file
+    beside it (e.g. `catalog.npy` and `catalog.categories.json`)."""
+
+    np.save(file_path, catalog.records, allow_pickle=False)
+
+    with open(_categories_path(file_path), 'w', encoding='utf-8') as file:
+        dump(catalog.categories, file)
+
+
+def load_array(file_path: str, mmap: bool = True) -> CatalogArray:
+    """Loads a `CatalogArray` saved by `save_array`. If `mmap` is True, then the records
+    are memory-mapped (read only) instead of being read into memory."""
+
+    records = np.load(file_path, mmap_mode='r' if mmap else None, allow_pickle=False)
+
+    with open(_categories_path(file_path), encoding='utf-8') as file:
+        categories = load(file)
+
+    return CatalogArray(records, categories)
+
+
+def _encode(catalog: CatalogArray, key: str, value):
+    """Encodes a filter value like the records do."""
+
+    if key in CATEGORICAL_FIELDS:
+        # categories that are not inside the catalog match nothing
+        try:
+            return catalog.categories[key].index(value)
+        except ValueError:
+            return -1
+
+    if key == 'date':
+        return np.datetime64(value, 'D')
+
+    return int(value)
+
+
+def _condition_mask(catalog: CatalogArray, key: str, condition) -> np.ndarray:
+    """Returns the mask of the records whose `key` matches a condition: a value, a
+    `(low, high)` tuple (inclusive, just to path, row and date) or a list of values."""
+
+    column = catalog.records[key]
+
+    if isinstance(condition, tuple):
+        low, high = condition
+        return (column >= _encode(catalog, key, low)) & (column <= _encode(catalog, key, high))
+
+    if isinstance(condition, list):
+        return np.isin(column, [_encode(catalog, key, value) for value in condition])
+
+    return column == _encode(catalog, key, condition)
+
+
+def filter_mask(catalog: CatalogArray, **filters) -> np.ndarray:
+    """Returns the boolean mask of the records that match all filters. Each filter is a
+    field with a value, a `(low, high)` tuple (inclusive, just to path, row and date)
+    or a list of values, and
+    `start_date` and `end_date` filter dates as well.
+    Example: `filter_mask(catalog, satellite='CBERS4A', sensor='WFI', row=(100, 130),
+    start_date='2021-01-01', end_date='2021-03-31')`"""
+
+    invalid_filters = [name for name in filters
+                       if name not in METADATA_KEYS + ('start_date', 'end_date')]
+
+    if invalid_filters:
+        raise ValueError(f"Invalid filters: `{', '.join(invalid_filters)}`. Available "
+                         f"filters: `{', '.join(METADATA_KEYS + ('start_date', 'end_date'))}`.")
+
+    mask = np.ones(len(catalog.records), dtype=bool)
+
+    for name, condition in filters.items():
+        if name == 'start_date':
+            mask &= catalog.records['date'] >= np.datetime64(condition, 'D')
+        elif name == 'end_date':
+            mask &= catalog.records['date'] <= np.datetime64(condition, 'D')
+        else:
+            mask &= _condition_mask(catalog, name, condition)
+
+    return mask
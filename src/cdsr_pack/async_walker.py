@@ -0,0 +1,142 @@
+"""async_walker.py module.
+
+asyncio walker of a `/TIFF` tree, for network filesystems (e.g. NFS), where listing a
+directory takes milliseconds and a sequential walk waits on the network most of the
+time. Directories are listed by `os.scandir` inside a thread pool, then many of them
+are in flight at once."""
+
+from asyncio import CancelledError, LifoQueue, Queue, get_running_loop
+from concurrent.futures import ThreadPoolExecutor
+from typing import AsyncIterator, Callable, List, Optional, Tuple
+
+from .decoder import DECODE_ERRORS, decode_asset, decode_geo_processing_dir, \
+                     decode_path_row_dir, decode_scene_dir
+from .walker import _handle_error, _list_entries
+
+
+# depth of each directory below `top`
+_SATELLITE, _MONTH, _SCENE, _PATH_ROW, _GEO_PROCESSING = range(1, 6)
+
+# the end of the walk, put into the results queue
+_DONE = object()
+
+
+def _decode_entry(name: str, depth: int, metadata: dict) -> dict:
+    """Decodes the name of an entry at `depth` below `top`, returning the metadata of its
+    parent directory updated with its own metadata."""
+
+    if depth == _SATELLITE:
+        return {'satellite': name}
+
+    if depth == _MONTH:
+        return metadata
+
+    if depth == _SCENE:
+        _, sensor, *_, antenna = decode_scene_dir(name)
+        return {**metadata, 'sensor': sensor, 'antenna': antenna}
+
+    if depth == _PATH_ROW:
+        path, row = decode_path_row_dir(name)
+        return {**metadata, 'path': path, 'row': row}
+
+    if depth == _GEO_PROCESSING:
+        return {**metadata, 'geo_processing': decode_geo_processing_dir(name)}
+
+    date, radio_processing = decode_asset(name)
+
+    # keys are in the same order as the ones returned by `decode_path`
+    return {
+        'satellite': metadata['satellite'], 'sensor': metadata['sensor'],
+        'path': metadata['path'], 'row': metadata['row'], 'date': date,
+        'geo_processing': metadata['geo_processing'], 'radio_processing': radio_processing,
+        'antenna': metadata['antenna']
+    }
+
+
+async def walk_tiff_async(top: str, concurrency: int = 32,
+                          onerror: Optional[Callable[[Exception], None]] = None
+                          ) -> AsyncIterator[Tuple[str, dict]]:
+    """Walks a `/TIFF` directory tree like `walk_tiff` does, yielding the path and the
+    metadata of each asset, as an async iterator:
+
+        async for path, metadata in walk_tiff_async('/TIFF', concurrency=64):
+            ...
+
+    Up to `concurrency` directories are listed at once, each one by a worker thread.
+    Assets are yielded as soon as their directories are listed, then their order is
+    not the same as the `walk_tiff` one. Errors are reported to the `onerror` callback,
+    inside the event loop thread."""
+
+    if concurrency < 1:
+        raise ValueError(f'Invalid concurrency: `{concurrency}`. It must be at least 1.')
+
+    loop = get_running_loop()
+    executor = ThreadPoolExecutor(max_workers=concurrency)
+
+    # directories to be listed, deepest first, then assets are found early and the queue
+    # keeps small, and the results, which block the workers if the consumer is slow
+    directories = LifoQueue()
+    results = Queue(maxsize=1024)
+
+    async def list_directory(dir_path: str, depth: int, metadata: dict) -> None:
+        errors: List[Exception] = []
+        # assets are files, while the other levels are directories
+        entries = await loop.run_in_executor(executor, _list_entries, dir_path,
+                                             errors.append, depth < _GEO_PROCESSING)
+
+        for error in errors:
+            _handle_error(error, onerror)
+
+        for entry in entries:
+            try:
+                entry_metadata = _decode_entry(entry.name, depth + 1, metadata)
+            except DECODE_ERRORS as error:
+                _handle_error(error, onerror)
+                continue
+
+            if depth < _GEO_PROCESSING:
+                directories.put_nowait((entry.path, depth + 1, entry_metadata))
+            else:
+                await results.put((entry.path, entry_metadata))
+
+    async def worker() -> None:
+        while True:
+            dir_path, depth, metadata = await directories.get()
+
+            try:
+                await list_directory(dir_path, depth, metadata)
+            except CancelledError:  # pylint: disable=try-except-raise
+                # on Python 3.7 it is an `Exception`, then the cancelled worker would keep
+                # waiting for directories and `asyncio.run` would never return
+                raise
+            except Exception as error:  # pylint: disable=broad-except
+                # errors raised by `onerror` are raised by the iterator
+                await results.put(error)
+            finally:
+                directories.task_done()
+
+    async def wait_workers() -> None:
+        await directories.join()
+        await results.put(_DONE)
+
+    directories.put_nowait((top, 0, {}))
+    tasks = [loop.create_task(worker()) for _ in range(concurrency)]
+    tasks.append(loop.create_task(wait_workers()))
+
+    try:
+        while True:
+            result = await results.get()
+
+            if result is _DONE:
+                return
+
+            if isinstance(result, Exception):
+                raise result
+
+            yield result
+    finally:
+        # the walk may be stopped early, by `break` or by an error
+        for task in tasks:
+            task.cancel()
+
+        executor.shutdown(wait=False)
@@ -0,0 +1,194 @@
+"""binary.py module.
+
+Compact fixed-width binary format of decoded metadata. Each record has got 13 bytes:
+satellite, sensor, geo. processing, radio. processing and antenna are dictionary
+encoded into one byte each, path and row are stored as uint16 and the date as the
+number of days since 1970-01-01. The file is memory-mapped by the reader and records
+are just decoded when they are read, then opening a large catalog is instantaneous.
+
+File layout: header (magic, version, number of records and footer offset), records
+and footer (the dictionaries, as JSON)."""
+
+from datetime import date as Date
+from json import dumps, loads
+from mmap import ACCESS_READ, mmap
+from os.path import getsize
+from struct import Struct
+from typing import Dict, Iterable, Iterator, List, Union
+
+from .metadata import Metadata
+
+
+MAGIC = b'CDSRPACK'
+VERSION = 1
+
+# magic, version, number of records and footer offset
+_HEADER = Struct('<8sHQQ')
+# satellite, sensor, path, row, date, geo. processing, radio. processing and antenna
+_RECORD = Struct('<BBHHiBBB')
+
+# dictionary encoded fields, by their position inside a record
+_CATEGORICAL_FIELDS = {0: 'satellite', 1: 'sensor', 5: 'geo_processing',
+                       6: 'radio_processing', 7: 'antenna'}
+
+# days are counted since 1970-01-01 and level 6 paths have not got a date
+_EPOCH = Date(1970, 1, 1).toordinal()
+_NO_DATE = -2 ** 31
+
+# decoded paths and rows, which have got three digits
+_NUMBERS = [f'{number:03d}' for number in range(1000)]
+
+
+class CDSRBinaryException(Exception):
+    """CDSRBinaryException."""
+
+
+def _encode_number(value: str, key: str) -> int:
+    """Encodes a path or row (e.g. `015`) as an int. Just values with three digits are
+    accepted, then they are decoded back without losing their leading zeros."""
+
+    if len(value) != 3 or not value.isdigit():
+        raise CDSRBinaryException(f'Invalid {key} to be stored: `{value}`. It must have '
+                                  'three digits.')
+
+    return int(value)
+
+
+def write_binary(file_path: str, records: Iterable[Union[dict, Metadata]]) -> int:
+    """Writes decoded metadata (dicts or `Metadata` records) into a binary file,
+    returning the number of written records. Records are written in the same order
+    as they are given, then they can be matched with their paths by position."""
+
+    # value -> code, by field
+    codes: Dict[str, Dict] = {field: {} for field in _CATEGORICAL_FIELDS.values()}
+
+    def encode(field: str, value) -> int:
+        field_codes = codes[field]
+        code = field_codes.get(value)
+
+        if code is None:
+            code = field_codes[value] = len(field_codes)
+
+            if code > 255:
+                raise CDSRBinaryException(f'There are more than 256 `{field}` values.')
+
+        return code
+
+    pack = _RECORD.pack
+    count = 0
+
+    with open(file_path, 'wb') as file:
+        # the header is written again at the end, with the number of records
+        file.write(_HEADER.pack(MAGIC, VERSION, 0, 0))
+
+        chunk = []
+
+        for record in records:
+            if isinstance(record, dict):
+                record = Metadata(**record)
+
+            date = _NO_DATE if record.date is None else \
+                Date.fromisoformat(record.date).toordinal() - _EPOCH
+
+            chunk.append(pack(
+                encode('satellite', record.satellite), encode('sensor', record.sensor),
+                _encode_number(record.path, 'path'), _encode_number(record.row, 'row'), date,
+                encode('geo_processing', record.geo_processing),
+                encode('radio_processing', record.radio_processing),
+                encode('antenna', record.antenna)
+            ))
+
+            # records are written by chunk, instead of one by one
+            if len(chunk) == 65536:
+                file.write(b''.join(chunk))
+                count += len(chunk)
+                chunk.clear()
+
+        file.write(b''.join(chunk))
+        count += len(chunk)
+
+        footer_offset = file.tell()
+        # dictionaries are saved as lists, where the code of a value is its position
+        file.write(dumps({field: list(field_codes)
+                          for field, field_codes in codes.items()}).encode('utf-8'))
+
+        file.seek(0)
+        file.write(_HEADER.pack(MAGIC, VERSION, count, footer_offset))
+
+    return count
+
+
+class BinaryReader:
+    """Reads a file written by `write_binary`, memory-mapping it. Records are just
+    decoded when they are read, by index or by iteration."""
+
+    def __init__(self, file_path: str):
+        with open(file_path, 'rb') as file:
+            if getsize(file_path) < _HEADER.size:
+                raise CDSRBinaryException(f'Invalid binary file: `{file_path}`.')
+
+            self._mmap = mmap(file.fileno(), 0, access=ACCESS_READ)
+
+        magic, version, self._count, footer_offset = _HEADER.unpack_from(self._mmap)
+
+        if magic != MAGIC or version != VERSION:
+            self._mmap.close()
+            raise CDSRBinaryException(f'Invalid binary file: `{file_path}`.')
+
+        dictionaries = loads(self._mmap[footer_offset:].decode('utf-8'))
+        self._dictionaries = [dictionaries.get(_CATEGORICAL_FIELDS.get(index))
+                              for index in range(len(Metadata._fields))]
+        # decoded dates, since a catalog has got few distinct ones
+        self._dates: Dict[int, str] = {_NO_DATE: None}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        self.close()
+
+    def close(self) -> None:
+        """Closes the memory-mapped file."""
+
+        self._mmap.close()
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _decode(self, values: tuple) -> Metadata:
+        """Decodes the values of a binary record."""
+
+        satellite, sensor, path, row, day, geo_processing, radio_processing, antenna = values
+        dictionaries = self._dictionaries
+
+        date = self._dates.get(day)
+
+        if date is None and day != _NO_DATE:
+            date = self._dates[day] = Date.fromordinal(day + _EPOCH).isoformat()
+
+        return Metadata(dictionaries[0][satellite], dictionaries[1][sensor], _NUMBERS[path],
+                        _NUMBERS[row], date, dictionaries[5][geo_processing],
+                        dictionaries[6][radio_processing], dictionaries[7][antenna])
+
+    def __getitem__(self, index: int) -> Metadata:
+        if index < 0:
+            index += self._count
+
+        if not 0 <= index < self._count:
+            raise IndexError('Record index out of range.')
+
+        return self._decode(_RECORD.unpack_from(self._mmap, _HEADER.size + index * _RECORD.size))
+
+    def __iter__(self) -> Iterator[Metadata]:
+        end = _HEADER.size + self._count * _RECORD.size
+        chunk_size = 65536 * _RECORD.size
+
+        # records are copied by chunk, then the file can be closed while it is iterated
+        for offset in range(_HEADER.size, end, chunk_size):
+            for values in _RECORD.iter_unpack(self._mmap[offset:min(offset + chunk_size, end)]):
+                yield self._decode(values)
+
+    def read_all(self) -> List[Metadata]:
+        """Decodes all records."""
+
+        return list(self)
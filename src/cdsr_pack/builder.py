@@ -1,12 +1,46 @@
 """builder.py module."""
 
+from typing import Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+from .metadata import Metadata
+
 
 class CDSRBuilderException(Exception):
     """CDSRBuilderException."""
 
 
-def build_collection(metadata: dict) -> str:
-    """Builds collection name based on metadata dict."""
+# collection names by `(satellite, sensor, geo_processing, radio_processing)`, then equal
+# collections share one str. It is `None` when memoization is disabled (see `interning`)
+_collection_ids: Optional[Dict[tuple, str]] = None  # pylint: disable=invalid-name
+
+
+def _memoize_collection(key: tuple) -> str:
+    """Returns the memoized collection name of a key, building it if it is new."""
+
+    collection = _collection_ids.get(key)
+
+    if collection is None:
+        collection = _collection_ids[key] = f'{key[0]}_{key[1]}_L{key[2]}_{key[3]}'
+
+    return collection
+
+
+def build_collection(metadata: Union[dict, Metadata]) -> str:
+    """Builds collection name based on metadata dict or record."""
+
+    # records are built by the decoder, then their types are already right
+    if isinstance(metadata, Metadata):
+        if metadata.radio_processing is None:
+            raise CDSRBuilderException('All mandatory values inside metadata dict must be '
+                                       'strings, but the following keys are not: '
+                                       '`radio_processing`.')
+
+        if _collection_ids is not None:
+            return _memoize_collection((metadata.satellite, metadata.sensor,
+                                        metadata.geo_processing, metadata.radio_processing))
+
+        return f'{metadata.satellite}_{metadata.sensor}_' \
+               f'L{metadata.geo_processing}_{metadata.radio_processing}'
 
     # check metadata type
     if not isinstance(metadata, dict):
@@ -28,12 +62,26 @@ def build_collection(metadata: dict) -> str:
         raise CDSRBuilderException('All mandatory values inside metadata dict must be strings, but '
                                   f"the following keys are not: `{', '.join(not_str_keys)}`.")
 
+    if _collection_ids is not None:
+        return _memoize_collection((metadata['satellite'], metadata['sensor'],
+                                    metadata['geo_processing'], metadata['radio_processing']))
+
     return f"{metadata['satellite']}_{metadata['sensor']}_" \
            f"L{metadata['geo_processing']}_{metadata['radio_processing']}"
 
 
-def build_item(metadata: dict) -> str:
-    """Builds item name based on metadata dict."""
+def build_item(metadata: Union[dict, Metadata]) -> str:
+    """Builds item name based on metadata dict or record."""
+
+    # records are built by the decoder, then their types are already right
+    if isinstance(metadata, Metadata):
+        if metadata.date is None:
+            raise CDSRBuilderException('All mandatory values inside metadata dict must be '
+                                       'strings, but the following keys are not: `date`.')
+
+        return f'{metadata.satellite}_{metadata.sensor}_' \
+               f"{metadata.path}{metadata.row}_{metadata.date.replace('-', '')}_" \
+               f'{metadata.antenna}'
 
     # check metadata type
     if not isinstance(metadata, dict):
@@ -58,3 +106,85 @@ def build_item(metadata: dict) -> str:
     return f"{metadata['satellite']}_{metadata['sensor']}_" \
            f"{metadata['path']}{metadata['row']}_{metadata['date'].replace('-', '')}_" \
            f"{metadata['antenna']}"
+
+
+def _to_list(column: Sequence) -> list:
+    """Converts a column to a list. NumPy arrays are converted by `tolist`, then their
+    values become Python objects (e.g. `numpy.str_` becomes `str`)."""
+
+    if hasattr(column, 'tolist'):
+        return column.tolist()
+
+    return list(column)
+
+
+def _build_ids(columns: Dict[str, Sequence], keys: List[str], template: str,
+               build: Callable) -> Tuple[List[Optional[str]], List[Optional[str]]]:
+    """Builds the IDs of columnar metadata with `template`, validating each column once.
+    If a column has got values that are not strings, then the rows are built one by one
+    with `build`, then their errors are the same ones that `build` raises."""
+
+    # check columns type
+    if not isinstance(columns, dict):
+        raise CDSRBuilderException(f'Metadata must be a dict, not a `{type(columns)}`.')
+
+    # get all keys that are missing inside metadata dict
+    missing_keys = [k for k in keys if k not in columns]
+
+    if missing_keys:
+        raise CDSRBuilderException(f"Missing keys inside metadata: `{', '.join(missing_keys)}`.")
+
+    values = [_to_list(columns[k]) for k in keys]
+    size = len(values[0])
+
+    if any(len(column) != size for column in values):
+        raise CDSRBuilderException('All metadata columns must have the same length.')
+
+    # each column is checked at once, then just the rows of the invalid columns are checked
+    if all(set(map(type, column)) <= {str} for column in values):
+        if build is build_collection and _collection_ids is not None:
+            return list(map(_memoize_collection, zip(*values))), [None] * size
+
+        return list(map(template.format, *values)), [None] * size
+
+    ids = []
+    errors = []
+
+    for row in zip(*values):
+        try:
+            ids.append(build(dict(zip(keys, row))))
+            errors.append(None)
+        except CDSRBuilderException as error:
+            ids.append(None)
+            errors.append(str(error))
+
+    return ids, errors
+
+
+def build_collections(columns: Dict[str, Sequence]) -> Tuple[List[Optional[str]],
+                                                             List[Optional[str]]]:
+    """Builds the collection names of columnar metadata (e.g. the output of `decode_paths`),
+    where each column is a list or a NumPy array.
+    Returns the collection column and the error column. If a collection cannot be built,
+    then it is `None` and its error is the message that `build_collection` would have
+    raised, otherwise its error is `None`."""
+
+    return _build_ids(columns, ['satellite', 'sensor', 'geo_processing', 'radio_processing'],
+                      '{}_{}_L{}_{}', build_collection)
+
+
+def build_items(columns: Dict[str, Sequence]) -> Tuple[List[Optional[str]],
+                                                       List[Optional[str]]]:
+    """Builds the item names of columnar metadata (e.g. the output of `decode_paths`),
+    where each column is a list or a NumPy array.
+    Returns the item column and the error column, like `build_collections` does."""
+
+    columns = dict(columns) if isinstance(columns, dict) else columns
+
+    # dates are built without dashes (e.g. `20210101`)
+    if isinstance(columns, dict) and 'date' in columns:
+        columns['date'] = [date.replace('-', '') if isinstance(date, str) else date
+                           for date in _to_list(columns['date'])]
+
+    return _build_ids(columns, ['satellite', 'sensor', 'path', 'row', 'date', 'antenna'],
+                      '{}_{}_{}{}_{}_{}', build_item)
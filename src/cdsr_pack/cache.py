@@ -0,0 +1,115 @@
+"""cache.py module."""
+
+from collections import OrderedDict
+from typing import Callable, Dict, NamedTuple
+
+from . import decoder
+
+
+# pure decoders that can be cached, since real listings repeat their inputs a lot
+CACHEABLE_FUNCTIONS = ('extract_data_from_scene_dir', 'decode_scene_dir',
+                       'decode_path_row_dir', 'decode_geo_processing_dir')
+
+
+class CacheInfo(NamedTuple):
+    """Statistics of a cached function."""
+
+    hits: int
+    misses: int
+    evictions: int
+    maxsize: int
+    currsize: int
+
+
+class LRUCache:
+    """Bounded LRU cache around a one argument function.
+
+    Just successful calls are cached, then a failed call raises its exception
+    again on every call, exactly like the original function."""
+
+    def __init__(self, function: Callable, maxsize: int):
+        self.function = function
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._results = OrderedDict()
+
+    def __call__(self, argument):
+        results = self._results
+
+        try:
+            result = results[argument]
+        except KeyError:
+            self.misses += 1
+
+            # if the function raises an exception, then nothing is cached
+            result = self.function(argument)
+
+            results[argument] = result
+
+            # if the cache is full, then remove the least recently used result
+            if len(results) > self.maxsize:
+                results.popitem(last=False)
+                self.evictions += 1
+
+            return result
+
+        results.move_to_end(argument)
+        self.hits += 1
+
+        return result
+
+    def cache_info(self) -> CacheInfo:
+        """Returns the cache statistics."""
+
+        return CacheInfo(self.hits, self.misses, self.evictions, self.maxsize, len(self._results))
+
+    def cache_clear(self) -> None:
+        """Removes all cached results and resets the statistics."""
+
+        self._results.clear()
+        self.hits = self.misses = self.evictions = 0
+
+
+# enabled caches by function name
+_caches: Dict[str, LRUCache] = {}
+
+
+def enable_cache(maxsize: int = 4096) -> None:
+    """Caches the results of the pure decoders (i.e. `CACHEABLE_FUNCTIONS`), keeping
+    at most `maxsize` results per function. If the cache is already enabled, then it is
+    recreated with the new size."""
+
+    if not isinstance(maxsize, int) or maxsize < 1:
+        raise ValueError(f'Cache size must be a positive int, not `{maxsize}`.')
+
+    disable_cache()
+
+    for name in CACHEABLE_FUNCTIONS:
+        _caches[name] = LRUCache(getattr(decoder, name), maxsize)
+        setattr(decoder, name, _caches[name])
+
+
+def disable_cache() -> None:
+    """Restores the original decoders, discarding their cached results."""
+
+    for name, cache in _caches.items():
+        setattr(decoder, name, cache.function)
+
+    _caches.clear()
+
+
+def clear_cache() -> None:
+    """Removes all cached results and resets the statistics, keeping the cache enabled.
+    It is useful to clear the cache between runs."""
+
+    for cache in _caches.values():
+        cache.cache_clear()
+
+
+def cache_info() -> Dict[str, CacheInfo]:
+    """Returns the statistics of each cached function. If the cache
+    is disabled, then an empty dict is returned."""
+
+    return {name: cache.cache_info() for name, cache in _caches.items()}
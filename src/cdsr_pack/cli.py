@@ -0,0 +1,166 @@
+"""cli.py module.
+
+`cdsr-pack` command, which decodes paths read from files or from the standard input
+and writes their collection, item and metadata as JSON lines or CSV."""
+
+from argparse import ArgumentParser
+from contextlib import ExitStack
+from csv import writer as csv_writer
+from json import JSONEncoder
+from sys import exit as sys_exit, stderr, stdin, stdout
+from typing import Iterator, List, Optional, TextIO, Tuple
+
+from .builder import CDSRBuilderException, build_collection, build_item
+from .decoder import METADATA_KEYS, decode_paths, set_engine
+from .metadata import Metadata
+from .parallel import _split_into_chunks, decode_paths_parallel
+
+
+# output columns, `source_path` is the decoded path itself
+COLUMNS = ('source_path', 'collection', 'item') + METADATA_KEYS
+DECODE_ONLY_COLUMNS = ('source_path',) + METADATA_KEYS
+
+
+def _read_paths(inputs: List[str]) -> Iterator[str]:
+    """Reads one path per line from the input files, where `-` is the standard
+    input. Empty lines are skipped."""
+
+    for input_path in inputs:
+        if input_path == '-':
+            yield from filter(None, (line.rstrip('\n') for line in stdin))
+            continue
+
+        with open(input_path, encoding='utf-8') as file:
+            yield from filter(None, (line.rstrip('\n') for line in file))
+
+
+def _decode_chunks(paths: Iterator[str], workers: int, chunk_size: int
+                   ) -> Iterator[List[Tuple[str, Optional[Metadata], Optional[str]]]]:
+    """Decodes paths, yielding lists of `(path, record, error)` tuples with at most
+    `chunk_size` paths. If `workers` is greater than zero, then paths are decoded
+    in parallel by that number of processes, otherwise by the main process."""
+
+    if workers > 0:
+        yield from _split_into_chunks(
+            decode_paths_parallel(paths, workers=workers, chunk_size=chunk_size, record=True),
+            chunk_size
+        )
+        return
+
+    for chunk in _split_into_chunks(paths, chunk_size):
+        columns = decode_paths(chunk)
+
+        yield [
+            (path, None if error else Metadata._make(values), error)
+            for path, error, values in zip(chunk, columns['error'],
+                                           zip(*(columns[key] for key in METADATA_KEYS)))
+        ]
+
+
+def _build_ids(record: Metadata) -> Tuple[Optional[str], Optional[str]]:
+    """Builds the collection and item of a record, which cannot be built to
+    paths without asset (i.e. level 6 paths)."""
+
+    try:
+        return build_collection(record), build_item(record)
+    except CDSRBuilderException:
+        return None, None
+
+
+def _create_parser() -> ArgumentParser:
+    """Creates the parser of the command line arguments."""
+
+    parser = ArgumentParser(
+        prog='cdsr-pack',
+        description='Decodes CDSR paths (one per line) and writes their collection, item '
+                    'and metadata as JSON lines or CSV.'
+    )
+    parser.add_argument('inputs', nargs='*', default=['-'], metavar='FILE',
+                        help='files with one path per line. `-` or nothing reads '
+                             'the standard input.')
+    parser.add_argument('-f', '--format', default='jsonl', choices=('jsonl', 'csv'),
+                        help='output format (default: jsonl).')
+    parser.add_argument('-o', '--output', default='-',
+                        help='output file (default: standard output).')
+    parser.add_argument('-e', '--errors', default=None,
+                        help='file to write the paths that cannot be decoded into, with '
+                             'their errors separated by a tab (default: standard error).')
+    parser.add_argument('--ignore-errors', action='store_true',
+                        help='do not write the paths that cannot be decoded.')
+    parser.add_argument('--decode-only', action='store_true',
+                        help='do not build collections and items, just decode paths.')
+    parser.add_argument('-w', '--workers', type=int, default=0,
+                        help='number of processes that decode paths in parallel '
+                             '(default: 0, paths are decoded by the main process).')
+    parser.add_argument('-c', '--chunk-size', type=int, default=10000,
+                        help='number of paths decoded and written at once (default: 10000).')
+    parser.add_argument('--engine', default='regex', choices=('split', 'regex'),
+                        help='decoding engine (default: regex).')
+
+    return parser
+
+
+def _open_output(path: Optional[str], default: TextIO, stack: ExitStack) -> TextIO:
+    """Opens an output file, which is closed by `stack`. If `path` is `-` or `None`,
+    then `default` is returned."""
+
+    if path in (None, '-'):
+        return default
+
+    return stack.enter_context(open(path, 'w', encoding='utf-8', newline=''))
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Runs the `cdsr-pack` command."""
+
+    parser = _create_parser()
+    args = parser.parse_args(argv)
+
+    # a chunk size lower than 1 would decode no path at all
+    if args.chunk_size < 1:
+        parser.error(f'argument -c/--chunk-size: must be at least 1, not {args.chunk_size}')
+
+    if args.workers < 0:
+        parser.error(f'argument -w/--workers: must be at least 0, not {args.workers}')
+
+    set_engine(args.engine)
+
+    columns = DECODE_ONLY_COLUMNS if args.decode_only else COLUMNS
+    encode = JSONEncoder(ensure_ascii=False, separators=(',', ':')).encode
+
+    # output lines are joined by chunk, then there is just one write per chunk
+    with ExitStack() as stack:
+        output = _open_output(args.output, stdout, stack)
+        errors_output = _open_output(args.errors, stderr, stack)
+
+        if args.format == 'csv':
+            writer = csv_writer(output, lineterminator='\n')
+            writer.writerow(columns)
+
+        for chunk in _decode_chunks(_read_paths(args.inputs), args.workers, args.chunk_size):
+            rows = []
+            errors = []
+
+            for path, record, error in chunk:
+                if error is not None:
+                    errors.append(f'{path}\t{error}\n')
+                    continue
+
+                if args.decode_only:
+                    rows.append((path, *record))
+                else:
+                    rows.append((path, *_build_ids(record), *record))
+
+            if args.format == 'csv':
+                writer.writerows(rows)
+            else:
+                output.write(''.join([f'{encode(dict(zip(columns, row)))}\n' for row in rows]))
+
+            if errors and not args.ignore_errors:
+                errors_output.write(''.join(errors))
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys_exit(main())
@@ -1,117 +1,38 @@
 """decoder.py module."""
 
 from os.path import sep as os_path_sep
-from typing import Tuple, Union
+from typing import Dict, Iterable, List, Tuple, Union
 
+from .families import find_parser
+from .metadata import Metadata
+from .tokens import SR_MARKER_MATCHER
 
-class CDSRDecoderException(Exception):
-    """CDSRDecoderException."""
-
-
-def _get_reception_time_from_scene_dir_second(scene_dir_second: str) -> Union[str, None]:
-    """If there is time datum inside `scene_dir_second` string, then return it.
-    Otherwise, return None."""
-
-    # second part of scene dir, it can be: `13_53_00`,
-    # `13_53_00_ETC2`, `14_35_23_CB11_SIR18`, etc.
-    second_part = scene_dir_second.split('_')
-
-    # I need at least three elements to create the time datum
-    if len(second_part) < 3:
-        return None
-
-    # get the first three elements from the list
-    second_part = second_part[0:3]
 
-    # iterate over the list to check if all elements are numbers.
-    # if there is an element that is not a number, then return None
-    for part in second_part:
-        if not part.isdigit():
-            return None
+# metadata keys, in the same order the decoded values are returned by the engines
+METADATA_KEYS = Metadata._fields
 
-    # if all parts are numbers, then join them to create time datum
-    return ':'.join(second_part)
 
+class CDSRDecoderException(Exception):
+    """CDSRDecoderException."""
 
-def _get_antenna_from_scene_dir_second(scene_dir_second: str) -> Union[str, None]:
-    """If there is antenna datum inside `scene_dir_second` string, then return it.
-    Otherwise, return None."""
-
-    valid_antennas = ('CB11', 'CP5', 'ETC2')
-
-    # return antenna datum from scene_dir_second, if it exists
-    for antenna in valid_antennas:
-        if antenna in scene_dir_second:
-            return antenna
 
-    # default value when antenna datum does not exist
-    return None
+# errors raised when a path cannot be decoded. `ValueError` and `IndexError` are raised by
+# malformed paths (e.g. a scene directory without a dot), besides `CDSRDecoderException`
+DECODE_ERRORS = (CDSRDecoderException, ValueError, IndexError)
 
 
 def extract_data_from_scene_dir(scene_dir: str) -> Tuple[str, str, str, str, str]:
-    """Extracts data from a scene directory, returning its data."""
+    """Extracts data from a scene directory, returning its data. The scene directory is
+    parsed by the layout of its satellite family (see `families`)."""
 
     scene_dir_first, scene_dir_second = scene_dir.split('.')
 
-    if scene_dir_first.startswith('AMAZONIA_1') or scene_dir_first.startswith('CBERS_4'):
-        # examples:
-        # - AMAZONIA_1_WFI_DRD_2021_04_01.13_22_45_CP5_COROT
-        # - AMAZONIA_1_WFI_DRD_2021_03_03.12_57_40_CB11
-        # - AMAZONIA_1_WFI_DRD_2021_03_03.14_35_23_CB11_SIR18
-        # - CBERS_4_MUX_DRD_2020_07_31.13_07_00_CB11
-        # - CBERS_4A_MUX_RAW_2019_12_27.13_53_00_ETC2
-        # - CBERS_4A_MUX_RAW_2020_04_06.00_56_20_CP5
-        # - CBERS_4A_MUX_RAW_2019_12_28.14_15_00
-
-        # get the data from the first part of scene dir
-        satellite, number, sensor, _, *reception_date = scene_dir_first.split('_')
-        # create satellite name with its number
-        satellite = satellite + number
-
-        # I need at least three elements to join to create a date
-        if len(reception_date) == 3:
-            reception_date = '-'.join(reception_date)
-        else:
-            # if reception date is invalid, then return None
-            reception_date = None
-
-        reception_time = _get_reception_time_from_scene_dir_second(scene_dir_second)
-
-        antenna = _get_antenna_from_scene_dir_second(scene_dir_second)
-
-    elif scene_dir_first.startswith('CBERS2B') or scene_dir_first.startswith('LANDSAT'):
-        # examples:
-        # - CBERS2B_CCD_20070925.145654
-        # - LANDSAT1_MSS_19750907.130000
-
-        # default value to antenna, because these satellites do
-        # not have antenna datum on their scene directory
-        # `ND` stands for `não determinado`
-        antenna = 'ND'
-
-        satellite, sensor, reception_date = scene_dir_first.split('_')
-        reception_time = scene_dir_second
-
-        if len(reception_date) == 8:
-            # example: a date should be something like this: '20070925'
-            # I build the date string based on the old one (e.g. from '20070925' to '2007-09-25')
-            reception_date = f'{reception_date[0:4]}-{reception_date[4:6]}-{reception_date[6:8]}'
-        else:
-            # if reception date is invalid, then return None
-            reception_date = None
-
-        if len(reception_time) == 6:
-            # example: a time should be something like this: '145654'
-            # I build the time string based on the old one (e.g. from '145654' to '14:56:54')
-            reception_time = f'{reception_time[0:2]}:{reception_time[2:4]}:{reception_time[4:6]}'
-        else:
-            # if reception time is invalid, then return None
-            reception_time = None
+    parse = find_parser(scene_dir_first)
 
-    else:
+    if parse is None:
         raise CDSRDecoderException(f'Invalid scene directory: `{scene_dir}`.')
 
-    return satellite, sensor, reception_date, reception_time, antenna
+    return parse(scene_dir_first, scene_dir_second, True)
 
 
 def decode_scene_dir(scene_dir: str) -> Tuple[str, str, str, str, str]:
@@ -179,18 +100,14 @@ def decode_asset(asset: str) -> Tuple[str, str]:
     # fix date format
     date = f'{date[:4]}-{date[4:6]}-{date[6:8]}'
 
-    if 'GRID_SURFACE' in asset or 'EVI' in asset or 'NDVI' in asset:
+    if SR_MARKER_MATCHER.contains(asset):
         return date, 'SR'
 
     return date, 'DN'
 
 
-def decode_path(path: str) -> dict:
-    """Decodes a path, returning its metadata."""
-
-    # check type
-    if not isinstance(path, str):
-        raise CDSRDecoderException(f'Path must be a str, not a `{type(path)}`.')
+def _decode_path_values(path: str) -> tuple:
+    """Decodes a path, returning its metadata values in the `METADATA_KEYS` order."""
 
     # if path ends with slash, then remove it
     if path.endswith('/'):
@@ -213,21 +130,103 @@ def decode_path(path: str) -> dict:
     if level not in (6, 7):
         raise CDSRDecoderException(f'Invalid `{level}` level to path: `{path}`.')
 
-    # add the metadata based on the directory decode
-    metadata = {
-        # default values
-        'date': None,
-        'radio_processing': None
-    }
-
     # if path is 7 level, then the last position is the file and I can get radio. processing
     if level == 7:
-        metadata['date'], metadata['radio_processing'] = decode_asset(splitted_path[-1])
+        date, radio_processing = decode_asset(splitted_path[-1])
+    else:
+        # default values
+        date, radio_processing = None, None
 
     # extract metadata
-    _, metadata['satellite'], _, scene_dir, path_row_dir, geo_processing_dir, *_ = splitted_path
-    _, metadata['sensor'], *_, metadata['antenna'] = decode_scene_dir(scene_dir)
-    metadata['path'], metadata['row'] = decode_path_row_dir(path_row_dir)
-    metadata['geo_processing'] = decode_geo_processing_dir(geo_processing_dir)
+    _, satellite, _, scene_dir, path_row_dir, geo_processing_dir, *_ = splitted_path
+    _, sensor, *_, antenna = decode_scene_dir(scene_dir)
+    path_row = decode_path_row_dir(path_row_dir)
+    geo_processing = decode_geo_processing_dir(geo_processing_dir)
+
+    return (satellite, sensor, *path_row, date, geo_processing, radio_processing, antenna)
+
+
+# decoding engines by name. Each engine receives a path string and returns its
+# metadata values in the `METADATA_KEYS` order or raises the same errors as the others
+ENGINES = {'split': _decode_path_values}
+
+# engine used by `decode_path` and `decode_paths`
+_engine = _decode_path_values
+
+
+def set_engine(name: str) -> None:
+    """Selects the engine used by `decode_path` and `decode_paths` to decode a path.
+    Available engines: `split` (default) and `regex`."""
+
+    global _engine  # pylint: disable=global-statement,invalid-name
+
+    if name not in ENGINES:
+        raise ValueError(f"Invalid engine: `{name}`. Available engines: `{', '.join(ENGINES)}`.")
+
+    _engine = ENGINES[name]
+
+
+def get_engine() -> str:
+    """Returns the name of the engine used by `decode_path` and `decode_paths`."""
+
+    return next(name for name, engine in ENGINES.items() if engine is _engine)
+
+
+def decode_path(path: str, record: bool = False) -> Union[dict, Metadata]:
+    """Decodes a path, returning its metadata.
+    If `record` is True, then the metadata is returned as a `Metadata` record instead of
+    a dict, which uses less memory and is accepted by the builders as well."""
+
+    # check type
+    if not isinstance(path, str):
+        raise CDSRDecoderException(f'Path must be a str, not a `{type(path)}`.')
+
+    if record:
+        return Metadata._make(_engine(path))
+
+    satellite, sensor, path, row, date, geo_processing, radio_processing, antenna = \
+        _engine(path)
+
+    return {
+        'satellite': satellite, 'sensor': sensor, 'path': path, 'row': row, 'date': date,
+        'geo_processing': geo_processing, 'radio_processing': radio_processing,
+        'antenna': antenna
+    }
+
+
+def decode_paths(paths: Iterable[str]) -> Dict[str, List]:
+    """Decodes several paths at once, returning their metadata by column.
+
+    The result has one list per metadata key plus the `error` list, all of them with
+    one position per path, in the same order as `paths`. If a path cannot be decoded,
+    then its metadata values are `None` and its error is the message that `decode_path`
+    would have raised, otherwise its error is `None`."""
+
+    # one tuple of values per path, that is transposed into columns at the end
+    rows = []
+    errors = []
+
+    invalid_row = (None,) * len(METADATA_KEYS)
+
+    for path in paths:
+        # check type
+        if not isinstance(path, str):
+            rows.append(invalid_row)
+            errors.append(f'Path must be a str, not a `{type(path)}`.')
+            continue
+
+        try:
+            rows.append(_engine(path))
+            errors.append(None)
+        except DECODE_ERRORS as error:
+            rows.append(invalid_row)
+            errors.append(str(error))
+
+    if rows:
+        columns = dict(zip(METADATA_KEYS, map(list, zip(*rows))))
+    else:
+        columns = {key: [] for key in METADATA_KEYS}
+
+    columns['error'] = errors
 
-    return metadata
+    return columns
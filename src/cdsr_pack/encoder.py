@@ -0,0 +1,206 @@
+"""encoder.py module.
+
+Reverse of the decoder: builds the directory prefixes where the assets of a metadata,
+of an item or of a collection are inside a `/TIFF` tree, then they can be found with
+a narrow `os.scandir` instead of a wide glob.
+
+The date of a metadata is the acquisition date of its assets, but scene directories
+are named by their reception date, which is the day after it to passes received after
+midnight (e.g. `CBERS_4A_MUX_RAW_2020_04_23.01_24_22_CP5` has got the assets of
+2020-04-22). Then, scene directories are found by their decoded reception date."""
+
+from datetime import date as Date, timedelta
+from os import scandir
+from os.path import basename, dirname, join
+from typing import Callable, Iterator, List, Union
+
+from .decoder import DECODE_ERRORS, decode_geo_processing_dir, decode_path_row_dir, \
+                     decode_scene_dir
+from .families import encode_scene_dir_prefix
+from .metadata import Metadata
+
+
+class CDSREncoderException(Exception):
+    """CDSREncoderException."""
+
+
+def decode_item_id(item: str) -> dict:
+    """Decodes an item name built by `build_item`, returning its metadata.
+    Item example: `CBERS4A_MUX_209110_20210101_ETC2`"""
+
+    parts = item.split('_')
+
+    if len(parts) != 5 or len(parts[2]) % 2 != 0 or len(parts[3]) != 8:
+        raise CDSREncoderException(f'Invalid item: `{item}`.')
+
+    satellite, sensor, path_row, date, antenna = parts
+    # path and row have got the same number of digits (e.g. `209110`)
+    middle = len(path_row) // 2
+
+    return {
+        'satellite': satellite, 'sensor': sensor, 'path': path_row[:middle],
+        'row': path_row[middle:], 'date': f'{date[:4]}-{date[4:6]}-{date[6:8]}',
+        'antenna': antenna
+    }
+
+
+def decode_collection_id(collection: str) -> dict:
+    """Decodes a collection name built by `build_collection`, returning its metadata.
+    Collection example: `CBERS4A_MUX_L2_DN`"""
+
+    parts = collection.split('_')
+
+    if len(parts) != 4 or not parts[2].startswith('L'):
+        raise CDSREncoderException(f'Invalid collection: `{collection}`.')
+
+    satellite, sensor, geo_processing, radio_processing = parts
+
+    return {
+        'satellite': satellite, 'sensor': sensor, 'geo_processing': geo_processing[1:],
+        'radio_processing': radio_processing
+    }
+
+
+def _to_metadata_dict(metadata: Union[dict, Metadata, str]) -> dict:
+    """Returns a metadata dict from a metadata dict or record, or from an item
+    or a collection name."""
+
+    if isinstance(metadata, Metadata):
+        return metadata.to_dict()
+
+    if isinstance(metadata, dict):
+        return metadata
+
+    if isinstance(metadata, str):
+        # items have got five parts and collections four ones
+        if metadata.count('_') == 4:
+            return decode_item_id(metadata)
+        return decode_collection_id(metadata)
+
+    raise CDSREncoderException('Metadata must be a dict, a `Metadata` record or a str, '
+                               f'not a `{type(metadata)}`.')
+
+
+def encode_scene_dir_prefixes(metadata: Union[dict, Metadata, str]) -> List[str]:
+    """Builds the candidate prefixes of the scene directory names of a metadata dict or
+    record, or of an item or collection name, by the layout of its satellite family.
+    The prefixes end after the sensor, since the next part of the name is free (e.g. `RAW`
+    or `DRD`) and the reception date may be the day after the acquisition one.
+    Examples: `CBERS_4A_MUX_` and `CBERS2B_CCD_`"""
+
+    metadata = _to_metadata_dict(metadata)
+
+    satellite = metadata.get('satellite')
+    sensor = metadata.get('sensor')
+
+    if not isinstance(satellite, str) or not isinstance(sensor, str):
+        raise CDSREncoderException('Satellite and sensor are mandatory to encode a '
+                                   'scene directory.')
+
+    # the prefix is encoded by the layout of the satellite family (see `families`)
+    prefix = encode_scene_dir_prefix(satellite, sensor)
+
+    if prefix is None:
+        raise CDSREncoderException(f'Invalid satellite: `{satellite}`.')
+
+    return [prefix]
+
+
+def _reception_dates(metadata: dict) -> List[str]:
+    """Returns the candidate reception dates of a metadata, i.e. its date and the day
+    after it."""
+
+    date = metadata.get('date')
+
+    if not isinstance(date, str):
+        raise CDSREncoderException('Date is mandatory to encode a directory path.')
+
+    try:
+        next_date = Date.fromisoformat(date) + timedelta(days=1)
+    except ValueError as error:
+        raise CDSREncoderException(f'Invalid date: `{date}`.') from error
+
+    return [date, next_date.isoformat()]
+
+
+def encode_dir_prefixes(metadata: Union[dict, Metadata, str], top: str = '/TIFF') -> List[str]:
+    """Builds the candidate path prefixes of the scene directories of a metadata dict or
+    record, or of an item name. The date is mandatory, since it defines the year_month
+    directory, and the next year_month directory is a candidate as well if the date is
+    the last day of its month. Example: `/TIFF/CBERS4A/2021_01/CBERS_4A_MUX_`"""
+
+    metadata = _to_metadata_dict(metadata)
+    month_dirs = []
+
+    for date in _reception_dates(metadata):
+        month_dir = join(top, metadata['satellite'], date[:7].replace('-', '_'))
+
+        if month_dir not in month_dirs:
+            month_dirs.append(month_dir)
+
+    return [join(month_dir, prefix) for month_dir in month_dirs
+            for prefix in encode_scene_dir_prefixes(metadata)]
+
+
+def _list_dirs(dir_path: str, prefix: str = '') -> List[str]:
+    """Lists the directories inside a directory whose names start with `prefix`.
+    If the directory does not exist, then an empty list is returned."""
+
+    try:
+        with scandir(dir_path) as entries:
+            return sorted(entry.path for entry in entries
+                          if entry.name.startswith(prefix) and entry.is_dir())
+    except FileNotFoundError:
+        return []
+
+
+def _decodes_to(decode: Callable, dir_path: str, expected) -> bool:
+    """Checks if a directory name is decoded to the `expected` value. Directories that
+    cannot be decoded do not match."""
+
+    try:
+        return decode(basename(dir_path)) == expected
+    except DECODE_ERRORS:
+        return False
+
+
+def find_dirs(metadata: Union[dict, Metadata, str], top: str = '/TIFF') -> Iterator[str]:
+    """Finds the directories of a metadata dict or record, or of an item name, inside a
+    `/TIFF` tree. Just the year_month directories and the scene directories received on
+    the date or on the day after it are listed. The deepest directories that the metadata
+    defines are yielded, i.e. the geo. processing ones if `geo_processing` is known,
+    otherwise the path/row ones."""
+
+    metadata = _to_metadata_dict(metadata)
+    path_row = (metadata.get('path'), metadata.get('row'))
+    antenna = metadata.get('antenna')
+    geo_processing = metadata.get('geo_processing')
+    reception_dates = _reception_dates(metadata)
+
+    def matches(scene_dir: str) -> bool:
+        _, scene_dir_sensor, reception_date, _, scene_dir_antenna = decode_scene_dir(scene_dir)
+
+        # the sensor is checked as well, since some prefixes do not end after it
+        return scene_dir_sensor == metadata['sensor'] and reception_date in reception_dates \
+            and antenna in (None, scene_dir_antenna)
+
+    for prefix in encode_dir_prefixes(metadata, top):
+        scene_dirs = [scene_dir for scene_dir in _list_dirs(dirname(prefix), basename(prefix))
+                      if _decodes_to(matches, scene_dir, True)]
+
+        for scene_dir in scene_dirs:
+            path_row_dirs = _list_dirs(scene_dir)
+
+            if None not in path_row:
+                path_row_dirs = [path_row_dir for path_row_dir in path_row_dirs
+                                 if _decodes_to(decode_path_row_dir, path_row_dir, path_row)]
+
+            if geo_processing is None:
+                yield from path_row_dirs
+                continue
+
+            # the geo. processing directory name starts with it (e.g. `2B_BC_UTM_WGS84`)
+            for path_row_dir in path_row_dirs:
+                yield from (geo_dir
+                            for geo_dir in _list_dirs(path_row_dir, f'{geo_processing}_')
+                            if _decodes_to(decode_geo_processing_dir, geo_dir, geo_processing))
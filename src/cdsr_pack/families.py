@@ -0,0 +1,433 @@
+"""families.py module.
+
+Registry of the scene directory layouts of the satellite families. Each layout is a
+`SceneDirLayout` spec, with the prefixes of its scene directories, the fields of the
+part before the dot, their separator, the date and time formats and the antenna.
+Scene directories are dispatched to their layout by a prefix table, instead of a chain
+of `startswith` checks, then new missions are supported by registering their layouts,
+by `register_layout` or by a JSON file set in the `CDSR_PACK_LAYOUTS` environment
+variable, without changing the decoder."""
+
+from json import load
+from operator import itemgetter
+from os import environ
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple, Union
+
+from .tokens import ANTENNA_MATCHER
+
+
+# environment variable with the path of a JSON file of layouts to be registered
+LAYOUTS_ENV = 'CDSR_PACK_LAYOUTS'
+
+
+class SceneDirLayout(NamedTuple):
+    """Layout of the scene directories of a satellite family, such as
+    `CBERS_4A_MUX_RAW_2019_12_27.13_53_00_ETC2`.
+
+    The part before the dot is split by `separator` into `fields`, whose names are
+    `satellite`, `sensor` and `date`. Fields with the same name are joined (e.g.
+    `CBERS` and `4A` become `CBERS4A`), `None` fields are ignored and a last field
+    starting with `*` (e.g. `*date`) takes all remaining parts. The date is decoded
+    with `date_format` and the part after the dot with `time_format` (see `DATE_FORMATS`
+    and `TIME_FORMATS`). If `antenna` is `None`, then it is looked for after the dot.
+
+    `encode_prefixes` are the `(satellite prefix, scene directory prefix)` pairs used to
+    encode a satellite back to its scene directories (e.g. `('CBERS4', 'CBERS_4')`
+    encodes `CBERS4A` to `CBERS_4A`). If they are `None`, then each prefix is paired with
+    itself without separators, which fits the prefixes inside the satellite fields."""
+
+    name: str
+    prefixes: Tuple[str, ...]
+    fields: Tuple[Optional[str], ...]
+    date_format: str
+    time_format: str
+    antenna: Optional[str] = None
+    separator: str = '_'
+    encode_prefixes: Optional[Tuple[Tuple[str, str], ...]] = None
+
+
+def _get_reception_time_from_scene_dir_second(scene_dir_second: str) -> Union[str, None]:
+    """If there is time datum inside `scene_dir_second` string, then return it.
+    Otherwise, return None."""
+
+    # second part of scene dir, it can be: `13_53_00`,
+    # `13_53_00_ETC2`, `14_35_23_CB11_SIR18`, etc.
+    second_part = scene_dir_second.split('_')
+
+    # I need at least three elements to create the time datum
+    if len(second_part) < 3:
+        return None
+
+    # get the first three elements from the list
+    second_part = second_part[0:3]
+
+    # iterate over the list to check if all elements are numbers.
+    # if there is an element that is not a number, then return None
+    for part in second_part:
+        if not part.isdigit():
+            return None
+
+    # if all parts are numbers, then join them to create time datum
+    return ':'.join(second_part)
+
+
+def _get_antenna_from_scene_dir_second(scene_dir_second: str) -> Union[str, None]:
+    """If there is antenna datum inside `scene_dir_second` string, then return it.
+    Otherwise, return None."""
+
+    # return antenna datum from scene_dir_second, if it exists (see `tokens`)
+    return ANTENNA_MATCHER.find(scene_dir_second)
+
+
+def _date_from_parts(date: Union[str, List[str]]) -> Optional[str]:
+    """Decodes a date split into three parts (e.g. `['2019', '12', '27']`)."""
+
+    if isinstance(date, str):
+        date = date.split('_')
+
+    if len(date) == 3:
+        return '-'.join(date)
+
+    return None
+
+
+def _date_from_digits(date: Union[str, List[str]]) -> Optional[str]:
+    """Decodes a date with eight digits (e.g. `20070925`)."""
+
+    if not isinstance(date, str):
+        date = ''.join(date)
+
+    # e.g. from '20070925' to '2007-09-25'
+    if len(date) == 8:
+        return f'{date[0:4]}-{date[4:6]}-{date[6:8]}'
+
+    return None
+
+
+def _time_from_digits(time: str) -> Optional[str]:
+    """Decodes a time with six digits (e.g. `145654`)."""
+
+    # e.g. from '145654' to '14:56:54'
+    if len(time) == 6:
+        return f'{time[0:2]}:{time[2:4]}:{time[4:6]}'
+
+    return None
+
+
+# date decoders by format, which return `None` if the date is invalid
+DATE_FORMATS: Dict[str, Callable] = {'%Y_%m_%d': _date_from_parts, '%Y%m%d': _date_from_digits}
+
+# time decoders by format, which receive the part after the dot and return `None`
+# if the time is invalid
+TIME_FORMATS: Dict[str, Callable] = {'%H_%M_%S': _get_reception_time_from_scene_dir_second,
+                                     '%H%M%S': _time_from_digits}
+
+
+def _too_many_values_message() -> str:
+    """Returns the message of unpacking too many values, with the `{expected}` and `{got}`
+    placeholders. It depends on the Python version, then it is taken from Python itself."""
+
+    try:
+        _, _ = [None] * 3  # pylint: disable=unbalanced-tuple-unpacking
+    except ValueError as error:
+        return str(error).replace('2', '{expected}').replace('3', '{got}')
+
+    return 'too many values to unpack (expected {expected})'
+
+
+_TOO_MANY_VALUES = _too_many_values_message()
+
+
+def _unpack_error(layout: SceneDirLayout, count: int) -> ValueError:
+    """Returns the error of unpacking `count` parts into the fields of a layout, which
+    is the same one that Python raises."""
+
+    if layout.fields[-1] and layout.fields[-1].startswith('*'):
+        return ValueError('not enough values to unpack (expected at least '
+                          f'{len(layout.fields) - 1}, got {count})')
+
+    if count < len(layout.fields):
+        return ValueError(f'not enough values to unpack (expected {len(layout.fields)}, '
+                          f'got {count})')
+
+    return ValueError(_TOO_MANY_VALUES.format(expected=len(layout.fields), got=count))
+
+
+def _compile_layout(layout: SceneDirLayout) -> Callable[[str, str, bool], Optional[tuple]]:
+    """Compiles the parser of a layout, which receives the parts before and after the dot
+    of a scene directory and returns its satellite, sensor, reception date, reception time
+    and antenna. If the fields cannot be unpacked, then it raises a `ValueError`, or it
+    returns `None` if `strict` is False."""
+
+    fields = layout.fields
+    starred = bool(fields[-1]) and fields[-1].startswith('*')
+    count = len(fields) - starred
+
+    # positions of the parts of each field, with the starred field after the others
+    positions = {
+        name: [position for position, field in enumerate(fields[:count]) if field == name]
+        for name in ('satellite', 'sensor', 'date')
+    }
+    date_position = slice(count, None) if starred else positions['date'][0]
+
+    # satellites of one part (e.g. `LANDSAT1`) are not joined
+    get_satellite = itemgetter(*positions['satellite'])
+    join_satellite = len(positions['satellite']) > 1
+    sensor_position = positions['sensor'][0]
+    separator, antenna = layout.separator, layout.antenna
+    decode_date = DATE_FORMATS[layout.date_format]
+    decode_time = TIME_FORMATS[layout.time_format]
+
+    def parse(scene_dir_first: str, scene_dir_second: str, strict: bool) -> Optional[tuple]:
+        parts = scene_dir_first.split(separator)
+
+        if len(parts) < count or (not starred and len(parts) > count):
+            if strict:
+                raise _unpack_error(layout, len(parts))
+
+            return None
+
+        return (
+            ''.join(get_satellite(parts)) if join_satellite else get_satellite(parts),
+            parts[sensor_position],
+            decode_date(parts[date_position]),
+            decode_time(scene_dir_second),
+            antenna or _get_antenna_from_scene_dir_second(scene_dir_second)
+        )
+
+    parse.layout = layout
+
+    return parse
+
+
+# registered layouts by name, their parsers by name and the parsers by prefix, with the
+# distinct prefix lengths from the longest to the shortest one
+_layouts: Dict[str, SceneDirLayout] = {}
+_parsers: Dict[str, Callable[[str, str, bool], Optional[tuple]]] = {}
+_prefix_table: Dict[str, Callable[[str, str, bool], Optional[tuple]]] = {}
+_prefix_lengths: List[int] = []
+
+
+def _to_layout(layout: Union[SceneDirLayout, dict]) -> SceneDirLayout:
+    """Converts a layout dict (e.g. from JSON) to a `SceneDirLayout`, validating it."""
+
+    if isinstance(layout, dict):
+        layout = SceneDirLayout(**{key: tuple(value) if isinstance(value, list) else value
+                                   for key, value in layout.items()})
+
+    layout = layout._replace(prefixes=tuple(layout.prefixes), fields=tuple(layout.fields))
+
+    if not layout.prefixes or not all(layout.prefixes):
+        raise ValueError(f'Layout `{layout.name}` must have at least one prefix.')
+
+    if layout.encode_prefixes is not None:
+        # JSON files have got a dict or lists instead of tuples
+        encode_prefixes = layout.encode_prefixes
+        encode_prefixes = tuple(map(tuple, encode_prefixes.items()
+                                    if isinstance(encode_prefixes, dict) else encode_prefixes))
+
+        if not encode_prefixes or not all(len(pair) == 2 and all(pair) and
+                                          all(isinstance(prefix, str) for prefix in pair)
+                                          for pair in encode_prefixes):
+            raise ValueError(f'Layout `{layout.name}` must have `(satellite prefix, scene '
+                             f'directory prefix)` pairs, not: `{layout.encode_prefixes}`.')
+
+        layout = layout._replace(encode_prefixes=encode_prefixes)
+
+    fields = [field.lstrip('*') if field else field for field in layout.fields]
+
+    if 'satellite' not in fields or fields.count('sensor') != 1 or fields.count('date') != 1:
+        raise ValueError(f'Layout `{layout.name}` must have the `satellite`, `sensor` and '
+                         f'`date` fields, not: `{layout.fields}`.')
+
+    if any(field and field.startswith('*') for field in layout.fields[:-1]) or \
+            layout.fields[-1] not in (None, '*date') and layout.fields[-1].startswith('*'):
+        raise ValueError(f'Just the last field of layout `{layout.name}` can be starred, '
+                         'and just if it is `*date`.')
+
+    if layout.date_format not in DATE_FORMATS:
+        raise ValueError(f"Invalid date format: `{layout.date_format}`. Available date "
+                         f"formats: `{', '.join(DATE_FORMATS)}`.")
+
+    if layout.time_format not in TIME_FORMATS:
+        raise ValueError(f"Invalid time format: `{layout.time_format}`. Available time "
+                         f"formats: `{', '.join(TIME_FORMATS)}`.")
+
+    return layout
+
+
+def _update_prefix_table() -> None:
+    """Rebuilds the prefix table of the registered layouts."""
+
+    _prefix_table.clear()
+
+    for layout in _layouts.values():
+        for prefix in layout.prefixes:
+            _prefix_table[prefix] = _parsers[layout.name]
+
+    _prefix_lengths[:] = sorted({len(prefix) for prefix in _prefix_table}, reverse=True)
+
+
+def register_layout(layout: Union[SceneDirLayout, dict], replace: bool = False
+                    ) -> SceneDirLayout:
+    """Registers the layout of a satellite family (a `SceneDirLayout` or a dict with its
+    fields), returning it. A layout with the same name or prefixes as a registered one
+    is just registered if `replace` is True, and then it replaces the other one.
+    Scene directories are dispatched to the layout with their longest prefix."""
+
+    layout = _to_layout(layout)
+
+    conflicts = {other.name for other in _layouts.values() if other.name != layout.name and
+                 set(other.prefixes) & set(layout.prefixes)}
+
+    if not replace and (layout.name in _layouts or conflicts):
+        raise ValueError(f'Layout `{layout.name}` conflicts with the registered layouts: '
+                         f"`{', '.join(sorted(conflicts | ({layout.name} & _layouts.keys())))}`.")
+
+    for name in conflicts:
+        unregister_layout(name)
+
+    parser = _compile_layout(layout)
+    _layouts[layout.name] = layout
+    _parsers[layout.name] = parser
+    _update_prefix_table()
+
+    return layout
+
+
+def unregister_layout(name: str) -> None:
+    """Unregisters the layout of a satellite family by its name."""
+
+    if name not in _layouts:
+        raise ValueError(f"Invalid layout: `{name}`. Available layouts: "
+                         f"`{', '.join(_layouts)}`.")
+
+    del _layouts[name]
+    del _parsers[name]
+    _update_prefix_table()
+
+
+def get_layouts() -> List[SceneDirLayout]:
+    """Returns the registered layouts, in the order they have been registered."""
+
+    return list(_layouts.values())
+
+
+def find_parser(scene_dir_first: str) -> Optional[Callable[[str, str, bool], Optional[tuple]]]:
+    """Returns the parser of the layout of the part before the dot of a scene directory,
+    by its longest registered prefix, or `None` if there is not any layout to it. The
+    parser is called like `parse_scene_dir`, without the layout, which is its `layout`
+    attribute."""
+
+    # each prefix length is looked up once, whatever the number of layouts is
+    for length in _prefix_lengths:
+        parser = _prefix_table.get(scene_dir_first[:length])
+
+        if parser is not None:
+            return parser
+
+    return None
+
+
+def find_layout(scene_dir_first: str) -> Optional[SceneDirLayout]:
+    """Returns the layout of the part before the dot of a scene directory, by its
+    longest registered prefix, or `None` if there is not any layout to it."""
+
+    parser = find_parser(scene_dir_first)
+
+    return None if parser is None else parser.layout
+
+
+def parse_scene_dir(layout: SceneDirLayout, scene_dir_first: str, scene_dir_second: str,
+                    strict: bool = True) -> Optional[Tuple[str, str, Optional[str],
+                                                           Optional[str], Optional[str]]]:
+    """Parses the parts before and after the dot of a scene directory with a registered
+    layout, returning its satellite, sensor, reception date, reception time and antenna.
+    Invalid dates, times and antennas are `None`. If the fields cannot be unpacked, then
+    the same `ValueError` as unpacking them raises is raised, or `None` is returned if
+    `strict` is False."""
+
+    return _parsers[layout.name](scene_dir_first, scene_dir_second, strict)
+
+
+def _get_encode_prefixes(layout: SceneDirLayout) -> Tuple[Tuple[str, str], ...]:
+    """Returns the `(satellite prefix, scene directory prefix)` pairs of a layout."""
+
+    if layout.encode_prefixes is not None:
+        return layout.encode_prefixes
+
+    return tuple((prefix.replace(layout.separator, ''), prefix) for prefix in layout.prefixes)
+
+
+def encode_scene_dir_prefix(satellite: str, sensor: str) -> Optional[str]:
+    """Returns the prefix of the scene directories of a satellite and a sensor, by the
+    registered layout with the longest satellite prefix of `satellite`, or `None` if there
+    is not any layout to it. The prefix ends after the sensor if the fields start with
+    the satellite ones followed by the sensor (e.g. `CBERS_4A_MUX_` to `CBERS4A`), after
+    the satellite if they start with the satellite ones, and else it is the scene
+    directory prefix itself."""
+
+    found = None
+    found_length = -1
+
+    for layout in _layouts.values():
+        for satellite_prefix, scene_dir_prefix in _get_encode_prefixes(layout):
+            if satellite.startswith(satellite_prefix) and len(satellite_prefix) > found_length:
+                found = layout, satellite_prefix, scene_dir_prefix
+                found_length = len(satellite_prefix)
+
+    if found is None:
+        return None
+
+    layout, satellite_prefix, scene_dir_prefix = found
+    separator, fields = layout.separator, layout.fields
+
+    if fields[0] != 'satellite':
+        return scene_dir_prefix
+
+    # the rest of the satellite (e.g. `A` of `CBERS4A`) follows the scene directory prefix
+    prefix = f'{scene_dir_prefix}{satellite[len(satellite_prefix):]}{separator}'
+    satellite_count = next(index for index, field in enumerate(fields)
+                           if field != 'satellite')
+
+    if fields[satellite_count] == 'sensor':
+        return f'{prefix}{sensor}{separator}'
+
+    return prefix
+
+
+def load_layouts(file_path: str, replace: bool = False) -> List[SceneDirLayout]:
+    """Registers the layouts of a JSON file, which has got a list of layout dicts, e.g.
+    `[{"name": "SENTINEL2", "prefixes": ["SENTINEL_2"], "fields": ["satellite",
+    "satellite", "sensor", "date"], "date_format": "%Y%m%d", "time_format": "%H%M%S",
+    "antenna": "ND"}]`."""
+
+    with open(file_path, encoding='utf-8') as file:
+        layouts = load(file)
+
+    return [register_layout(layout, replace=replace) for layout in layouts]
+
+
+# built-in layouts, e.g.:
+# - AMAZONIA_1_WFI_DRD_2021_04_01.13_22_45_CP5_COROT
+# - AMAZONIA_1_WFI_DRD_2021_03_03.14_35_23_CB11_SIR18
+# - CBERS_4_MUX_DRD_2020_07_31.13_07_00_CB11
+# - CBERS_4A_MUX_RAW_2019_12_28.14_15_00
+AMAZONIA1_CBERS4_LAYOUT = SceneDirLayout(
+    'AMAZONIA1_CBERS4', ('AMAZONIA_1', 'CBERS_4'),
+    ('satellite', 'satellite', 'sensor', None, '*date'), '%Y_%m_%d', '%H_%M_%S'
+)
+# - CBERS2B_CCD_20070925.145654
+# - LANDSAT1_MSS_19750907.130000
+# these satellites do not have antenna datum on their scene directory, then their
+# antenna is `ND`, which stands for `não determinado`
+CBERS2B_LANDSAT_LAYOUT = SceneDirLayout(
+    'CBERS2B_LANDSAT', ('CBERS2B', 'LANDSAT'), ('satellite', 'sensor', 'date'), '%Y%m%d',
+    '%H%M%S', antenna='ND'
+)
+
+register_layout(AMAZONIA1_CBERS4_LAYOUT)
+register_layout(CBERS2B_LANDSAT_LAYOUT)
+
+if environ.get(LAYOUTS_ENV):
+    load_layouts(environ[LAYOUTS_ENV])
@@ -0,0 +1,171 @@
+"""incremental.py module."""
+
+from json import dump, load
+from os import replace, scandir, stat
+from os.path import exists, join
+from time import time_ns
+from typing import List, NamedTuple, Tuple
+
+
+# directory levels below `/TIFF`: satellite (1), year_month (2), scene (3), path/row (4)
+# and geo. processing (5), which is the one that has got the assets
+GEO_PROCESSING_LEVEL = 5
+
+# directories modified less than this number of nanoseconds before the scan are listed
+# again in the next scan, since a file may have been added in the same mtime tick
+MTIME_GRANULARITY_NS = 2 * 10 ** 9
+
+MANIFEST_VERSION = 1
+
+
+class ScanResult(NamedTuple):
+    """Result of an incremental scan."""
+
+    # paths of the assets added and removed since the last scan
+    added: List[str]
+    removed: List[str]
+    # number of directories that were listed and that were not listed, since
+    # they did not change since the last scan
+    listed_dirs: int
+    skipped_dirs: int
+
+
+def _join_names(names: List[str]) -> str:
+    """Joins directory entry names with a slash, which cannot be inside a name.
+    A single string is a lot faster to save and load than a list of names."""
+
+    return '/'.join(sorted(names))
+
+
+def _split_names(names: str) -> List[str]:
+    """Splits names joined by `_join_names`."""
+
+    return names.split('/') if names else []
+
+
+class _Scanner:  # pylint: disable=too-many-instance-attributes
+    """Compares a `/TIFF` tree with the manifest of the last scan."""
+
+    def __init__(self, top: str, old_dirs: dict):
+        self.top = top
+        self.old_dirs = old_dirs
+        self.new_dirs = {}
+        self.added = []
+        self.removed = []
+        self.listed_dirs = 0
+        self.skipped_dirs = 0
+        self.recent_mtime_ns = time_ns() - MTIME_GRANULARITY_NS
+
+    def scan(self, relative_path: str, level: int) -> None:
+        """Scans a directory and its subdirectories. Its entries are just listed
+        if its mtime has changed since the last scan."""
+
+        dir_path = join(self.top, relative_path) if relative_path else self.top
+
+        try:
+            dir_stat = stat(dir_path)
+        except FileNotFoundError:
+            # a missing `/TIFF` (e.g. an unmounted file system) is not a removed tree
+            if level == 0:
+                raise
+
+            self.remove(relative_path, level)
+            return
+
+        old_entry = self.old_dirs.get(relative_path)
+        mtime_ns = dir_stat.st_mtime_ns
+
+        if old_entry is not None and old_entry[0] == mtime_ns and \
+                old_entry[1] == dir_stat.st_nlink:
+            names = old_entry[3]
+            self.skipped_dirs += 1
+        else:
+            with scandir(dir_path) as entries:
+                if level == GEO_PROCESSING_LEVEL:
+                    names = _join_names([entry.name for entry in entries if entry.is_file()])
+                else:
+                    names = _join_names([entry.name for entry in entries if entry.is_dir()])
+
+            self.listed_dirs += 1
+
+        # if the directory has just been modified, then its mtime cannot be trusted
+        if mtime_ns > self.recent_mtime_ns:
+            mtime_ns = None
+
+        new_names = _split_names(names)
+        self.new_dirs[relative_path] = [mtime_ns, dir_stat.st_nlink, len(new_names), names]
+
+        old_names = _split_names(old_entry[3]) if old_entry is not None else []
+
+        if level == GEO_PROCESSING_LEVEL:
+            if old_entry is None or names != old_entry[3]:
+                self.added.extend(join(dir_path, name)
+                                  for name in sorted(set(new_names) - set(old_names)))
+                self.removed.extend(join(dir_path, name)
+                                    for name in sorted(set(old_names) - set(new_names)))
+            return
+
+        for name in new_names:
+            self.scan(join(relative_path, name) if relative_path else name, level + 1)
+
+        for name in sorted(set(old_names) - set(new_names)):
+            self.remove(join(relative_path, name) if relative_path else name, level + 1)
+
+    def remove(self, relative_path: str, level: int) -> None:
+        """Reports all assets of a directory that does not exist anymore as removed."""
+
+        old_entry = self.old_dirs.get(relative_path)
+
+        if old_entry is None:
+            return
+
+        for name in _split_names(old_entry[3]):
+            if level == GEO_PROCESSING_LEVEL:
+                self.removed.append(join(self.top, relative_path, name))
+            else:
+                self.remove(join(relative_path, name), level + 1)
+
+
+def scan_changes(top: str, manifest: dict) -> Tuple[ScanResult, dict]:
+    """Scans a `/TIFF` tree comparing it with the `manifest` of the last scan (an empty
+    dict in the first scan), returning the added and removed assets and the new manifest.
+
+    The manifest keeps the mtime, the number of links and the entry names of each
+    satellite, year_month, scene, path/row and geo. processing directory. A directory is
+    just listed again if its mtime has changed, otherwise its entries come from the
+    manifest. Since the mtime of a directory just changes when its own entries change,
+    its subdirectories are still checked, but with a `stat` call instead of a listing."""
+
+    old_dirs = manifest.get('dirs', {}) if manifest.get('top') == top else {}
+
+    scanner = _Scanner(top, old_dirs)
+    scanner.scan('', 0)
+
+    result = ScanResult(scanner.added, scanner.removed,
+                        scanner.listed_dirs, scanner.skipped_dirs)
+
+    return result, {'version': MANIFEST_VERSION, 'top': top, 'dirs': scanner.new_dirs}
+
+
+def incremental_scan(top: str, manifest_path: str) -> ScanResult:
+    """Scans a `/TIFF` tree like `scan_changes` does, loading the manifest of the last
+    scan from `manifest_path` (if it exists) and saving the new one into it."""
+
+    manifest = {}
+
+    if exists(manifest_path):
+        with open(manifest_path, encoding='utf-8') as file:
+            manifest = load(file)
+
+        if manifest.get('version') != MANIFEST_VERSION:
+            manifest = {}
+
+    result, manifest = scan_changes(top, manifest)
+
+    # write a temporary file first, then the manifest is never saved by half
+    with open(f'{manifest_path}.tmp', 'w', encoding='utf-8') as file:
+        dump(manifest, file, separators=(',', ':'))
+
+    replace(f'{manifest_path}.tmp', manifest_path)
+
+    return result
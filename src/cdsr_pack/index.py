@@ -0,0 +1,174 @@
+"""index.py module."""
+
+from itertools import islice
+from sqlite3 import connect
+from typing import Iterable, List, Optional, Tuple
+
+from .builder import build_collection, build_item
+from .decoder import METADATA_KEYS, decode_paths
+from .metadata import Metadata
+
+
+_SCHEMA = '''
+CREATE TABLE IF NOT EXISTS asset (
+    asset_path TEXT PRIMARY KEY,
+    collection TEXT NOT NULL,
+    item TEXT NOT NULL,
+    satellite TEXT NOT NULL,
+    sensor TEXT NOT NULL,
+    "path" TEXT NOT NULL,
+    "row" TEXT NOT NULL,
+    date TEXT NOT NULL,
+    geo_processing TEXT NOT NULL,
+    radio_processing TEXT NOT NULL,
+    antenna TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS asset_collection_item ON asset (collection, item);
+CREATE INDEX IF NOT EXISTS asset_item ON asset (item);
+CREATE INDEX IF NOT EXISTS asset_satellite_sensor_date ON asset (satellite, sensor, date);
+CREATE INDEX IF NOT EXISTS asset_date ON asset (date);
+CREATE INDEX IF NOT EXISTS asset_path_row ON asset ("path", "row");
+'''
+
+_INSERT = f'INSERT OR REPLACE INTO asset VALUES ({", ".join("?" * (len(METADATA_KEYS) + 3))})'
+
+# filters accepted by the queries and their conditions
+_FILTERS = {
+    'collection': 'collection = ?',
+    'item': 'item = ?',
+    'satellite': 'satellite = ?',
+    'sensor': 'sensor = ?',
+    'path': '"path" = ?',
+    'row': '"row" = ?',
+    'geo_processing': 'geo_processing = ?',
+    'radio_processing': 'radio_processing = ?',
+    'antenna': 'antenna = ?',
+    'start_date': 'date >= ?',
+    'end_date': 'date <= ?'
+}
+
+
+class CatalogIndex:
+    """Persistent SQLite index of decoded assets, with their collections and items.
+
+    Assets are indexed once and then looked up by collection, item, satellite, sensor,
+    date and path/row through the database indexes, instead of walking `/TIFF` again.
+    Just assets (i.e. level 7 paths) are indexed, since collections and items cannot be
+    built to directories."""
+
+    def __init__(self, database: str = ':memory:'):
+        self.connection = connect(database)
+
+        if database != ':memory:':
+            # faster writes, without losing the database if the process is killed
+            self.connection.execute('PRAGMA journal_mode = WAL')
+            self.connection.execute('PRAGMA synchronous = NORMAL')
+
+        self.connection.executescript(_SCHEMA)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        self.close()
+
+    def close(self) -> None:
+        """Closes the database."""
+
+        self.connection.close()
+
+    def add_paths(self, paths: Iterable[str], batch_size: int = 10000
+                  ) -> Tuple[int, List[Tuple[str, str]]]:
+        """Decodes and indexes paths, inserting `batch_size` assets per transaction.
+        Paths that are already indexed are replaced.
+        Returns the number of indexed assets and the `(path, error)` tuples of the paths
+        that cannot be indexed."""
+
+        if not isinstance(batch_size, int) or batch_size < 1:
+            raise ValueError(f'Batch size must be a positive int, not `{batch_size}`.')
+
+        paths = iter(paths)
+        count = 0
+        errors = []
+
+        while True:
+            batch = list(islice(paths, batch_size))
+
+            if not batch:
+                return count, errors
+
+            columns = decode_paths(batch)
+            rows = []
+
+            for path, error, values in zip(batch, columns['error'],
+                                           zip(*(columns[key] for key in METADATA_KEYS))):
+                if error is not None:
+                    errors.append((path, error))
+                    continue
+
+                record = Metadata._make(values)
+
+                if record.date is None:
+                    errors.append((path, 'Just assets can be indexed, not directories.'))
+                    continue
+
+                rows.append((path, build_collection(record), build_item(record), *record))
+
+            with self.connection:
+                self.connection.executemany(_INSERT, rows)
+
+            count += len(rows)
+
+    def remove_paths(self, paths: Iterable[str]) -> None:
+        """Removes assets from the index."""
+
+        with self.connection:
+            self.connection.executemany('DELETE FROM asset WHERE asset_path = ?',
+                                        ((path,) for path in paths))
+
+    def _select(self, columns: str, filters: dict, order_by: str,
+                limit: Optional[int] = None) -> List:
+        """Selects distinct columns of the assets that match all filters."""
+
+        invalid_filters = [name for name in filters if name not in _FILTERS]
+
+        if invalid_filters:
+            raise ValueError(f"Invalid filters: `{', '.join(invalid_filters)}`. Available "
+                             f"filters: `{', '.join(_FILTERS)}`.")
+
+        query = f'SELECT DISTINCT {columns} FROM asset'
+        parameters = list(filters.values())
+
+        if filters:
+            query += ' WHERE ' + ' AND '.join(_FILTERS[name] for name in filters)
+
+        query += f' ORDER BY {order_by}'
+
+        if limit is not None:
+            query += ' LIMIT ?'
+            parameters.append(limit)
+
+        return self.connection.execute(query, parameters).fetchall()
+
+    def collections(self, **filters) -> List[str]:
+        """Returns the collections of the assets that match all filters."""
+
+        return [row[0] for row in self._select('collection', filters, 'collection')]
+
+    def items(self, limit: Optional[int] = None, **filters) -> List[Tuple[str, str]]:
+        """Returns the `(collection, item)` tuples of the assets that match all
+        filters, from the newest to the oldest one.
+        Filters: collection, item, satellite, sensor, path, row, geo_processing,
+        radio_processing, antenna, start_date and end_date (e.g. `2021-01-31`)."""
+
+        # an item has just one date, then it can be used to sort distinct items
+        return self._select('collection, item', filters, 'date DESC, collection, item', limit)
+
+    def assets(self, limit: Optional[int] = None, **filters) -> List[str]:
+        """Returns the paths of the assets that match all filters, in
+        alphabetical order. Filters are the same ones of `items`."""
+
+        return [row[0] for row in self._select('asset_path', filters, 'asset_path', limit)]
+
+    def __len__(self) -> int:
+        return self.connection.execute('SELECT COUNT(*) FROM asset').fetchone()[0]
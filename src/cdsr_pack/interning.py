@@ -0,0 +1,96 @@
+"""interning.py module.
+
+Interning of the low-cardinality metadata values and memoization of the collection
+names. Large catalogs repeat the same few satellites, sensors, antennas, etc. millions
+of times, then sharing one str per value saves a lot of memory."""
+
+from typing import Callable, Dict, Iterable
+
+from . import builder, decoder
+
+
+# metadata values interned by default, which have got a low cardinality
+INTERNED_FIELDS = ('satellite', 'sensor', 'path', 'row', 'geo_processing',
+                   'radio_processing', 'antenna')
+
+# original engines by name, while interning is enabled
+_original_engines: Dict[str, Callable] = {}
+
+
+class _Pool(dict):
+    """Pool of the values of one field, which returns the first equal value it got."""
+
+    def __missing__(self, value):
+        self[value] = value
+        return value
+
+
+class _Keep(dict):
+    """Empty pool of a field that is not interned, which returns the values it gets."""
+
+    def __missing__(self, value):
+        return value
+
+
+def _interning_engine(engine: Callable, pools: tuple) -> Callable:
+    """Returns an engine that replaces each value of `engine` by the equal value of the
+    pool of its field, building the tuple directly."""
+
+    # a hit is just a dict lookup, without a list copy nor `sys.intern` per value,
+    # and `None` values (e.g. `date` to level 6 paths) are pooled as any other value
+    satellite_pool, sensor_pool, path_pool, row_pool, date_pool, geo_processing_pool, \
+        radio_processing_pool, antenna_pool = (pool.__getitem__ for pool in pools)
+
+    def interning_engine(path: str) -> tuple:
+        satellite, sensor, path_, row, date, geo_processing, radio_processing, antenna = \
+            engine(path)
+
+        return (satellite_pool(satellite), sensor_pool(sensor), path_pool(path_),
+                row_pool(row), date_pool(date), geo_processing_pool(geo_processing),
+                radio_processing_pool(radio_processing), antenna_pool(antenna))
+
+    return interning_engine
+
+
+def enable_interning(fields: Iterable[str] = INTERNED_FIELDS,
+                     memoize_collections: bool = True) -> None:
+    """Interns the `fields` of the decoded metadata, then equal values share one str,
+    and memoizes the collection names built by `build_collection` and `build_collections`
+    by their `(satellite, sensor, geo_processing, radio_processing)` key.
+    If interning is already enabled, then it is enabled again with the new options."""
+
+    fields = tuple(fields)
+    invalid_fields = [field for field in fields if field not in decoder.METADATA_KEYS]
+
+    if invalid_fields:
+        raise ValueError(f"Invalid fields: `{', '.join(invalid_fields)}`. Available fields: "
+                         f"`{', '.join(decoder.METADATA_KEYS)}`.")
+
+    disable_interning()
+
+    # one pool per field, shared by all engines
+    pools = tuple(_Pool() if key in fields else _Keep() for key in decoder.METADATA_KEYS)
+
+    for name, engine in decoder.ENGINES.items():
+        _original_engines[name] = engine
+        decoder.ENGINES[name] = _interning_engine(engine, pools)
+
+        # the selected engine is replaced as well
+        if decoder._engine is engine:  # pylint: disable=protected-access
+            decoder._engine = decoder.ENGINES[name]  # pylint: disable=protected-access
+
+    if memoize_collections:
+        builder._collection_ids = {}  # pylint: disable=protected-access
+
+
+def disable_interning() -> None:
+    """Restores the original engines and discards the memoized collection names."""
+
+    for name, engine in _original_engines.items():
+        if decoder._engine is decoder.ENGINES[name]:  # pylint: disable=protected-access
+            decoder._engine = engine  # pylint: disable=protected-access
+
+        decoder.ENGINES[name] = engine
+
+    _original_engines.clear()
+    builder._collection_ids = None  # pylint: disable=protected-access
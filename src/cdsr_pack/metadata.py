@@ -0,0 +1,28 @@
+"""metadata.py module."""
+
+from typing import NamedTuple, Optional
+
+
+class Metadata(NamedTuple):
+    """Compact and immutable metadata record returned by `decode_path(path, record=True)`.
+
+    Its values come from the decoder, then all of them are strings, except for `date` and
+    `radio_processing` that are `None` to paths without asset (i.e. level 6 paths)."""
+
+    satellite: str
+    sensor: str
+    path: str
+    row: str
+    date: Optional[str]
+    geo_processing: str
+    radio_processing: Optional[str]
+    antenna: str
+
+    def to_dict(self) -> dict:
+        """Returns the metadata as a dict, like `decode_path` does by default."""
+
+        return {
+            'satellite': self.satellite, 'sensor': self.sensor, 'path': self.path,
+            'row': self.row, 'date': self.date, 'geo_processing': self.geo_processing,
+            'radio_processing': self.radio_processing, 'antenna': self.antenna
+        }
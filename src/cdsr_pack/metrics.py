@@ -0,0 +1,320 @@
+"""metrics.py module.
+
+Counters of decoded paths and built IDs, rendered in the Prometheus text format:
+- `cdsr_pack_decoded_paths_total`, by satellite, sensor and geo. processing;
+- `cdsr_pack_decode_errors_total`, by satellite and error kind (i.e. the lowercase
+  `DecodeErrorCode` name, e.g. `invalid_antenna` or `asset_without_extension`, or
+  `invalid_type` to paths that are not str);
+- `cdsr_pack_builds_total`, by builder and outcome (`success` or `failure`), where the
+  rows of `build_collections` and `build_items` are counted as `build_collection` and
+  `build_item`.
+
+While metrics are enabled, the engines and builders are swapped by counting variants,
+like `profiling` does, then the return values and errors of `decode_path` do not change.
+Each thread counts into its own dict, then counting does not take any lock. Paths
+decoded by other processes (e.g. `decode_paths_parallel`) are not counted."""
+
+from os import replace
+from threading import Lock, local
+from typing import Callable, Dict, List, Optional, Tuple
+
+from . import builder, decoder
+from .decoder import DECODE_ERRORS
+from .profiling import _restore, _swap
+from .result_decoder import decode_path_result
+
+
+# name, help and label names of each metric
+METRICS = {
+    'cdsr_pack_decoded_paths_total': ('Paths decoded successfully.',
+                                      ('satellite', 'sensor', 'geo_processing')),
+    'cdsr_pack_decode_errors_total': ('Paths that cannot be decoded.', ('satellite', 'kind')),
+    'cdsr_pack_builds_total': ('Collections and items built.', ('builder', 'outcome'))
+}
+
+_DECODED, _ERRORS, _BUILDS = METRICS
+
+# counted builders and the batch builders of their IDs, whose rows are counted as well
+COUNTED_BUILDERS = ('build_collection', 'build_item')
+COUNTED_BATCH_BUILDERS = {'build_collections': 'build_collection', 'build_items': 'build_item'}
+
+
+def _escape(value: Optional[str]) -> str:
+    """Escapes a label value like the Prometheus text format expects."""
+
+    if value is None:
+        return ''
+
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _error_labels(path) -> Tuple[str, str]:
+    """Returns the satellite and the error kind of a path that cannot be decoded. Paths
+    rarely fail, then they are checked again by `decode_path_result` to find the kind."""
+
+    if not isinstance(path, str):
+        return '', 'invalid_type'
+
+    parts = path[path.find('TIFF'):].split('/')
+    satellite = parts[1] if len(parts) > 1 else ''
+    result = decode_path_result(path)
+
+    return satellite, 'unknown' if result.ok else result.code.name.lower()
+
+
+class MetricsRegistry:
+    """Counters of the metrics, by their labels."""
+
+    def __init__(self):
+        self._lock = Lock()
+        # one dict per thread, with the counters by `(metric, *label values)`
+        self._shards: List[Dict[tuple, int]] = []
+        self._local = local()
+
+    def counters(self) -> Dict[tuple, int]:
+        """Returns the counters of the current thread, creating them if they are new."""
+
+        counters = self._local.__dict__.get('counters')
+
+        if counters is None:
+            counters = self._local.counters = {}
+
+            with self._lock:
+                self._shards.append(counters)
+
+        return counters
+
+    def increment(self, key: tuple, amount: int = 1) -> None:
+        """Increments the counter of `(metric, *label values)` by `amount`."""
+
+        counters = self.counters()
+        counters[key] = counters.get(key, 0) + amount
+
+    def snapshot(self) -> Dict[tuple, int]:
+        """Returns the sum of the counters of all threads."""
+
+        with self._lock:
+            shards = list(self._shards)
+
+        totals: Dict[tuple, int] = {}
+
+        for shard in shards:
+            # the dict is copied at once, since its thread may be changing it
+            for key, count in dict(shard).items():
+                totals[key] = totals.get(key, 0) + count
+
+        return totals
+
+    def reset(self) -> None:
+        """Resets all counters."""
+
+        with self._lock:
+            for shard in self._shards:
+                shard.clear()
+
+    def render(self) -> str:
+        """Renders the counters in the Prometheus text format."""
+
+        totals = self.snapshot()
+        lines = []
+
+        for metric, (description, labels) in METRICS.items():
+            lines.append(f'# HELP {metric} {description}')
+            lines.append(f'# TYPE {metric} counter')
+
+            for key in sorted((key for key in totals if key[0] == metric),
+                              key=lambda key: tuple(map(_escape, key))):
+                label_values = ','.join(f'{label}="{_escape(value)}"'
+                                        for label, value in zip(labels, key[1:]))
+                lines.append(f'{metric}{{{label_values}}} {totals[key]}')
+
+        return '\n'.join(lines) + '\n'
+
+    def write(self, file_path: str) -> None:
+        """Writes the counters in the Prometheus text format into a file (e.g. for the
+        textfile collector of the node exporter). The file is replaced at once, then
+        it is never read half written."""
+
+        temp_path = f'{file_path}.tmp'
+
+        with open(temp_path, 'w', encoding='utf-8') as file:
+            file.write(self.render())
+
+        replace(temp_path, file_path)
+
+
+def _counting_engine(registry: MetricsRegistry, engine: Callable) -> Callable:
+    """Returns a variant of `engine` that counts the decoded paths and the errors."""
+
+    counters = registry.counters
+    registry_local = registry._local  # pylint: disable=protected-access
+
+    def counting_engine(path: str) -> tuple:
+        try:
+            values = engine(path)
+        except DECODE_ERRORS:
+            registry.increment((_ERRORS, *_error_labels(path)))
+            raise
+
+        # the counters of the thread are looked up directly, since it is the hot path
+        thread_counters = registry_local.__dict__.get('counters') or counters()
+        key = (_DECODED, values[0], values[1], values[5])
+        thread_counters[key] = thread_counters.get(key, 0) + 1
+
+        return values
+
+    return counting_engine
+
+
+def _counting_builder(registry: MetricsRegistry, build: Callable, name: str) -> Callable:
+    """Returns a variant of `build` that counts the built IDs and the errors."""
+
+    success, failure = (_BUILDS, name, 'success'), (_BUILDS, name, 'failure')
+    registry_local = registry._local  # pylint: disable=protected-access
+
+    def counting_builder(metadata):
+        # the rows built one by one by a batch builder are counted by the batch builder
+        if registry_local.__dict__.get('batch'):
+            return build(metadata)
+
+        try:
+            built = build(metadata)
+        except builder.CDSRBuilderException:
+            registry.increment(failure)
+            raise
+
+        registry.increment(success)
+
+        return built
+
+    counting_builder.__wrapped__ = build
+    counting_builder.__name__ = name
+    counting_builder.__doc__ = build.__doc__
+
+    return counting_builder
+
+
+def _counting_batch_builder(registry: MetricsRegistry, build: Callable, name: str,
+                            row_name: str) -> Callable:
+    """Returns a variant of the batch builder `build` that counts the built IDs and the
+    errors of its rows, like `row_name` does, whether they are built at once or one by
+    one. Columns that are invalid as a whole (e.g. a missing key) are not counted."""
+
+    success, failure = (_BUILDS, row_name, 'success'), (_BUILDS, row_name, 'failure')
+    registry_local = registry._local  # pylint: disable=protected-access
+
+    def counting_batch_builder(columns):
+        batch = registry_local.__dict__.get('batch', False)
+        registry_local.batch = True
+
+        try:
+            ids, errors = build(columns)
+        finally:
+            registry_local.batch = batch
+
+        failures = len(errors) - errors.count(None)
+
+        if failures:
+            registry.increment(failure, failures)
+
+        if len(errors) > failures:
+            registry.increment(success, len(errors) - failures)
+
+        return ids, errors
+
+    counting_batch_builder.__wrapped__ = build
+    counting_batch_builder.__name__ = name
+    counting_batch_builder.__doc__ = build.__doc__
+
+    return counting_batch_builder
+
+
+def _counting_decoders(registry: MetricsRegistry) -> Tuple[Callable, Callable]:
+    """Returns variants of `decode_path` and `decode_paths` that count the paths that are
+    not str, which are rejected before any engine is called."""
+
+    decode_path, decode_paths = decoder.decode_path, decoder.decode_paths
+    invalid_type = (_ERRORS, '', 'invalid_type')
+    message = 'Path must be a str, not a '
+
+    def counting_decode_path(path, record=False):
+        if not isinstance(path, str):
+            registry.increment(invalid_type)
+
+        return decode_path(path, record=record)
+
+    def counting_decode_paths(paths):
+        columns = decode_paths(paths)
+
+        # paths rarely fail, then just the errors are checked
+        for error in filter(None, columns['error']):
+            if error.startswith(message):
+                registry.increment(invalid_type)
+
+        return columns
+
+    for counting, original in ((counting_decode_path, decode_path),
+                               (counting_decode_paths, decode_paths)):
+        counting.__wrapped__ = original
+        counting.__name__ = original.__name__
+        counting.__doc__ = original.__doc__
+
+    return counting_decode_path, counting_decode_paths
+
+
+# enabled registry and the swaps to be restored
+_registry: Optional[MetricsRegistry] = None  # pylint: disable=invalid-name
+_swaps: List[tuple] = []
+
+
+def enable_metrics() -> MetricsRegistry:
+    """Swaps the engines and builders by their counting variants, returning the registry
+    with their counters. If metrics are already enabled, then their registry is returned.
+    Enable it after `enable_cache` and `enable_interning`, and disable it before them."""
+
+    global _registry  # pylint: disable=global-statement,invalid-name
+
+    if _registry is not None:
+        return _registry
+
+    registry = MetricsRegistry()
+
+    # engines are just swapped inside `ENGINES` and as the selected engine, like
+    # `interning` does, since the `regex` engine calls the `split` one for some paths,
+    # which would be counted twice
+    for name, engine in decoder.ENGINES.items():
+        decoder.ENGINES[name] = _counting_engine(registry, engine)
+        _swaps.append((decoder.ENGINES, name, engine))
+
+        if decoder._engine is engine:  # pylint: disable=protected-access
+            decoder._engine = decoder.ENGINES[name]  # pylint: disable=protected-access
+            _swaps.append((decoder, '_engine', engine))
+
+    # paths that are not str are rejected by `decode_path` and `decode_paths` themselves
+    for original, counting in zip((decoder.decode_path, decoder.decode_paths),
+                                  _counting_decoders(registry)):
+        _swap(original, counting, _swaps)
+
+    for name in COUNTED_BUILDERS:
+        build = getattr(builder, name)
+        _swap(build, _counting_builder(registry, build, name), _swaps)
+
+    for name, row_name in COUNTED_BATCH_BUILDERS.items():
+        build = getattr(builder, name)
+        _swap(build, _counting_batch_builder(registry, build, name, row_name), _swaps)
+
+    _registry = registry
+
+    return registry
+
+
+def disable_metrics() -> None:
+    """Restores the original engines and builders. The registry keeps its counters."""
+
+    global _registry  # pylint: disable=global-statement,invalid-name
+
+    if _registry is None:
+        return
+
+    _restore(_swaps)
+    _registry = None
@@ -0,0 +1,172 @@
+"""parallel.py module."""
+
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from itertools import islice
+from os import cpu_count
+from multiprocessing.context import BaseContext
+from sys import version_info
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from .cache import cache_info, disable_cache, enable_cache
+from .decoder import METADATA_KEYS, decode_paths, get_engine, set_engine
+from .families import get_layouts, register_layout, unregister_layout
+from .metadata import Metadata
+from .tokens import get_antennas, get_sr_markers, set_antennas, set_sr_markers
+
+
+def _get_worker_config() -> Dict[str, Any]:
+    """Returns the decoding configuration of the main process: the engine, the registered
+    layouts, the antennas, the SR markers and the cache size (`None` if it is disabled)."""
+
+    caches = cache_info()
+
+    return {
+        'engine': get_engine(),
+        'layouts': get_layouts(),
+        'antennas': get_antennas(),
+        'sr_markers': get_sr_markers(),
+        'cache_size': next(iter(caches.values())).maxsize if caches else None
+    }
+
+
+def _configure_worker(config: Dict[str, Any]) -> None:
+    """Sets the decoding configuration of the main process inside a worker process.
+    Workers started by `spawn` or `forkserver` do not inherit it, then it is always set."""
+
+    for layout in get_layouts():
+        unregister_layout(layout.name)
+
+    for layout in config['layouts']:
+        register_layout(layout)
+
+    set_antennas(config['antennas'])
+    set_sr_markers(config['sr_markers'])
+
+    if config['cache_size'] is None:
+        disable_cache()
+    else:
+        enable_cache(config['cache_size'])
+
+    set_engine(config['engine'])
+
+
+def _decode_chunk(paths: List[str]) -> Dict[str, List]:
+    """Decodes a chunk of paths inside a worker process, with the same
+    configuration as the main process."""
+
+    columns = decode_paths(paths)
+
+    # equal values share the same object, then they are pickled just once when the
+    # columns are sent back to the main process, which is a lot faster
+    unique_values = {}
+
+    for key in METADATA_KEYS:
+        columns[key] = [unique_values.setdefault(value, value) for value in columns[key]]
+
+    return columns
+
+
+def _split_into_chunks(paths: Iterable[str], chunk_size: int) -> Iterator[List[str]]:
+    """Splits paths into lists of `chunk_size` paths, without loading all of them at once."""
+
+    paths = iter(paths)
+
+    while True:
+        chunk = list(islice(paths, chunk_size))
+
+        if not chunk:
+            return
+
+        yield chunk
+
+
+def _iter_chunk_results(chunk: List[str], columns: Dict[str, List], record: bool
+                        ) -> Iterator[Tuple[str, Union[dict, Metadata, None], Optional[str]]]:
+    """Converts the columns of a decoded chunk into one result per path."""
+
+    for path, error, values in zip(chunk, columns['error'],
+                                   zip(*(columns[key] for key in METADATA_KEYS))):
+        if error is not None:
+            yield path, None, error
+        elif record:
+            yield path, Metadata._make(values), None
+        else:
+            yield path, dict(zip(METADATA_KEYS, values)), None
+
+
+def decode_paths_parallel(  # pylint: disable=too-many-arguments
+        paths: Iterable[str], workers: Optional[int] = None, chunk_size: int = 10000,
+        ordered: bool = True, record: bool = False, *, mp_context: Optional[BaseContext] = None
+) -> Iterator[Tuple[str, Union[dict, Metadata, None], Optional[str]]]:
+    """Decodes paths in parallel with a pool of `workers` processes (default: number
+    of CPUs), yielding one `(path, metadata, error)` tuple per path.
+
+    Paths are sent to the workers in chunks of `chunk_size` paths and just a few
+    chunks are in flight at once, then `paths` may be a huge iterator (e.g. a file).
+    If `ordered` is True, then results are yielded in the same order as `paths`,
+    otherwise they are yielded as soon as their chunk is decoded.
+    If a path cannot be decoded, then its metadata is `None` and its error is the message
+    that `decode_path` would have raised, otherwise its error is `None`. If `record` is
+    True, then metadata is a `Metadata` record instead of a dict.
+    Workers decode paths with the engine, registered layouts, antennas, SR markers and
+    cache size of the main process, whatever the start method of `mp_context` (default:
+    the `multiprocessing` default) is. Interning, metrics and profiling are not applied
+    to the paths decoded by the workers."""
+
+    if not isinstance(chunk_size, int) or chunk_size < 1:
+        raise ValueError(f'Chunk size must be a positive int, not `{chunk_size}`.')
+
+    workers = workers or cpu_count() or 1
+    # keep the workers busy while the main process handles the results of a chunk
+    max_pending_chunks = workers * 2
+
+    with ProcessPoolExecutor(max_workers=workers, mp_context=mp_context,
+                             initializer=_configure_worker,
+                             initargs=(_get_worker_config(),)) as executor:
+        chunks = _split_into_chunks(paths, chunk_size)
+        queue = deque()
+        pending = {}
+
+        try:
+            if ordered:
+                for chunk in chunks:
+                    queue.append((chunk, executor.submit(_decode_chunk, chunk)))
+
+                    if len(queue) >= max_pending_chunks:
+                        chunk, future = queue.popleft()
+                        yield from _iter_chunk_results(chunk, future.result(), record)
+
+                for chunk, future in queue:
+                    yield from _iter_chunk_results(chunk, future.result(), record)
+
+                return
+
+            for chunk in chunks:
+                pending[executor.submit(_decode_chunk, chunk)] = chunk
+
+                if len(pending) >= max_pending_chunks:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+
+                    for future in done:
+                        yield from _iter_chunk_results(pending.pop(future), future.result(),
+                                                       record)
+
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+
+                for future in done:
+                    yield from _iter_chunk_results(pending.pop(future), future.result(),
+                                                   record)
+        except GeneratorExit:
+            # if the results are closed early (e.g. by a `break`), then the chunks that are
+            # not queued to the workers yet are cancelled and the pool is shut down without
+            # waiting for the queued ones, which the workers decode before they exit. Before
+            # Python 3.9, `shutdown(wait=False)` may break the pool, then it waits for them
+            for future in [future for _, future in queue] + list(pending):
+                future.cancel()
+
+            if version_info >= (3, 9):
+                executor.shutdown(wait=False)
+
+            raise
@@ -0,0 +1,256 @@
+"""profiling.py module.
+
+Per-stage profile of the decoders and builders: number of calls, failed calls and
+cumulative and self nanoseconds of each function. While profiling is enabled, the
+functions are swapped by instrumented variants inside all `cdsr_pack` modules, like
+`cache` does, and the originals are restored when it is disabled, then profiling
+costs nothing while it is off.
+
+Profiling is enabled by `enable_profiling`, by the `profile` context manager or by the
+`CDSR_PACK_PROFILE` environment variable, which prints the profile table to the standard
+error when the program exits."""
+
+from atexit import register
+from contextlib import contextmanager
+from importlib import import_module
+from os import environ
+from sys import modules, stderr
+from threading import Lock, local
+from time import perf_counter_ns
+from typing import Callable, Dict, Iterator, List, NamedTuple, Optional
+
+from . import builder, decoder
+
+
+# environment variable that enables profiling when `cdsr_pack` is imported
+PROFILE_ENV = 'CDSR_PACK_PROFILE'
+
+# profiled functions by module. Engines are profiled as well, as `engine:<name>`, and
+# the self time of the `split` engine is the time spent splitting the path
+PROFILED_FUNCTIONS = {
+    decoder: ('decode_path', 'decode_paths', 'decode_scene_dir', 'decode_path_row_dir',
+              'decode_geo_processing_dir', 'decode_asset'),
+    builder: ('build_collection', 'build_item', 'build_collections', 'build_items')
+}
+
+
+class StageStats(NamedTuple):
+    """Profile of a function: calls, calls that raised an exception, cumulative and self
+    (i.e. without the profiled functions it calls) nanoseconds and the cumulative
+    nanoseconds of the calls that raised an exception."""
+
+    stage: str
+    calls: int
+    errors: int
+    total_ns: int
+    self_ns: int
+    error_ns: int
+
+
+class Profile:
+    """Statistics collected by the instrumented functions, by stage."""
+
+    def __init__(self):
+        self._lock = Lock()
+        # [calls, errors, total_ns, self_ns, error_ns] by stage
+        self._stats: Dict[str, List[int]] = {}
+
+    def record(self, stage: str, total_ns: int, self_ns: int, failed: bool) -> None:
+        """Records a call of `stage`."""
+
+        with self._lock:
+            stats = self._stats.setdefault(stage, [0, 0, 0, 0, 0])
+            stats[0] += 1
+            stats[2] += total_ns
+            stats[3] += self_ns
+
+            if failed:
+                stats[1] += 1
+                stats[4] += total_ns
+
+    def stats(self) -> List[StageStats]:
+        """Returns the statistics of each stage, from the highest to the lowest self time."""
+
+        with self._lock:
+            stats = [StageStats(stage, *values) for stage, values in self._stats.items()]
+
+        return sorted(stats, key=lambda stage_stats: stage_stats.self_ns, reverse=True)
+
+    def reset(self) -> None:
+        """Discards the collected statistics."""
+
+        with self._lock:
+            self._stats.clear()
+
+    def table(self) -> str:
+        """Returns the flat profile table, from the highest to the lowest self time."""
+
+        stats = self.stats()
+        total_self_ns = sum(stage_stats.self_ns for stage_stats in stats) or 1
+
+        lines = [f"{'stage':<28}{'calls':>10}{'errors':>8}{'total ms':>11}{'self ms':>10}"
+                 f"{'self %':>8}{'ns/call':>9}{'error ms':>10}"]
+
+        for stage, calls, errors, total_ns, self_ns, error_ns in stats:
+            lines.append(f'{stage:<28}{calls:>10}{errors:>8}{total_ns / 1e6:>11.1f}'
+                         f'{self_ns / 1e6:>10.1f}{self_ns / total_self_ns * 100:>8.1f}'
+                         f'{total_ns // calls:>9}{error_ns / 1e6:>10.1f}')
+
+        return '\n'.join(lines)
+
+
+# nanoseconds spent by the profiled functions called by the current one, by thread
+_frames = local()
+
+
+def _instrument(profile_: 'Profile', function: Callable, stage: str) -> Callable:
+    """Returns a variant of `function` that records its calls as `stage`."""
+
+    def instrumented(*args, **kwargs):
+        stack = _frames.__dict__.setdefault('stack', [0])
+        stack.append(0)
+        failed = True
+        start = perf_counter_ns()
+
+        try:
+            result = function(*args, **kwargs)
+            failed = False
+            return result
+        finally:
+            elapsed = perf_counter_ns() - start
+            children = stack.pop()
+            stack[-1] += elapsed
+            profile_.record(stage, elapsed, elapsed - children, failed)
+
+    instrumented.__wrapped__ = function
+    instrumented.__name__ = getattr(function, '__name__', stage)
+    instrumented.__doc__ = function.__doc__
+
+    return instrumented
+
+
+# enabled profile and the `(module, name, original)` swaps to be restored
+_profile: Optional[Profile] = None  # pylint: disable=invalid-name
+_swaps: List[tuple] = []
+
+
+def _package_modules() -> list:
+    """Returns the imported modules of `cdsr_pack`, which may have imported the profiled
+    functions by name (e.g. `from .decoder import decode_asset`)."""
+
+    # the submodules that `cdsr_pack` imports lazily are imported now, otherwise they may
+    # import the swapped functions later and keep them after they are restored
+    for module_name in set(getattr(modules[__package__], '_LAZY_NAMES', {}).values()):
+        import_module(f'.{module_name}', __package__)
+
+    return [module for name, module in list(modules.items())
+            if module is not None and (name == __package__ or
+                                       name.startswith(f'{__package__}.'))]
+
+
+def _swap(original: Callable, instrumented: Callable, swaps: List[tuple]) -> None:
+    """Replaces `original` by `instrumented` inside all `cdsr_pack` modules, adding
+    the `(module, name, original)` swaps to `swaps`."""
+
+    for module in _package_modules():
+        for name, value in list(vars(module).items()):
+            if value is original:
+                setattr(module, name, instrumented)
+                swaps.append((module, name, original))
+
+
+def _swap_engines(instrument: Callable[[Callable, str], Callable], swaps: List[tuple]) -> None:
+    """Replaces each decoding engine by `instrument(engine, name)`, inside `ENGINES` and
+    all `cdsr_pack` modules, adding the swaps to `swaps`."""
+
+    for name, engine in decoder.ENGINES.items():
+        instrumented = instrument(engine, name)
+        _swap(engine, instrumented, swaps)
+        decoder.ENGINES[name] = instrumented
+        swaps.append((decoder.ENGINES, name, engine))
+
+
+def _restore(swaps: List[tuple]) -> None:
+    """Restores the original functions of `swaps`, keeping the selected engine."""
+
+    # the engine may have been selected while the functions were swapped
+    engine = decoder.get_engine()
+
+    for target, name, original in reversed(swaps):
+        if isinstance(target, dict):
+            target[name] = original
+        else:
+            setattr(target, name, original)
+
+    swaps.clear()
+    decoder.set_engine(engine)
+
+
+def enable_profiling() -> Profile:
+    """Swaps the profiled functions by their instrumented variants, returning the profile
+    that collects their statistics. If profiling is already enabled, then its profile
+    is returned. Enable it after `enable_cache`, `enable_interning` and `enable_metrics`,
+    and disable it before them, otherwise their swaps are mixed up."""
+
+    global _profile  # pylint: disable=global-statement,invalid-name
+
+    if _profile is not None:
+        return _profile
+
+    profile_ = Profile()
+
+    for module, names in PROFILED_FUNCTIONS.items():
+        for name in names:
+            function = getattr(module, name)
+            _swap(function, _instrument(profile_, function, name), _swaps)
+
+    _swap_engines(lambda engine, name: _instrument(profile_, engine, f'engine:{name}'),
+                  _swaps)
+
+    _profile = profile_
+
+    return profile_
+
+
+def disable_profiling() -> None:
+    """Restores the original functions. The profile keeps its statistics."""
+
+    global _profile  # pylint: disable=global-statement,invalid-name
+
+    if _profile is None:
+        return
+
+    _restore(_swaps)
+    _profile = None
+
+
+@contextmanager
+def profile() -> Iterator[Profile]:
+    """Profiles the decoders and builders inside a `with` block:
+
+        with profile() as stats:
+            decode_paths(paths)
+
+        print(stats.table())
+    """
+
+    profile_ = enable_profiling()
+
+    try:
+        yield profile_
+    finally:
+        disable_profiling()
+
+
+def _print_table(profile_: Profile) -> None:
+    """Prints the profile table to the standard error."""
+
+    print(profile_.table(), file=stderr)
+
+
+def enable_from_environment() -> None:
+    """Enables profiling if the `CDSR_PACK_PROFILE` environment variable is set (and it
+    is not `0`), printing the profile table to the standard error at exit."""
+
+    if environ.get(PROFILE_ENV, '0') not in ('', '0'):
+        register(_print_table, enable_profiling())
@@ -0,0 +1,339 @@
+"""query.py module.
+
+In-memory query engine of items, with sorted and hash indexes by collection, date and
+path/row, in order to answer queries such as "latest items of path 215 and rows 120 to
+140 of the CBERS4A_WFI_L4_SR collection" without scanning all items."""
+
+from array import array
+from bisect import bisect_left, bisect_right
+from heapq import merge
+from itertools import islice
+from typing import Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple, Union
+
+from .builder import build_collection, build_item
+from .encoder import decode_collection_id
+from .metadata import Metadata
+
+
+# filters accepted by the queries
+FILTERS = ('collection', 'item', 'satellite', 'sensor', 'geo_processing', 'radio_processing',
+           'path', 'row', 'antenna', 'start_date', 'end_date')
+
+# filters that select collections
+_COLLECTION_FILTERS = ('collection', 'satellite', 'sensor', 'geo_processing',
+                       'radio_processing')
+
+# path/row keys are `path * _ROW_LIMIT + row`, then they are sorted by path and row
+_ROW_LIMIT = 10000
+
+_MIN_DAY, _MAX_DAY = 0, 99999999
+
+
+class _Index(NamedTuple):
+    """Item ids sorted by date, with their dates (e.g. `20210101`) for bisect lookups."""
+
+    days: array
+    ids: array
+
+
+def _to_day(date: str) -> int:
+    """Converts a date (e.g. `2021-01-01`) to an int that keeps its order (e.g. `20210101`)."""
+
+    return int(date.replace('-', ''))
+
+
+def _to_range(value: Union[str, int, Tuple]) -> Tuple[int, int]:
+    """Converts a path or row filter (a value or a `(low, high)` tuple) to an int range."""
+
+    if isinstance(value, tuple):
+        return int(value[0]), int(value[1])
+
+    return int(value), int(value)
+
+
+def _to_path_row(value) -> Optional[int]:
+    """Converts a decoded path or row (e.g. `209`) to an int, or returns `None` if it is
+    not a number that fits inside the path/row keys (e.g. `A01`)."""
+
+    try:
+        number = int(value)
+    except (TypeError, ValueError):
+        return None
+
+    return number if 0 <= number < _ROW_LIMIT else None
+
+
+def _name_ranks(names: List[str]) -> List[int]:
+    """Returns the position of each name inside the sorted names."""
+
+    ranks = [0] * len(names)
+
+    for rank, code in enumerate(sorted(range(len(names)), key=names.__getitem__)):
+        ranks[code] = rank
+
+    return ranks
+
+
+class QueryEngine:  # pylint: disable=too-many-instance-attributes
+    """In-memory query engine of items.
+
+    Items are kept by column, with compact arrays, and three kinds of indexes, which
+    are built when the first query runs after items are added:
+    - a sorted index by date of all items;
+    - a hash index by collection, whose items are sorted by date;
+    - a hash index by path/row, whose items are sorted by date, with the sorted
+      path/row keys for range lookups.
+
+    Each query uses the index that has got the fewest candidates to its filters,
+    found by bisect, and checks the other filters on these candidates only."""
+
+    def __init__(self, records: Iterable[Union[dict, Metadata]] = ()):
+        # collection and antenna names by code and codes by name
+        self._collection_names: List[str] = []
+        self._collection_codes: Dict[str, int] = {}
+        self._collection_metadata: List[dict] = []
+        self._antenna_names: List[str] = []
+        self._antenna_codes: Dict[str, int] = {}
+        # item ids by item name, by collection code
+        self._ids: Dict[int, Dict[str, int]] = {}
+        # columns, by item id
+        self._items: List[str] = []
+        self._collections = array('H')
+        self._days = array('l')
+        self._paths = array('H')
+        self._rows = array('H')
+        self._antennas = array('B')
+        # indexes, which are `None` while they are not built, and the position of each
+        # item inside the date index
+        self._date_index: Optional[_Index] = None
+        self._ranks = array('L')
+        self._collection_index: Dict[int, _Index] = {}
+        self._path_row_index: Dict[int, _Index] = {}
+        self._path_row_keys = array('q')
+
+        self.add(records)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def _code(self, name: str, names: List[str], codes: Dict[str, int]) -> int:
+        """Returns the code of a name, adding it if it is new."""
+
+        code = codes.get(name)
+
+        if code is None:
+            code = codes[name] = len(names)
+            names.append(name)
+
+            if names is self._collection_names:
+                self._collection_metadata.append(decode_collection_id(name))
+                self._ids[code] = {}
+
+        return code
+
+    def add(self, records: Iterable[Union[dict, Metadata]]) -> int:
+        """Adds the items of decoded assets (dicts or `Metadata` records), returning the
+        number of new items. Assets of the same item are added once and assets without
+        date (i.e. level 6 paths) or whose path or row is not a number lower than 10000
+        (e.g. `A01`) are skipped, since they cannot be indexed by path/row."""
+
+        count = 0
+
+        for record in records:
+            if isinstance(record, dict):
+                record = Metadata(**record)
+
+            path, row = _to_path_row(record.path), _to_path_row(record.row)
+
+            if record.date is None or path is None or row is None:
+                continue
+
+            collection_code = self._code(build_collection(record), self._collection_names,
+                                         self._collection_codes)
+            item = build_item(record)
+            ids = self._ids[collection_code]
+
+            if item in ids:
+                continue
+
+            ids[item] = len(self._items)
+            self._items.append(item)
+            self._collections.append(collection_code)
+            self._days.append(_to_day(record.date))
+            self._paths.append(path)
+            self._rows.append(row)
+            self._antennas.append(self._code(record.antenna, self._antenna_names,
+                                             self._antenna_codes))
+            count += 1
+
+        if count:
+            self._date_index = None
+
+        return count
+
+    def _build_indexes(self) -> None:
+        """Builds the indexes, sorting items by date, collection and item name."""
+
+        # inside a collection and date, items are sorted by path, row and antenna, then
+        # the sort key is an int, instead of a tuple with the names
+        collection_ranks = _name_ranks(self._collection_names)
+        antenna_ranks = _name_ranks(self._antenna_names)
+        days, paths, rows = self._days, self._paths, self._rows
+        collections, antennas = self._collections, self._antennas
+
+        def key(i: int) -> int:
+            return (((days[i] * len(collection_ranks) + collection_ranks[collections[i]])
+                     * _ROW_LIMIT + paths[i]) * _ROW_LIMIT + rows[i]) * len(antenna_ranks) \
+                + antenna_ranks[antennas[i]]
+
+        order = sorted(range(len(self._items)), key=key)
+
+        self._date_index = _Index(array('l', (days[i] for i in order)), array('L', order))
+        self._ranks = array('L', bytes(len(order) * array('L').itemsize))
+        self._collection_index = {}
+        self._path_row_index = {}
+
+        # items are added in date order, then each index is sorted by date as well
+        for rank, i in enumerate(order):
+            self._ranks[i] = rank
+
+            for index, index_key in ((self._collection_index, collections[i]),
+                                     (self._path_row_index, paths[i] * _ROW_LIMIT + rows[i])):
+                entry = index.get(index_key)
+
+                if entry is None:
+                    entry = index[index_key] = _Index(array('l'), array('L'))
+
+                entry.days.append(days[i])
+                entry.ids.append(i)
+
+        self._path_row_keys = array('q', sorted(self._path_row_index))
+
+    def _match_collections(self, filters: dict) -> Optional[List[int]]:
+        """Returns the codes of the collections that match the collection filters,
+        or `None` if there is not any collection filter."""
+
+        collection_filters = {key: filters[key] for key in _COLLECTION_FILTERS
+                              if key in filters}
+
+        if not collection_filters:
+            return None
+
+        return [code for code, name in enumerate(self._collection_names)
+                if collection_filters.get('collection', name) == name and all(
+                    self._collection_metadata[code][key] == value
+                    for key, value in collection_filters.items() if key != 'collection'
+                )]
+
+    def _plan(self, filters: dict, start: int, end: int) -> List[Tuple[_Index, int, int]]:
+        """Chooses the index with the fewest candidates to the filters, returning its
+        `(index, start, end)` slices inside the date range."""
+
+        def date_slice(index: _Index) -> Tuple[_Index, int, int]:
+            return index, bisect_left(index.days, start), bisect_right(index.days, end)
+
+        plans = [[date_slice(self._date_index)]]
+
+        collections = self._match_collections(filters)
+
+        if collections is not None:
+            plans.append([date_slice(self._collection_index[code]) for code in collections])
+
+        if 'path' in filters or 'row' in filters:
+            low_path, high_path = _to_range(filters.get('path', (0, _ROW_LIMIT - 1)))
+            low_row, high_row = _to_range(filters.get('row', (0, _ROW_LIMIT - 1)))
+            keys = self._path_row_keys
+
+            plans.append([
+                date_slice(self._path_row_index[key])
+                for key in keys[bisect_left(keys, low_path * _ROW_LIMIT + low_row):
+                                bisect_right(keys, high_path * _ROW_LIMIT + high_row)]
+                if low_row <= key % _ROW_LIMIT <= high_row
+            ])
+
+        # item names are unique inside a collection, then they are looked up by hash
+        if 'item' in filters:
+            ids = sorted((ids[filters['item']] for ids in self._ids.values()
+                          if filters['item'] in ids), key=self._ranks.__getitem__)
+            plans.append([date_slice(_Index(array('l', (self._days[i] for i in ids)),
+                                            array('L', ids)))])
+
+        return min(plans, key=lambda slices: sum(end - start for _, start, end in slices))
+
+    def _candidates(self, slices: List[Tuple[_Index, int, int]], descending: bool
+                    ) -> Iterator[int]:
+        """Iterates over the item ids of the index slices, in date order."""
+
+        # ids are read lazily, then a query with a limit does not copy the slices
+        if descending:
+            iterators = [map(index.ids.__getitem__, range(end - 1, start - 1, -1))
+                         for index, start, end in slices]
+        else:
+            iterators = [map(index.ids.__getitem__, range(start, end))
+                         for index, start, end in slices]
+
+        if len(iterators) == 1:
+            return iterators[0]
+
+        # ids are in the same order inside all indexes, then they are merged by their
+        # position inside the date index
+        return merge(*iterators, key=self._ranks.__getitem__, reverse=descending)
+
+    def _conditions(self, filters: dict) -> List[Callable[[int], bool]]:
+        """Returns the conditions of the filters, but the date range, on the item ids."""
+
+        conditions = []
+
+        collections = self._match_collections(filters)
+        if collections is not None:
+            collections = set(collections)
+            conditions.append(lambda i: self._collections[i] in collections)
+
+        for key, column in (('path', self._paths), ('row', self._rows)):
+            if key in filters:
+                low, high = _to_range(filters[key])
+                conditions.append(lambda i, c=column, l=low, h=high: l <= c[i] <= h)
+
+        if 'item' in filters:
+            conditions.append(lambda i: self._items[i] == filters['item'])
+
+        if 'antenna' in filters:
+            antenna = self._antenna_codes.get(filters['antenna'], -1)
+            conditions.append(lambda i: self._antennas[i] == antenna)
+
+        return conditions
+
+    def items(self, limit: Optional[int] = None, order: str = '-date',
+              **filters) -> List[Tuple[str, str]]:
+        """Returns the `(collection, item)` tuples that match all filters, from the newest
+        to the oldest one (`order='-date'`) or the other way around (`order='date'`).
+        Filters: collection, item, satellite, sensor, geo_processing, radio_processing, antenna,
+        path and row (a value or a `(low, high)` tuple) and start_date and end_date
+        (e.g. `2021-01-31`)."""
+
+        invalid_filters = [name for name in filters if name not in FILTERS]
+
+        if invalid_filters:
+            raise ValueError(f"Invalid filters: `{', '.join(invalid_filters)}`. Available "
+                             f"filters: `{', '.join(FILTERS)}`.")
+
+        if order not in ('date', '-date'):
+            raise ValueError(f'Invalid order: `{order}`. Available orders: `date, -date`.')
+
+        if self._date_index is None:
+            self._build_indexes()
+
+        start = _to_day(filters['start_date']) if 'start_date' in filters else _MIN_DAY
+        end = _to_day(filters['end_date']) if 'end_date' in filters else _MAX_DAY
+
+        candidates = self._candidates(self._plan(filters, start, end), order == '-date')
+
+        # the chosen index already checks the date range, then just the other
+        # filters are checked on the candidates
+        conditions = self._conditions(filters)
+        days = self._days
+        ids = (i for i in candidates if start <= days[i] <= end and
+               all(condition(i) for condition in conditions))
+
+        return [(self._collection_names[self._collections[i]], self._items[i])
+                for i in islice(ids, limit)]
@@ -0,0 +1,130 @@
+"""regex_decoder.py module.
+
+Decoding engine that decodes a whole path with one precompiled regular expression
+per directory layout, instead of splitting each directory. Select it with
+`decoder.set_engine('regex')`. The patterns are written to the built-in scene directory
+layouts, then a path is just decoded by a pattern if its scene directory is still
+dispatched to the built-in layout that the pattern was written for (see `families`)."""
+
+from os.path import sep as os_path_sep
+from re import compile as re_compile, escape as re_escape
+
+from .decoder import ENGINES
+from .families import AMAZONIA1_CBERS4_LAYOUT, CBERS2B_LANDSAT_LAYOUT, \
+                      _get_antenna_from_scene_dir_second, find_parser
+from .tokens import SR_MARKER_MATCHER
+
+
+# paths that do not match any layout (e.g. invalid paths) are decoded by the `split`
+# engine, then they have exactly the same results and errors as before
+_split_engine = ENGINES['split']
+
+# directory separator, a whole directory name, a part of a directory name
+# separated by underscores and a single character of a scene directory part
+_SEP = re_escape(os_path_sep)
+_NAME = f'[^{_SEP}]*'
+_PART = f'[^_{_SEP}]*'
+_SCENE_CHAR = f'[^_.{_SEP}]'
+
+# scene directories, e.g. `CBERS_4A_MUX_RAW_2021_01_01.13_48_30_ETC2`, in which
+# the time parts must be numbers and the antenna is looked for after them
+_AMAZONIA_1_CBERS_4_SCENE_DIR = (
+    f'(?P<scene_dir_first>(?:AMAZONIA_1|CBERS_4A?)_(?P<sensor>{_SCENE_CHAR}*)_'
+    f'{_SCENE_CHAR}*_{_SCENE_CHAR}{{4}}_{_SCENE_CHAR}{{2}}_{_SCENE_CHAR}{{2}})'
+    f'\\.\\d+_\\d+_\\d+(?P<scene_dir_tail>(?:_[^.{_SEP}]*)?)'
+)
+# e.g. `CBERS2B_CCD_20070925.145654` and `LANDSAT1_MSS_19750907.130000`
+_CBERS2B_LANDSAT_SCENE_DIR = (
+    f'(?P<scene_dir_first>(?:CBERS2B|LANDSAT){_SCENE_CHAR}*_(?P<sensor>{_SCENE_CHAR}*)_'
+    f'{_SCENE_CHAR}{{8}})\\.[^.{_SEP}]{{6}}(?P<scene_dir_tail>)'
+)
+
+# path/row directories, e.g. `151_098_0` and, to HRC sensor, `151_B_141_5_0`
+_PATH_ROW_DIR = f'(?P<path>{_PART})_(?P<row>{_PART})_{_PART}'
+_HRC_PATH_ROW_DIR = f'(?P<path>{_PART})_{_PART}_(?P<row>{_PART})_{_PART}_{_PART}'
+
+
+def _compile_layout(scene_dir: str, path_row_dir: str):
+    """Compiles the regular expression of a whole path starting at `TIFF`,
+    based on its scene and path/row directories."""
+
+    return re_compile(
+        # TIFF, satellite and year_month directories
+        f'TIFF{_NAME}{_SEP}(?P<satellite>{_NAME}){_SEP}{_NAME}{_SEP}'
+        f'{scene_dir}{_SEP}{path_row_dir}{_SEP}'
+        # geo. processing directory, e.g. `2B_BC_UTM_WGS84`
+        f'(?P<geo_processing>2B|2|3|4)(?:_{_NAME})?'
+        # optional asset, e.g. `CBERS_4A_MUX_20210101_209_110_L2_BAND5.tif`,
+        # which must have an extension and its fourth part is the date
+        f'(?:{_SEP}(?P<asset>(?={_NAME}\\.){_PART}_{_PART}_{_PART}_'
+        f'(?P<date>[^_{_SEP}]{{8}})'
+        f'(?:_{_NAME})?))?'
+    )
+
+
+# one pattern per layout with the built-in scene directory layout it was written for and
+# its default antenna, in the order they are tried. `None` means the antenna is looked for
+# inside the scene directory
+LAYOUTS = (
+    (_compile_layout(_AMAZONIA_1_CBERS_4_SCENE_DIR, _PATH_ROW_DIR), AMAZONIA1_CBERS4_LAYOUT,
+     None),
+    # `ND` stands for `não determinado`
+    (_compile_layout(_CBERS2B_LANDSAT_SCENE_DIR, _PATH_ROW_DIR), CBERS2B_LANDSAT_LAYOUT, 'ND'),
+    (_compile_layout(_CBERS2B_LANDSAT_SCENE_DIR, _HRC_PATH_ROW_DIR), CBERS2B_LANDSAT_LAYOUT,
+     'ND')
+)
+
+
+def decode_path_values(path: str) -> tuple:  # pylint: disable=too-many-locals
+    """Decodes a path with one regular expression match, returning its metadata
+    values in the `METADATA_KEYS` order."""
+
+    # if path ends with slash, then remove it. The original path is kept to be
+    # decoded by the `split` engine, which removes the slash by itself
+    stripped_path = path[:-1] if path.endswith('/') else path
+
+    # get dir path index starting at `/TIFF`
+    index = stripped_path.find('TIFF')
+
+    if index == -1:
+        return _split_engine(path)
+
+    for layout, scene_dir_layout, antenna in LAYOUTS:
+        match = layout.fullmatch(stripped_path, index)
+
+        if match is not None:
+            break
+    else:
+        return _split_engine(path)
+
+    # if the scene directory is dispatched to a registered layout (e.g. a built-in layout
+    # has been replaced), then the `split` engine decodes it by that layout
+    parser = find_parser(match['scene_dir_first'])
+
+    if parser is None or parser.layout != scene_dir_layout:
+        return _split_engine(path)
+
+    satellite, _, sensor, scene_dir_tail, path_, row, geo_processing, asset, date = \
+        match.groups()
+
+    if antenna is None:
+        antenna = _get_antenna_from_scene_dir_second(scene_dir_tail)
+
+        # if the antenna is invalid, then the `split` engine raises its error
+        if antenna is None:
+            return _split_engine(path)
+
+    # level 6 path, without asset
+    if asset is None:
+        return satellite, sensor, path_, row, None, geo_processing, None, antenna
+
+    if SR_MARKER_MATCHER.contains(asset):
+        radio_processing = 'SR'
+    else:
+        radio_processing = 'DN'
+
+    return (satellite, sensor, path_, row, f'{date[:4]}-{date[4:6]}-{date[6:8]}',
+            geo_processing, radio_processing, antenna)
+
+
+ENGINES['regex'] = decode_path_values
@@ -0,0 +1,226 @@
+"""result_decoder.py module.
+
+Non-raising variant of `decode_path`, which returns an error code and the offending
+path component instead of raising an exception. Error messages are just built when
+they are asked, then decoding dirty listings does not pay for building and catching
+exceptions."""
+
+from enum import Enum
+from os.path import sep as os_path_sep
+from typing import Any, NamedTuple, Optional, Union
+
+from .decoder import DECODE_ERRORS, CDSRDecoderException, decode_asset, \
+                     extract_data_from_scene_dir
+from .families import find_parser
+from .metadata import Metadata
+from .tokens import SR_MARKER_MATCHER
+
+
+class DecodeErrorCode(Enum):
+    """Reasons why a path cannot be decoded."""
+
+    INVALID_TYPE = 1
+    INVALID_LEVEL = 2
+    ASSET_WITHOUT_EXTENSION = 3
+    MALFORMED_ASSET = 4
+    INVALID_ASSET_DATE = 5
+    MALFORMED_SCENE_DIR = 6
+    INVALID_SCENE_DIR = 7
+    INVALID_RECEPTION_DATE = 8
+    INVALID_RECEPTION_TIME = 9
+    INVALID_ANTENNA = 10
+    INVALID_PATH_ROW_DIR = 11
+    INVALID_GEO_PROCESSING_DIR = 12
+
+
+# templates of the messages that `decode_path` raises by error code
+_MESSAGES = {
+    DecodeErrorCode.INVALID_TYPE: 'Path must be a str, not a `{component}`.',
+    DecodeErrorCode.INVALID_LEVEL: 'Invalid `{level}` level to path: `{component}`.',
+    DecodeErrorCode.ASSET_WITHOUT_EXTENSION: 'An asset must have an extension.',
+    DecodeErrorCode.INVALID_ASSET_DATE: 'Invalid date inside asset: `{component}`.',
+    DecodeErrorCode.INVALID_SCENE_DIR: 'Invalid scene directory: `{component}`.',
+    DecodeErrorCode.INVALID_RECEPTION_DATE: 'Invalid reception date in scene_dir: `{component}`.',
+    DecodeErrorCode.INVALID_RECEPTION_TIME: 'Invalid reception time in scene_dir: `{component}`.',
+    DecodeErrorCode.INVALID_ANTENNA: 'Invalid antenna in scene_dir: `{component}`.',
+    DecodeErrorCode.INVALID_PATH_ROW_DIR: 'Path/row directory cannot be decoded: `{component}`.',
+    DecodeErrorCode.INVALID_GEO_PROCESSING_DIR: 'Geo. processing directory cannot be '
+                                                'decoded: `{component}`.'
+}
+
+# malformed components (e.g. a scene directory without a dot) make `decode_path` raise a
+# `ValueError` or an `IndexError`, then these functions are called to build the same error
+_MALFORMED_DECODERS = {
+    DecodeErrorCode.MALFORMED_ASSET: decode_asset,
+    DecodeErrorCode.MALFORMED_SCENE_DIR: extract_data_from_scene_dir
+}
+
+
+class DecodeResult(NamedTuple):
+    """Result of `decode_path_result`: either the metadata of the path, or the error
+    code and the component of the path that cannot be decoded."""
+
+    metadata: Union[dict, Metadata, None]
+    code: Optional[DecodeErrorCode]
+    component: Any
+
+    @property
+    def ok(self) -> bool:  # pylint: disable=invalid-name
+        """Returns if the path has been decoded."""
+
+        return self.code is None
+
+    @property
+    def message(self) -> Optional[str]:
+        """Builds the message of the error that `decode_path` would have raised, or
+        returns `None` if the path has been decoded."""
+
+        if self.code is None:
+            return None
+
+        if self.code in _MALFORMED_DECODERS:
+            return str(self.exception())
+
+        if self.code is DecodeErrorCode.INVALID_LEVEL:
+            level = len(self.component[self.component.find('TIFF'):].split(os_path_sep))
+            return _MESSAGES[self.code].format(component=self.component, level=level)
+
+        return _MESSAGES[self.code].format(component=self.component)
+
+    def exception(self) -> Optional[Exception]:
+        """Builds the exception that `decode_path` would have raised, or returns `None`
+        if the path has been decoded."""
+
+        if self.code is None:
+            return None
+
+        if self.code in _MALFORMED_DECODERS:
+            try:
+                _MALFORMED_DECODERS[self.code](self.component)
+            except DECODE_ERRORS as error:
+                return error
+
+        return CDSRDecoderException(self.message)
+
+
+def _error(code: DecodeErrorCode, component: Any) -> DecodeResult:
+    """Returns the result of a path that cannot be decoded."""
+
+    return DecodeResult(None, code, component)
+
+
+def _check_asset(asset: str) -> Union[DecodeResult, tuple]:
+    """Checks an asset file name in the same order as `decode_asset`, returning its
+    date and radio. processing, or the error result."""
+
+    if '.' not in asset:
+        return _error(DecodeErrorCode.ASSET_WITHOUT_EXTENSION, asset)
+
+    asset_parts = asset.split('_')
+
+    if len(asset_parts) < 4:
+        return _error(DecodeErrorCode.MALFORMED_ASSET, asset)
+
+    date = asset_parts[3]
+
+    if len(date) != 8:
+        return _error(DecodeErrorCode.INVALID_ASSET_DATE, date)
+
+    if SR_MARKER_MATCHER.contains(asset):
+        return f'{date[:4]}-{date[4:6]}-{date[6:8]}', 'SR'
+
+    return f'{date[:4]}-{date[4:6]}-{date[6:8]}', 'DN'
+
+
+# errors are returned as soon as they are found, in the same order as they are raised
+def _check_scene_dir(scene_dir: str  # pylint: disable=too-many-return-statements
+                     ) -> Union[DecodeResult, tuple]:
+    """Checks a scene directory in the same order as `decode_scene_dir`, returning
+    its sensor and antenna, or the error result."""
+
+    if scene_dir.count('.') != 1:
+        return _error(DecodeErrorCode.MALFORMED_SCENE_DIR, scene_dir)
+
+    scene_dir_first, scene_dir_second = scene_dir.split('.')
+
+    parse = find_parser(scene_dir_first)
+
+    if parse is None:
+        return _error(DecodeErrorCode.INVALID_SCENE_DIR, scene_dir)
+
+    data = parse(scene_dir_first, scene_dir_second, False)
+
+    if data is None:
+        return _error(DecodeErrorCode.MALFORMED_SCENE_DIR, scene_dir)
+
+    _, sensor, reception_date, reception_time, antenna = data
+
+    if reception_date is None:
+        return _error(DecodeErrorCode.INVALID_RECEPTION_DATE, scene_dir)
+
+    if reception_time is None:
+        return _error(DecodeErrorCode.INVALID_RECEPTION_TIME, scene_dir)
+
+    if antenna is None:
+        return _error(DecodeErrorCode.INVALID_ANTENNA, scene_dir)
+
+    return sensor, antenna
+
+
+def decode_path_result(path: str,  # pylint: disable=too-many-return-statements
+                       record: bool = False) -> DecodeResult:
+    """Decodes a path like `decode_path` does, but returns a `DecodeResult` instead of
+    raising an exception. If the path cannot be decoded, then the result has got the
+    error code and the offending component (e.g. the scene directory name), and its
+    `message` is the one that `decode_path` would have raised."""
+
+    # check type
+    if not isinstance(path, str):
+        return _error(DecodeErrorCode.INVALID_TYPE, type(path))
+
+    # if path ends with slash, then remove it
+    if path.endswith('/'):
+        path = path[:-1]
+
+    splitted_path = path[path.find('TIFF'):].split(os_path_sep)
+    level = len(splitted_path)
+
+    if level not in (6, 7):
+        return _error(DecodeErrorCode.INVALID_LEVEL, path)
+
+    # the asset is decoded first, as `decode_path` does
+    if level == 7:
+        asset = _check_asset(splitted_path[-1])
+
+        if isinstance(asset, DecodeResult):
+            return asset
+
+        date, radio_processing = asset
+    else:
+        date, radio_processing = None, None
+
+    _, satellite, _, scene_dir, path_row_dir, geo_processing_dir, *_ = splitted_path
+
+    scene = _check_scene_dir(scene_dir)
+
+    if isinstance(scene, DecodeResult):
+        return scene
+
+    path_row = path_row_dir.split('_')
+
+    if len(path_row) not in (3, 5):
+        return _error(DecodeErrorCode.INVALID_PATH_ROW_DIR, path_row_dir)
+
+    geo_processing = geo_processing_dir.split('_')[0]
+
+    if geo_processing not in ('2', '2B', '3', '4'):
+        return _error(DecodeErrorCode.INVALID_GEO_PROCESSING_DIR, geo_processing_dir)
+
+    # `151_098_0` or `151_B_141_5_0`
+    values = (satellite, scene[0], path_row[0], path_row[1 if len(path_row) == 3 else 2],
+              date, geo_processing, radio_processing, scene[1])
+
+    if record:
+        return DecodeResult(Metadata._make(values), None, None)
+
+    return DecodeResult(Metadata._make(values).to_dict(), None, None)
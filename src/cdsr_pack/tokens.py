@@ -0,0 +1,109 @@
+"""tokens.py module.
+
+Matchers of the tokens looked for inside names: the antennas inside scene directories
+(e.g. `ETC2` inside `13_53_00_ETC2`) and the markers of SR products inside assets (e.g.
+`NDVI` inside `CBERS_4A_WFI_20201207_214_108_L4_LEFT_NDVI.tif`). Each token set is
+compiled once, when it is set, then decoding a path does not depend on how the tokens
+are matched, and new stations or indices are set by `set_antennas` and `set_sr_markers`."""
+
+from re import compile as re_compile, escape as re_escape
+from typing import Callable, Iterable, Optional, Tuple
+
+
+# default antennas and SR markers, in priority order
+ANTENNAS = ('CB11', 'CP5', 'ETC2')
+SR_MARKERS = ('GRID_SURFACE', 'EVI', 'NDVI')
+
+# sets with up to this number of tokens are matched by one substring search per token,
+# which is faster than a regular expression to a few tokens. Bigger sets are matched by
+# one precompiled regular expression, in a single pass over the string
+SUBSTRING_LIMIT = 6
+
+
+class TokenMatcher:  # pylint: disable=too-few-public-methods
+    """Finds a set of tokens inside strings. Tokens are in priority order, then `find`
+    returns the first token of the set found inside a string, not the leftmost one in
+    the string, and `None` if there is not any. `contains` returns if there is any."""
+
+    def __init__(self, tokens: Iterable[str]):
+        # the tokens and the functions compiled to them by `compile`
+        self.tokens: Tuple[str, ...] = ()
+        self.find: Callable[[str], Optional[str]] = lambda text: None
+        self.contains: Callable[[str], bool] = lambda text: False
+        self.compile(tokens)
+
+    def compile(self, tokens: Iterable[str]) -> None:
+        """Compiles `find` and `contains` to a new set of tokens."""
+
+        tokens = tuple(tokens)
+
+        if not all(isinstance(token, str) and token for token in tokens):
+            raise ValueError(f'Tokens must be non-empty strings, not: `{tokens}`.')
+
+        if len(tokens) <= SUBSTRING_LIMIT:
+            def find(text: str) -> Optional[str]:
+                for token in tokens:
+                    if token in text:
+                        return token
+
+                return None
+
+            def contains(text: str) -> bool:
+                for token in tokens:
+                    if token in text:
+                        return True
+
+                return False
+        else:
+            alternation = '|'.join(re_escape(token) for token in tokens)
+            # the lookahead matches at each position of the string, then overlapping
+            # tokens are found as well, and the alternation prefers the first token
+            # among the ones starting at the same position
+            findall = re_compile(f'(?=({alternation}))').findall
+            search = re_compile(alternation).search
+            priority = {token: index for index, token in reversed(list(enumerate(tokens)))}
+
+            def find(text: str) -> Optional[str]:
+                found = findall(text)
+
+                if not found:
+                    return None
+
+                return min(found, key=priority.__getitem__)
+
+            def contains(text: str) -> bool:
+                return search(text) is not None
+
+        self.tokens = tokens
+        self.find = find
+        self.contains = contains
+
+
+# matchers used by the decoders, which are compiled again when their tokens are set
+ANTENNA_MATCHER = TokenMatcher(ANTENNAS)
+SR_MARKER_MATCHER = TokenMatcher(SR_MARKERS)
+
+
+def set_antennas(antennas: Iterable[str]) -> None:
+    """Sets the antennas looked for after the dot of the scene directories, in priority
+    order. Results cached by `enable_cache` are kept, then clear them by `clear_cache`."""
+
+    ANTENNA_MATCHER.compile(antennas)
+
+
+def get_antennas() -> Tuple[str, ...]:
+    """Returns the antennas looked for after the dot of the scene directories."""
+
+    return ANTENNA_MATCHER.tokens
+
+
+def set_sr_markers(markers: Iterable[str]) -> None:
+    """Sets the tokens that mark the assets of SR products (the other ones are DN)."""
+
+    SR_MARKER_MATCHER.compile(markers)
+
+
+def get_sr_markers() -> Tuple[str, ...]:
+    """Returns the tokens that mark the assets of SR products."""
+
+    return SR_MARKER_MATCHER.tokens
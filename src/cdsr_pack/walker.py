@@ -0,0 +1,201 @@
+"""walker.py module."""
+
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, as_completed, wait
+from os import cpu_count, scandir
+from time import perf_counter
+from typing import Callable, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+from .decoder import DECODE_ERRORS, decode_asset, decode_geo_processing_dir, \
+                     decode_path_row_dir, decode_scene_dir
+
+
+def _handle_error(error: Exception, onerror: Optional[Callable[[Exception], None]]) -> None:
+    """Reports an error to the `onerror` callback, if it exists."""
+
+    if onerror is not None:
+        onerror(error)
+
+
+def _list_entries(dir_path: str, onerror: Optional[Callable[[Exception], None]],
+                  directories: bool) -> List:
+    """Lists the entries inside a directory, keeping either just the directories
+    or just the files. If the directory cannot be listed, then an empty list is returned."""
+
+    try:
+        with scandir(dir_path) as entries:
+            if directories:
+                return [entry for entry in entries if entry.is_dir()]
+            return [entry for entry in entries if entry.is_file()]
+    except OSError as error:
+        _handle_error(error, onerror)
+        return []
+
+
+def walk_month_dir(month_dir: str, satellite: str,
+                   onerror: Optional[Callable[[Exception], None]] = None
+                   ) -> Iterator[Tuple[str, dict]]:
+    """Walks a month directory (e.g. `/TIFF/CBERS4A/2021_01`), yielding the path and
+    the metadata of each asset inside it.
+
+    Scene, path/row and geo. processing directories are decoded just once, then
+    just the asset file name is decoded for each file."""
+
+    for scene_entry in _list_entries(month_dir, onerror, True):
+        try:
+            _, sensor, *_, antenna = decode_scene_dir(scene_entry.name)
+        except DECODE_ERRORS as error:
+            _handle_error(error, onerror)
+            continue
+
+        for path_row_entry in _list_entries(scene_entry.path, onerror, True):
+            try:
+                path, row = decode_path_row_dir(path_row_entry.name)
+            except DECODE_ERRORS as error:
+                _handle_error(error, onerror)
+                continue
+
+            for geo_processing_entry in _list_entries(path_row_entry.path, onerror, True):
+                try:
+                    geo_processing = decode_geo_processing_dir(geo_processing_entry.name)
+                except DECODE_ERRORS as error:
+                    _handle_error(error, onerror)
+                    continue
+
+                for asset_entry in _list_entries(geo_processing_entry.path, onerror, False):
+                    try:
+                        date, radio_processing = decode_asset(asset_entry.name)
+                    except DECODE_ERRORS as error:
+                        _handle_error(error, onerror)
+                        continue
+
+                    yield asset_entry.path, {
+                        'satellite': satellite, 'sensor': sensor, 'path': path, 'row': row,
+                        'date': date, 'geo_processing': geo_processing,
+                        'radio_processing': radio_processing, 'antenna': antenna
+                    }
+
+
+def walk_tiff(top: str, onerror: Optional[Callable[[Exception], None]] = None
+              ) -> Iterator[Tuple[str, dict]]:
+    """Walks a `/TIFF` directory tree, yielding the path and the metadata of each asset.
+
+    The tree must follow the `<top>/<satellite>/<year_month>/<scene_dir>/<path_row_dir>/
+    <geo_processing_dir>/<asset>` layout, the same one `decode_path` expects.
+    Directories and files that cannot be listed or decoded are skipped and their errors
+    are reported to the `onerror` callback, if it is given, like `os.walk` does."""
+
+    for satellite_entry in _list_entries(top, onerror, True):
+        for month_entry in _list_entries(satellite_entry.path, onerror, True):
+            yield from walk_month_dir(month_entry.path, satellite_entry.name, onerror)
+
+
+class PartitionTiming(NamedTuple):
+    """Walk of a satellite/month partition (e.g. `CBERS4A` and `2021_01`): number of
+    assets and errors found inside it and the time it took, in seconds."""
+
+    satellite: str
+    month: str
+    assets: int
+    errors: int
+    seconds: float
+
+
+def _walk_partition(month_dir: str, satellite: str, month: str
+                    ) -> Tuple[List[Tuple[str, dict]], List[Exception], PartitionTiming]:
+    """Walks a month directory inside a worker thread, returning its assets, its errors
+    and its timing. Errors are returned, then they are reported by the main thread."""
+
+    errors: List[Exception] = []
+    start = perf_counter()
+    assets = list(walk_month_dir(month_dir, satellite, errors.append))
+
+    return assets, errors, PartitionTiming(satellite, month, len(assets), len(errors),
+                                           perf_counter() - start)
+
+
+def walk_tiff_parallel(top: str, workers: Optional[int] = None, ordered: bool = False,
+                       onerror: Optional[Callable[[Exception], None]] = None,
+                       onpartition: Optional[Callable[[PartitionTiming], None]] = None
+                       ) -> Iterator[Tuple[str, dict]]:
+    """Walks a `/TIFF` directory tree like `walk_tiff` does, but each satellite/month
+    directory (i.e. partition) is walked by one of `workers` threads (default: the number
+    of CPUs plus 4, up to 32).
+
+    The top two levels are listed by the main thread, then the assets of each partition
+    are yielded as soon as it is walked, or in the `walk_tiff` order if `ordered` is
+    True. Errors are reported to `onerror` and the timing of each partition is reported
+    to `onpartition` (see `partition_report`), both by the main thread."""
+
+    def partitions() -> Iterator[Tuple[str, str, str]]:
+        for satellite_entry in _list_entries(top, onerror, True):
+            for month_entry in _list_entries(satellite_entry.path, onerror, True):
+                yield month_entry.path, satellite_entry.name, month_entry.name
+
+    def handle_result(result: Tuple[List[Tuple[str, dict]], List[Exception],
+                                    PartitionTiming]) -> List[Tuple[str, dict]]:
+        assets, errors, timing = result
+
+        for error in errors:
+            _handle_error(error, onerror)
+
+        if onpartition is not None:
+            onpartition(timing)
+
+        return assets
+
+    # the same default as `ThreadPoolExecutor`, since listing directories waits on I/O
+    workers = workers or min(32, (cpu_count() or 1) + 4)
+    # just a few partitions are in flight at once, then walked assets do not pile up
+    max_pending = workers * 2
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        queue = deque()
+        pending = set()
+
+        try:
+            if ordered:
+                for partition in partitions():
+                    queue.append(executor.submit(_walk_partition, *partition))
+
+                    if len(queue) >= max_pending:
+                        yield from handle_result(queue.popleft().result())
+
+                for future in queue:
+                    yield from handle_result(future.result())
+
+                return
+
+            for partition in partitions():
+                pending.add(executor.submit(_walk_partition, *partition))
+
+                if len(pending) >= max_pending:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+
+                    for future in done:
+                        yield from handle_result(future.result())
+
+            for future in as_completed(pending):
+                yield from handle_result(future.result())
+        except GeneratorExit:
+            # if the walk is closed early (e.g. by a `break`), then the partitions that are
+            # not being walked yet are cancelled, otherwise the pool walks them on shutdown
+            for future in (*queue, *pending):
+                future.cancel()
+            raise
+
+def partition_report(timings: Iterable[PartitionTiming], limit: Optional[int] = None) -> str:
+    """Returns a table of the partition timings, from the slowest to the fastest one,
+    with at most `limit` rows."""
+
+    timings = sorted(timings, key=lambda timing: timing.seconds, reverse=True)[:limit]
+
+    lines = [f"{'satellite':<12}{'month':<10}{'assets':>10}{'errors':>8}{'seconds':>10}"
+             f"{'assets/s':>12}"]
+
+    for timing in timings:
+        rate = timing.assets / timing.seconds if timing.seconds else 0.0
+        lines.append(f'{timing.satellite:<12}{timing.month:<10}{timing.assets:>10}'
+                     f'{timing.errors:>8}{timing.seconds:>10.3f}{rate:>12.0f}')
+
+    return '\n'.join(lines)
@@ -0,0 +1,409 @@
+"""watcher.py module.
+
+Watches a `/TIFF` tree and emits an event with the metadata, the collection and the
+item of each new asset, using inotify (through ctypes) on Linux, or polling the tree
+with incremental scans otherwise."""
+
+from collections import deque
+from ctypes import CDLL, get_errno
+from ctypes.util import find_library
+from os import close as os_close, fsdecode, fsencode, read, scandir, stat, strerror
+from os.path import join, splitext
+from select import select
+from struct import calcsize, unpack_from
+from time import monotonic, sleep, time
+from typing import Callable, Dict, Iterator, List, NamedTuple, Optional
+
+from .builder import CDSRBuilderException, build_collection, build_item
+from .decoder import DECODE_ERRORS, decode_path
+from .incremental import scan_changes
+
+
+# just these assets are emitted
+ASSET_EXTENSIONS = ('.tif', '.xml')
+
+# inotify constants, from `<sys/inotify.h>`
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_Q_OVERFLOW = 0x00004000
+_IN_IGNORED = 0x00008000
+_IN_ISDIR = 0x40000000
+_IN_NONBLOCK = 0o4000
+_IN_CLOEXEC = 0o2000000
+_IN_WATCH_MASK = _IN_CLOSE_WRITE | _IN_MOVED_TO | _IN_CREATE
+
+# `struct inotify_event` header: wd, mask, cookie and len, followed by the name
+_INOTIFY_EVENT = 'iIII'
+_INOTIFY_EVENT_SIZE = calcsize(_INOTIFY_EVENT)
+
+# files reported by inotify that are kept to not be reported again by a scan of the tree,
+# which is scanned when there are more of them
+_MAX_REPORTED = 100000
+
+
+class WatchEvent(NamedTuple):
+    """Event emitted to a new asset."""
+
+    path: str
+    metadata: dict
+    collection: str
+    item: str
+    # seconds between the last modification of the asset and the event
+    latency: float
+
+
+class LatencySummary(NamedTuple):
+    """Summary of the file-to-event latencies, in seconds."""
+
+    count: int
+    mean: float
+    p50: float
+    p95: float
+    max: float
+
+
+class LatencyMetrics:
+    """Keeps the file-to-event latencies of the emitted events. The count, mean and
+    maximum are kept for all events, but the percentiles are computed over the latest
+    `window` events, then a long-running watcher keeps bounded memory."""
+
+    def __init__(self, window: int = 10000):
+        if not isinstance(window, int) or window < 1:
+            raise ValueError(f'Window must be a positive int, not `{window}`.')
+
+        self.latencies = deque(maxlen=window)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def record(self, latency: float) -> None:
+        """Records the latency of an event."""
+
+        self.latencies.append(latency)
+        self.count += 1
+        self.total += latency
+        self.max = max(self.max, latency)
+
+    def summary(self) -> LatencySummary:
+        """Returns the number of events and their mean, median, 95th percentile
+        and maximum latencies. Latencies are zero if there is no event."""
+
+        if not self.count:
+            return LatencySummary(0, 0.0, 0.0, 0.0, 0.0)
+
+        latencies = sorted(self.latencies)
+        size = len(latencies)
+
+        return LatencySummary(self.count, self.total / self.count, latencies[(size - 1) // 2],
+                              latencies[min(size - 1, int(size * 0.95))], self.max)
+
+
+class _InotifyBackend:  # pylint: disable=too-many-instance-attributes
+    """Reports the files written or moved into a `/TIFF` tree through inotify.
+    Each directory of the tree is watched and new directories are watched as soon as
+    they are created. If a directory cannot be watched while the tree is being watched
+    for the first time, then an `OSError` is raised.
+
+    Events are lost if a new directory cannot be watched (e.g. `max_user_watches` is
+    reached) or if the event queue overflows. Then the tree is scanned incrementally
+    and the files added since the last scan that have not been reported are reported.
+    Unwatched directories are scanned again every `interval` seconds."""
+
+    name = 'inotify'
+
+    def __init__(self, top: str, onerror: Optional[Callable[[Exception], None]],
+                 interval: float):
+        self.libc = CDLL(find_library('c') or 'libc.so.6', use_errno=True)
+        self.fd = self.libc.inotify_init1(_IN_NONBLOCK | _IN_CLOEXEC)
+
+        if self.fd < 0:
+            errno = get_errno()
+            raise OSError(errno, strerror(errno))
+
+        self.top = top
+        self.onerror = onerror
+        self.interval = interval
+        # watch descriptor -> watched directory
+        self.watches = {}
+
+        try:
+            self._watch_tree(top, [], strict=True)
+            # the manifest of the last scan, which finds the files whose events are lost
+            _, self.manifest = scan_changes(top, {})
+        except OSError:
+            os_close(self.fd)
+            raise
+
+        # files reported since the last scan, which are not reported again by the next one
+        self.reported = set()
+        # if a directory is not watched, then the tree is scanned every `interval` seconds
+        self.unwatched = False
+        # monotonic time of the next scan, or `None` if there is no scan to do
+        self.next_scan: Optional[float] = None
+
+    def _report_error(self, error: Exception) -> None:
+        """Reports an error to the `onerror` callback, if it exists."""
+
+        if self.onerror is not None:
+            self.onerror(error)
+
+    def _watch_tree(self, dir_path: str, paths: List[str], strict: bool = False) -> None:
+        """Watches a directory and its subdirectories, appending the files
+        that already exist inside them to `paths`, since they may have been
+        written before the directory was watched. If a directory cannot be watched,
+        then an `OSError` is raised if `strict` is True, otherwise it is reported and
+        the tree is scanned from now on."""
+
+        watch = self.libc.inotify_add_watch(self.fd, fsencode(dir_path), _IN_WATCH_MASK)
+
+        if watch < 0:
+            errno = get_errno()
+            error = OSError(errno, strerror(errno), dir_path)
+
+            if strict:
+                raise error
+
+            self._report_error(error)
+            self.unwatched = True
+            self.next_scan = monotonic()
+            return
+
+        self.watches[watch] = dir_path
+
+        try:
+            with scandir(dir_path) as entries:
+                entries = list(entries)
+        except OSError as error:
+            self._report_error(error)
+            return
+
+        for entry in entries:
+            if entry.is_dir():
+                self._watch_tree(entry.path, paths, strict)
+            else:
+                paths.append(entry.path)
+
+    def _read_events(self, buffer: bytes) -> List[str]:
+        """Handles the events of a buffer read from inotify, returning the paths of the
+        files that have been written or moved into the tree."""
+
+        paths = []
+        offset = 0
+
+        while offset < len(buffer):
+            watch, mask, _, length = unpack_from(_INOTIFY_EVENT, buffer, offset)
+            name = fsdecode(buffer[offset + _INOTIFY_EVENT_SIZE:
+                                   offset + _INOTIFY_EVENT_SIZE + length].rstrip(b'\0'))
+            offset += _INOTIFY_EVENT_SIZE + length
+
+            if mask & _IN_Q_OVERFLOW:
+                self._report_error(OSError('The inotify event queue has overflowed, then '
+                                           'the tree is scanned for the lost events.'))
+                self.next_scan = monotonic()
+
+            if mask & _IN_IGNORED:
+                self.watches.pop(watch, None)
+                continue
+
+            dir_path = self.watches.get(watch)
+
+            if dir_path is None or not name:
+                continue
+
+            if mask & _IN_ISDIR:
+                if mask & (_IN_CREATE | _IN_MOVED_TO):
+                    self._watch_tree(join(dir_path, name), paths)
+            # a created file may be empty yet, then it is reported when it is closed
+            elif mask & (_IN_CLOSE_WRITE | _IN_MOVED_TO):
+                paths.append(join(dir_path, name))
+
+        return paths
+
+    def _scan(self) -> List[str]:
+        """Scans the tree incrementally, returning the files added since the last scan
+        that have not been reported yet."""
+
+        try:
+            result, self.manifest = scan_changes(self.top, self.manifest)
+        except OSError as error:
+            self._report_error(error)
+            self.next_scan = monotonic() + self.interval
+            return []
+
+        paths = [path for path in result.added if path not in self.reported]
+        self.reported.clear()
+        self.next_scan = monotonic() + self.interval if self.unwatched else None
+
+        return paths
+
+    def read(self, timeout: float) -> List[str]:
+        """Waits up to `timeout` seconds for events, returning the paths of the
+        files that have been written or moved into the tree."""
+
+        if self.next_scan is not None:
+            timeout = min(timeout, self.next_scan - monotonic())
+
+        paths = []
+
+        if select([self.fd], [], [], max(timeout, 0))[0]:
+            try:
+                paths = self._read_events(read(self.fd, 65536))
+            except BlockingIOError:
+                pass
+
+        self.reported.update(paths)
+
+        # the reported files are kept until the next scan, which is also done to keep
+        # them bounded
+        if self.next_scan is not None and monotonic() >= self.next_scan or \
+                len(self.reported) > _MAX_REPORTED:
+            paths.extend(self._scan())
+
+        return paths
+
+    def close(self) -> None:
+        """Stops watching the tree."""
+
+        os_close(self.fd)
+
+
+class _PollingBackend:
+    """Reports the files added to a `/TIFF` tree by scanning it incrementally every
+    `interval` seconds, where unchanged directories are not listed again."""
+
+    name = 'polling'
+
+    def __init__(self, top: str, interval: float):
+        self.top = top
+        self.interval = interval
+        # the first scan just finds the files that already exist
+        _, self.manifest = scan_changes(top, {})
+        self.next_scan = monotonic() + interval
+
+    def read(self, timeout: float) -> List[str]:
+        """Waits up to `timeout` seconds for the next scan, returning the paths of the
+        files that have been added since the last one."""
+
+        wait = self.next_scan - monotonic()
+
+        if wait > timeout:
+            sleep(max(timeout, 0))
+            return []
+
+        if wait > 0:
+            sleep(wait)
+
+        result, self.manifest = scan_changes(self.top, self.manifest)
+        self.next_scan = monotonic() + self.interval
+
+        return result.added
+
+    def close(self) -> None:
+        """Nothing to release."""
+
+
+class TiffWatcher:
+    """Watches a `/TIFF` tree, emitting a `WatchEvent` to each new `.tif` and `.xml`
+    asset. Just assets created after the watcher are emitted.
+
+    Events of the same asset are coalesced and an asset is just emitted after
+    `debounce` seconds without new events to it, then a burst of writes produces
+    a single event, after the asset has been completely written.
+
+    inotify is used if it is available, otherwise (or if `use_inotify` is `False`, or if
+    some directory cannot be watched) the tree is polled every `poll_interval` seconds.
+    Directories that cannot be watched later, and events lost by inotify, are found by
+    scanning the tree. Assets that cannot be decoded and errors watching the tree are
+    reported to the `onerror` callback, if it exists."""
+
+    def __init__(self, top: str, debounce: float = 0.5, poll_interval: float = 1.0,
+                 use_inotify: Optional[bool] = None,
+                 onerror: Optional[Callable[[Exception], None]] = None):
+        self.debounce = debounce
+        self.onerror = onerror
+        self.metrics = LatencyMetrics()
+        # asset path -> time of its last event, then events of the same asset are coalesced
+        self.pending: Dict[str, float] = {}
+
+        self.backend = None
+
+        if use_inotify is not False:
+            try:
+                self.backend = _InotifyBackend(top, onerror, poll_interval)
+            except (OSError, AttributeError):
+                # `AttributeError`: the C library does not have the inotify functions
+                if use_inotify:
+                    raise
+
+        if self.backend is None:
+            self.backend = _PollingBackend(top, poll_interval)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        self.close()
+
+    def __iter__(self) -> Iterator[WatchEvent]:
+        while True:
+            yield from self.poll(self.debounce)
+
+    def close(self) -> None:
+        """Stops watching the tree."""
+
+        self.backend.close()
+
+    def _create_event(self, path: str) -> Optional[WatchEvent]:
+        """Decodes an asset and builds its collection and item, returning its event."""
+
+        try:
+            metadata = decode_path(path)
+            collection, item = build_collection(metadata), build_item(metadata)
+            modified_at = stat(path).st_mtime
+        except (*DECODE_ERRORS, CDSRBuilderException, OSError) as error:
+            if self.onerror is not None:
+                self.onerror(error)
+            return None
+
+        latency = max(time() - modified_at, 0.0)
+        self.metrics.record(latency)
+
+        return WatchEvent(path, metadata, collection, item, latency)
+
+    def poll(self, timeout: float) -> List[WatchEvent]:
+        """Waits up to `timeout` seconds for new assets, returning their events as
+        soon as there is at least one asset whose events have been debounced."""
+
+        deadline = monotonic() + timeout
+
+        while True:
+            now = monotonic()
+            ready = [path for path, last_event in self.pending.items()
+                     if now - last_event >= self.debounce]
+
+            if ready:
+                events = []
+
+                for path in sorted(ready):
+                    del self.pending[path]
+                    event = self._create_event(path)
+
+                    if event is not None:
+                        events.append(event)
+
+                if events:
+                    return events
+
+            if now >= deadline:
+                return []
+
+            # wait for new events until the next pending asset is debounced
+            wait = deadline - now
+
+            if self.pending:
+                wait = min(wait, min(self.pending.values()) + self.debounce - now)
+
+            for path in self.backend.read(wait):
+                if splitext(path)[1].lower() in ASSET_EXTENSIONS:
+                    self.pending[path] = monotonic()
@@ -0,0 +1,104 @@
+"""Test cases related to the item aggregator."""
+
+
+from unittest import TestCase
+
+from src.cdsr_pack.aggregator import AssetName, ItemAsset, aggregate_collections, \
+                                     aggregate_items, decode_asset_name
+
+
+class TestCDSRPackAggregator(TestCase):
+    """TestCDSRPackAggregator"""
+
+    scene_dir = '/TIFF/CBERS4/2020_07/CBERS_4_MUX_DRD_2020_07_31.13_07_00_CB11/155_103_0/'
+
+    paths = [
+        scene_dir + '2_BC_UTM_WGS84/CBERS_4_MUX_20200731_155_103_L2_BAND5.tif',
+        scene_dir + '2_BC_UTM_WGS84/CBERS_4_MUX_20200731_155_103_L2_BAND5.xml',
+        scene_dir + '2_BC_UTM_WGS84/CBERS_4_MUX_20200731_155_103_L2_BAND6.tif',
+        scene_dir + '2_BC_UTM_WGS84/bad_asset',
+        scene_dir + '4_BC_UTM_WGS84/CBERS_4_MUX_20200731_155_103_L4_BAND5.tif',
+        scene_dir + '4_BC_UTM_WGS84/CBERS_4_MUX_20200731_155_103_L4_BAND5_GRID_SURFACE.tif',
+        scene_dir + '4_BC_UTM_WGS84/CBERS_4_MUX_20200731_155_103_L4_EVI.tif',
+        scene_dir + '4_BC_UTM_WGS84'
+    ]
+
+    def test__decode_asset_name(self):
+        """Tests decoding bands and products from asset file names."""
+
+        self.assertEqual(AssetName('BAND5', None, 'tif'),
+                         decode_asset_name('CBERS_4A_MUX_20210101_209_110_L4_BAND5.tif'))
+        self.assertEqual(AssetName('BAND5', 'GRID_SURFACE', 'tif'), decode_asset_name(
+            'CBERS_4A_MUX_20210101_209_110_L4_BAND5_GRID_SURFACE.tif'
+        ))
+        self.assertEqual(AssetName(None, 'NDVI', 'tif'),
+                         decode_asset_name('CBERS_4_MUX_20200731_155_103_L4_NDVI.tif'))
+        self.assertEqual(AssetName('BAND1', None, 'xml'),
+                         decode_asset_name('CBERS_2B_HRC_20100301_151_B_141_5_L2_BAND1.xml'))
+        self.assertEqual(AssetName(None, None, 'xml'),
+                         decode_asset_name('CBERS_4_MUX_20200731_155_103_L2.xml'))
+        # assets without geo. processing part, which `decode_path` decodes as well
+        self.assertEqual(AssetName(None, None, 'png'),
+                         decode_asset_name('CBERS_4_PAN10M_20210201_073_113.png'))
+
+    def test__aggregate_items(self):
+        """Tests grouping assets into items and collections."""
+
+        errors = []
+
+        for ordered in (True, False):
+            items = list(aggregate_items(reversed(self.paths) if not ordered else self.paths,
+                                         ordered=ordered, onerror=errors.append))
+
+            self.assertEqual([('CBERS4_MUX_L2_DN', 3), ('CBERS4_MUX_L4_DN', 1),
+                              ('CBERS4_MUX_L4_SR', 2)],
+                             sorted((item.collection, len(item.assets)) for item in items))
+            self.assertTrue(all(item.item == 'CBERS4_MUX_155103_20200731_CB11'
+                                for item in items))
+
+            item = next(item for item in items if item.collection == 'CBERS4_MUX_L4_SR')
+
+            self.assertEqual('2020-07-31', item.metadata.date)
+            self.assertEqual(
+                {ItemAsset(self.paths[5], 'BAND5', 'GRID_SURFACE', 'tif'),
+                 ItemAsset(self.paths[6], None, 'EVI', 'tif')},
+                set(item.assets)
+            )
+
+        self.assertEqual(['An asset must have an extension.',
+                          f'Just assets can be grouped into items, not directories: '
+                          f'`{self.paths[7]}`.'] * 2,
+                         sorted(map(str, errors[:2])) + sorted(map(str, errors[2:])))
+
+        quicklook = ('/TIFF/CBERS4/2021_02/CBERS_4_PAN10M_DRD_2021_02_02.01_32_45_CB11/'
+                     '073_113_0/2_BC_UTM_WGS84/CBERS_4_PAN10M_20210201_073_113.png')
+        errors = []
+        items = list(aggregate_items([quicklook], onerror=errors.append))
+
+        self.assertEqual([], errors)
+        self.assertEqual([('CBERS4_PAN10M_L2_DN', 'CBERS4_PAN10M_073113_20210201_CB11',
+                           [ItemAsset(quicklook, None, None, 'png')])],
+                         [(item.collection, item.item, item.assets) for item in items])
+
+        self.assertEqual({
+            'CBERS4_MUX_L2_DN': ['CBERS4_MUX_155103_20200731_CB11'],
+            'CBERS4_MUX_L4_DN': ['CBERS4_MUX_155103_20200731_CB11'],
+            'CBERS4_MUX_L4_SR': ['CBERS4_MUX_155103_20200731_CB11']
+        }, aggregate_collections(aggregate_items(self.paths)))
+
+    def test__aggregate_items__bounded_memory(self):
+        """Tests if the items of a directory are yielded as soon as it ends."""
+
+        def paths():
+            yield from self.paths[:3]
+            yield self.paths[4]
+            # the L2 item must have been yielded as soon as the next directory started
+            self.assertEqual(1, len(yielded))
+            yield from self.paths[5:7]
+
+        yielded = []
+
+        for item in aggregate_items(paths()):
+            yielded.append(item)
+
+        self.assertEqual(3, len(yielded))
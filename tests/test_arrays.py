@@ -0,0 +1,100 @@
+"""Test cases related to the NumPy structured array export."""
+
+
+from os.path import join
+from tempfile import TemporaryDirectory
+from unittest import TestCase, skipIf
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from src.cdsr_pack import decode_path, decode_paths
+
+if numpy is not None:
+    from src.cdsr_pack.arrays import columns_to_array, filter_mask, load_array, save_array, \
+                                     to_array
+
+
+@skipIf(numpy is None, 'NumPy is not installed.')
+class TestCDSRPackArrays(TestCase):
+    """TestCDSRPackArrays"""
+
+    paths = [
+        ('/TIFF/CBERS4A/2021_01/CBERS_4A_WFI_RAW_2021_01_01.13_48_30_ETC2/215_120_0/'
+         '4_BC_UTM_WGS84/CBERS_4A_WFI_20210101_215_120_L4_BAND13.tif'),
+        ('/TIFF/CBERS4A/2021_04/CBERS_4A_WFI_RAW_2021_04_01.13_48_30_ETC2/215_140_0/'
+         '4_BC_UTM_WGS84/CBERS_4A_WFI_20210401_215_140_L4_BAND13.tif'),
+        ('/TIFF/CBERS4A/2021_02/CBERS_4A_MUX_RAW_2021_02_01.13_48_30_ETC2/209_110_0/'
+         '2_BC_UTM_WGS84/CBERS_4A_MUX_20210201_209_110_L2_BAND5.tif'),
+        # invalid path, which is skipped
+        '/TIFF/bad/path',
+        '/TIFF/LANDSAT1/1973_05/LANDSAT1_MSS_19730521.120000/237_059_0/2_BC_UTM_WGS84'
+    ]
+
+    def test__arrays__conversion(self):
+        """Tests if records are the same ones from `decode_path` and `decode_paths`."""
+
+        valid_paths = self.paths[:3] + self.paths[4:]
+        expected = [decode_path(path, record=True) for path in valid_paths]
+
+        # dicts whose keys are in another order (e.g. loaded from JSON) are read by key
+        reordered = [dict(reversed(decode_path(path).items())) for path in valid_paths]
+
+        for catalog in (to_array(decode_path(path) for path in valid_paths),
+                        to_array(reordered), to_array(expected),
+                        columns_to_array(decode_paths(self.paths))):
+            self.assertEqual(4, len(catalog.records))
+            self.assertEqual(expected, [catalog.decode(index) for index in range(4)])
+
+        self.assertEqual(numpy.datetime64('2021-01-01'), catalog.records['date'][0])
+        self.assertTrue(numpy.isnat(catalog.records['date'][3]))
+        self.assertEqual(59, catalog.records['row'][3])
+        self.assertEqual(['DN', None], catalog.categories['radio_processing'])
+
+        self.assertEqual(0, len(to_array([]).records))
+
+    def test__arrays__filters(self):
+        """Tests vectorized filters."""
+
+        catalog = columns_to_array(decode_paths(self.paths))
+
+        self.assertEqual([True, False, False, False], filter_mask(
+            catalog, satellite='CBERS4A', sensor='WFI', row=(100, 130),
+            start_date='2021-01-01', end_date='2021-03-31'
+        ).tolist())
+        self.assertEqual([False, False, True, True],
+                         filter_mask(catalog, sensor=['MUX', 'MSS', 'XYZ']).tolist())
+        self.assertEqual([False] * 4, filter_mask(catalog, satellite='AMAZONIA1').tolist())
+        self.assertEqual([True, True, False, False], filter_mask(catalog, path='215').tolist())
+
+        filtered = catalog.filter(date=('2021-02-01', '2021-12-31'))
+        self.assertEqual(['2021-04-01', '2021-02-01'],
+                         [filtered.decode(index).date for index in range(2)])
+
+        with self.assertRaises(ValueError) as error:
+            filter_mask(catalog, year=2021)
+
+        self.assertEqual('Invalid filters: `year`. Available filters: `satellite, sensor, path, '
+                         'row, date, geo_processing, radio_processing, antenna, start_date, '
+                         'end_date`.', str(error.exception))
+
+    def test__arrays__save_and_load(self):
+        """Tests saving a catalog and memory-mapping it back."""
+
+        catalog = columns_to_array(decode_paths(self.paths))
+
+        with TemporaryDirectory() as temp_dir:
+            file_path = join(temp_dir, 'catalog.npy')
+            save_array(file_path, catalog)
+
+            for mmap in (True, False):
+                loaded = load_array(file_path, mmap=mmap)
+
+                self.assertEqual(isinstance(loaded.records, numpy.memmap), mmap)
+                self.assertEqual(catalog.categories, loaded.categories)
+                self.assertEqual(catalog.records.tolist(), loaded.records.tolist())
+                self.assertEqual(catalog.decode(0), loaded.decode(0))
+
+                del loaded
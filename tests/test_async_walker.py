@@ -0,0 +1,137 @@
+"""Test cases related to the asyncio `/TIFF` tree walker."""
+
+
+from asyncio import run
+from os.path import join
+from tempfile import TemporaryDirectory
+from threading import Lock, Thread
+from time import sleep
+from unittest import TestCase
+from unittest.mock import patch
+
+from src.cdsr_pack import decode_path, walk_tiff, walk_tiff_async
+from src.cdsr_pack import async_walker
+
+# the test case is not imported by name, otherwise its tests would run twice
+import test_walker
+from test_walker import create_tree
+
+
+VALID_ASSETS = test_walker.TestCDSRPackWalkTIFF.valid_assets
+INVALID_RESOURCES = test_walker.TestCDSRPackWalkTIFF.invalid_resources
+
+
+async def collect(top, **kwargs):
+    """Returns all results of `walk_tiff_async`."""
+
+    return [result async for result in walk_tiff_async(top, **kwargs)]
+
+
+class TestCDSRPackWalkTIFFAsync(TestCase):
+    """TestCDSRPackWalkTIFFAsync"""
+
+    def test__walk_tiff_async(self):
+        """Tests if `walk_tiff_async` yields the same assets and reports the same
+        errors as `walk_tiff`."""
+
+        with TemporaryDirectory() as temp_dir:
+            top = join(temp_dir, 'TIFF')
+            create_tree(top, VALID_ASSETS + INVALID_RESOURCES)
+
+            errors, async_errors = [], []
+
+            for concurrency in (1, 4):
+                async_errors.clear()
+
+                self.assertEqual(sorted(walk_tiff(top, onerror=errors.append)),
+                                 sorted(run(collect(top, concurrency=concurrency,
+                                                    onerror=async_errors.append))))
+                self.assertEqual(sorted(map(str, errors)), sorted(map(str, async_errors)))
+
+                errors.clear()
+
+    def test__walk_tiff_async__concurrency(self):
+        """Tests if up to `concurrency` directories are listed at once."""
+
+        lock = Lock()
+        listing = [0, 0]  # current and max. number of directories being listed
+        list_entries = async_walker._list_entries  # pylint: disable=protected-access
+
+        def slow_list_entries(*args):
+            with lock:
+                listing[0] += 1
+                listing[1] = max(listing)
+
+            # the latency of a network filesystem
+            sleep(0.02)
+
+            with lock:
+                listing[0] -= 1
+
+            return list_entries(*args)
+
+        with TemporaryDirectory() as temp_dir:
+            top = join(temp_dir, 'TIFF')
+            create_tree(top, [f'CBERS4A/2021_{month:02d}/' for month in range(1, 13)])
+
+            with patch.object(async_walker, '_list_entries', slow_list_entries):
+                self.assertEqual([], run(collect(top, concurrency=8)))
+
+        self.assertEqual(8, listing[1])
+
+    def test__walk_tiff_async__errors(self):
+        """Tests a missing top directory, errors raised by `onerror` and stopping early."""
+
+        with TemporaryDirectory() as temp_dir:
+            errors = []
+
+            self.assertEqual([], run(collect(join(temp_dir, 'TIFF'), onerror=errors.append)))
+            self.assertEqual(1, len(errors))
+            self.assertIsInstance(errors[0], FileNotFoundError)
+
+            def raise_error(error):
+                raise error
+
+            with self.assertRaises(FileNotFoundError):
+                run(collect(join(temp_dir, 'TIFF'), onerror=raise_error))
+
+            with self.assertRaises(ValueError):
+                run(collect(temp_dir, concurrency=0))
+
+            top = join(temp_dir, 'TIFF')
+            create_tree(top, VALID_ASSETS)
+
+            async def first():
+                async for result in walk_tiff_async(top):
+                    return result
+
+            path, metadata = run(first())
+            self.assertIn(path, [join(top, asset) for asset in VALID_ASSETS])
+            self.assertEqual(decode_path(path), metadata)
+
+    def test__walk_tiff_async__break(self):
+        """Tests if the walk returns when the iteration is stopped early, while the
+        workers are still listing directories."""
+
+        with TemporaryDirectory() as temp_dir:
+            top = join(temp_dir, 'TIFF')
+            create_tree(top, VALID_ASSETS)
+
+            results = []
+
+            async def first_results():
+                async for result in walk_tiff_async(top, concurrency=4):
+                    results.append(result)
+                    break
+
+            def run_walks():
+                for _ in range(20):
+                    run(first_results())
+
+            # the walks run in another thread, then a hung walk fails the test
+            thread = Thread(target=run_walks, daemon=True)
+            thread.start()
+            thread.join(timeout=30)
+
+            self.assertFalse(thread.is_alive())
+            self.assertEqual(20, len(results))
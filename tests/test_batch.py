@@ -0,0 +1,142 @@
+"""Test cases related to batch decoding and building."""
+
+
+from unittest import TestCase
+
+from src.cdsr_pack import CDSRBuilderException, CDSRDecoderException, build_collection, \
+                          build_collections, build_item, build_items, decode_path, decode_paths
+
+
+class TestCDSRPackDecodePaths(TestCase):
+    """TestCDSRPackDecodePaths"""
+
+    def test__decode_paths__columns(self):
+        """Tests if `decode_paths` returns the same metadata and errors as `decode_path`,
+        organized by column."""
+
+        paths = [
+            ('/TIFF/CBERS4A/2021_01/CBERS_4A_MUX_RAW_2021_01_01.13_48_30_ETC2/'
+             '209_110_0/2_BC_UTM_WGS84/CBERS_4A_MUX_20210101_209_110_L2_BAND5.tif'),
+            # invalid antenna
+            ('/TIFF/AMAZONIA1/2021_03/AMAZONIA_1_WFI_DRD_2021_03_03.12_57_40'
+             '/217_015_0/2_BC_LCC_WGS84/AMAZONIA_1_WFI_20210303_217_015_L2_BAND4.tif'),
+            # level 6 path
+            '/TIFF/CBERS2B/2010_03/CBERS2B_HRC_20100301.130915/151_B_141_5_0/2_BC_UTM_WGS84',
+            # invalid type
+            None,
+            # invalid level
+            '/',
+            # scene directory without a dot
+            '/TIFF/CBERS4A/2021_01/CBERS_4A/209_110_0/2_BC_UTM_WGS84',
+            ('/TIFF/LANDSAT1/1973_05/LANDSAT1_MSS_19730521.120000/237_059_0/'
+             '2_BC_UTM_WGS84/LANDSAT_1_MSS_19730521_237_059_L2_BAND4.xml')
+        ]
+
+        # `decode_paths` accepts any iterable
+        columns = decode_paths(iter(paths))
+
+        self.assertEqual(['satellite', 'sensor', 'path', 'row', 'date', 'geo_processing',
+                          'radio_processing', 'antenna', 'error'], list(columns))
+
+        for key, column in columns.items():
+            self.assertEqual(len(paths), len(column), key)
+
+        for index, path in enumerate(paths):
+            try:
+                expected_metadata = decode_path(path)
+                expected_error = None
+            except (CDSRDecoderException, ValueError) as error:
+                expected_metadata = dict.fromkeys(['satellite', 'sensor', 'path', 'row', 'date',
+                                                   'geo_processing', 'radio_processing',
+                                                   'antenna'])
+                expected_error = str(error)
+
+            self.assertEqual(expected_error, columns['error'][index])
+            self.assertEqual(expected_metadata,
+                             {key: columns[key][index] for key in expected_metadata})
+
+        self.assertEqual([None, 'Invalid antenna in scene_dir: '
+                                '`AMAZONIA_1_WFI_DRD_2021_03_03.12_57_40`.', None,
+                          "Path must be a str, not a `<class 'NoneType'>`.",
+                          'Invalid `1` level to path: ``.'],
+                         columns['error'][:5])
+
+    def test__decode_paths__empty(self):
+        """Tests if `decode_paths` returns empty columns when there are no paths."""
+
+        self.assertEqual({'satellite': [], 'sensor': [], 'path': [], 'row': [], 'date': [],
+                          'geo_processing': [], 'radio_processing': [], 'antenna': [],
+                          'error': []},
+                         decode_paths([]))
+
+
+class TestCDSRPackBuildIDs(TestCase):
+    """TestCDSRPackBuildIDs"""
+
+    paths = [
+        ('/TIFF/CBERS4A/2021_01/CBERS_4A_MUX_RAW_2021_01_01.13_48_30_ETC2/'
+         '209_110_0/2_BC_UTM_WGS84/CBERS_4A_MUX_20210101_209_110_L2_BAND5.tif'),
+        # level 6 path, without date and radio. processing
+        '/TIFF/CBERS2B/2010_03/CBERS2B_HRC_20100301.130915/151_B_141_5_0/2_BC_UTM_WGS84',
+        # invalid level, then all values are `None`
+        '/',
+        ('/TIFF/LANDSAT1/1973_05/LANDSAT1_MSS_19730521.120000/237_059_0/'
+         '4_BC_UTM_WGS84/LANDSAT_1_MSS_19730521_237_059_L4_NDVI.xml')
+    ]
+
+    def test__build_ids__columns(self):
+        """Tests if `build_collections` and `build_items` return the same IDs and errors
+        as `build_collection` and `build_item`."""
+
+        columns = decode_paths(self.paths)
+
+        for batch_build, build in ((build_collections, build_collection),
+                                   (build_items, build_item)):
+            expected_ids, expected_errors = [], []
+
+            for index in range(len(self.paths)):
+                try:
+                    expected_ids.append(build({key: column[index]
+                                               for key, column in columns.items()}))
+                    expected_errors.append(None)
+                except CDSRBuilderException as error:
+                    expected_ids.append(None)
+                    expected_errors.append(str(error))
+
+            self.assertEqual((expected_ids, expected_errors), batch_build(columns))
+
+        self.assertEqual(['CBERS4A_MUX_L2_DN', None, None, 'LANDSAT1_MSS_L4_SR'],
+                         build_collections(columns)[0])
+
+    def test__build_ids__numpy_columns(self):
+        """Tests building IDs from NumPy string arrays."""
+
+        try:
+            import numpy  # pylint: disable=import-outside-toplevel
+        except ImportError:
+            self.skipTest('NumPy is not installed.')
+
+        columns = decode_paths(self.paths[:1] + self.paths[3:])
+        del columns['error']
+        columns = {key: numpy.array(column) for key, column in columns.items()}
+
+        self.assertEqual((['CBERS4A_MUX_L2_DN', 'LANDSAT1_MSS_L4_SR'], [None, None]),
+                         build_collections(columns))
+        self.assertEqual((['CBERS4A_MUX_209110_20210101_ETC2',
+                           'LANDSAT1_MSS_237059_19730521_ND'], [None, None]),
+                         build_items(columns))
+
+    def test__build_ids__errors(self):
+        """Tests invalid columns."""
+
+        for columns, message in (
+            ([], "Metadata must be a dict, not a `<class 'list'>`."),
+            ({'satellite': [], 'sensor': []},
+             'Missing keys inside metadata: `geo_processing, radio_processing`.'),
+            ({'satellite': ['CBERS4A'], 'sensor': ['MUX'], 'geo_processing': ['2'],
+              'radio_processing': []}, 'All metadata columns must have the same length.')
+        ):
+            with self.assertRaises(CDSRBuilderException) as error:
+                build_collections(columns)
+
+            self.assertEqual(message, str(error.exception))
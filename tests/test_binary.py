@@ -0,0 +1,80 @@
+"""Test cases related to the binary format of decoded metadata."""
+
+
+from os.path import getsize, join
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from src.cdsr_pack import decode_path
+from src.cdsr_pack.binary import BinaryReader, CDSRBinaryException, write_binary
+
+
+class TestCDSRPackBinary(TestCase):
+    """TestCDSRPackBinary"""
+
+    paths = [
+        ('/TIFF/AMAZONIA1/2021_03/AMAZONIA_1_WFI_DRD_2021_03_03.12_57_40_CB11/217_015_0/'
+         '2_BC_LCC_WGS84/AMAZONIA_1_WFI_20210303_217_015_L2_BAND4.tif'),
+        '/TIFF/CBERS2B/2010_03/CBERS2B_HRC_20100301.130915/151_B_141_5_0/2_BC_UTM_WGS84',
+        ('/TIFF/CBERS4/2020_07/CBERS_4_MUX_DRD_2020_07_31.13_07_00_CB11/155_103_0/'
+         '4_BC_UTM_WGS84/CBERS_4_MUX_20200731_155_103_L4_BAND5_GRID_SURFACE.tif'),
+        ('/TIFF/LANDSAT1/1973_05/LANDSAT1_MSS_19730521.120000/237_059_0/2_BC_UTM_WGS84/'
+         'LANDSAT_1_MSS_19730521_237_059_L2_BAND4.tif')
+    ]
+
+    def test__binary__round_trip(self):
+        """Tests if records are read back exactly as they have been written."""
+
+        records = [decode_path(path, record=True) for path in self.paths]
+
+        with TemporaryDirectory() as temp_dir:
+            file_path = join(temp_dir, 'catalog.bin')
+
+            # dicts and records are accepted
+            self.assertEqual(4, write_binary(file_path, [decode_path(self.paths[0])] +
+                                             records[1:]))
+            # header, 13 bytes per record and the dictionaries
+            self.assertLess(getsize(file_path), 26 + 4 * 13 + 200)
+
+            with BinaryReader(file_path) as reader:
+                self.assertEqual(4, len(reader))
+                self.assertEqual(records, list(reader))
+                self.assertEqual(records, reader.read_all())
+                self.assertEqual(records[1], reader[1])
+                self.assertEqual(records[-1], reader[-1])
+
+                with self.assertRaises(IndexError):
+                    reader[4]  # pylint: disable=pointless-statement
+
+    def test__binary__errors(self):
+        """Tests values that cannot be stored and invalid files."""
+
+        record = decode_path(self.paths[0], record=True)
+
+        with TemporaryDirectory() as temp_dir:
+            file_path = join(temp_dir, 'catalog.bin')
+
+            with self.assertRaises(CDSRBinaryException) as error:
+                write_binary(file_path, [record._replace(path='2170')])
+
+            self.assertEqual('Invalid path to be stored: `2170`. It must have three digits.',
+                             str(error.exception))
+
+            with self.assertRaises(CDSRBinaryException) as error:
+                write_binary(file_path, [record._replace(sensor=str(index))
+                                         for index in range(257)])
+
+            self.assertEqual('There are more than 256 `sensor` values.', str(error.exception))
+
+            with open(file_path, 'wb') as file:
+                file.write(b'{"records": []}' * 4)
+
+            with self.assertRaises(CDSRBinaryException):
+                BinaryReader(file_path)
+
+            # files shorter than the header, e.g. an empty one
+            with open(file_path, 'wb') as file:
+                pass
+
+            with self.assertRaises(CDSRBinaryException):
+                BinaryReader(file_path)
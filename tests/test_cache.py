@@ -0,0 +1,95 @@
+"""Test cases related to the decoder cache."""
+
+
+from unittest import TestCase
+
+from src.cdsr_pack import CDSRDecoderException, decode_path, decoder
+from src.cdsr_pack.cache import CacheInfo, cache_info, clear_cache, disable_cache, enable_cache
+
+
+class TestCDSRPackCache(TestCase):
+    """TestCDSRPackCache"""
+
+    asset_path = ('/TIFF/CBERS4A/2021_01/CBERS_4A_MUX_RAW_2021_01_01.13_48_30_ETC2/'
+                  '209_110_0/2_BC_UTM_WGS84/CBERS_4A_MUX_20210101_209_110_L2_BAND5.tif')
+
+    expected_metadata = {
+        'satellite': 'CBERS4A', 'sensor': 'MUX', 'path': '209', 'row': '110',
+        'date': '2021-01-01', 'geo_processing': '2', 'radio_processing': 'DN',
+        'antenna': 'ETC2'
+    }
+
+    def tearDown(self):
+        disable_cache()
+
+    def test__cache__hits_and_misses(self):
+        """Tests if the cache counts hits and misses, keeping the same results."""
+
+        enable_cache(maxsize=10)
+
+        self.assertEqual(self.expected_metadata, decode_path(self.asset_path))
+        self.assertEqual(self.expected_metadata, decode_path(self.asset_path))
+
+        info = cache_info()
+
+        # `extract_data_from_scene_dir` is just called when `decode_scene_dir` is not cached
+        self.assertEqual(CacheInfo(hits=0, misses=1, evictions=0, maxsize=10, currsize=1),
+                         info['extract_data_from_scene_dir'])
+
+        for name in ('decode_scene_dir', 'decode_path_row_dir', 'decode_geo_processing_dir'):
+            self.assertEqual(CacheInfo(hits=1, misses=1, evictions=0, maxsize=10, currsize=1),
+                             info[name])
+
+        clear_cache()
+
+        self.assertEqual(CacheInfo(hits=0, misses=0, evictions=0, maxsize=10, currsize=0),
+                         cache_info()['decode_scene_dir'])
+
+    def test__cache__errors_are_not_cached(self):
+        """Tests if failed calls raise the same error every time."""
+
+        enable_cache()
+
+        for _ in range(2):
+            with self.assertRaises(CDSRDecoderException) as error:
+                decoder.decode_path_row_dir('209_110_0_1')
+
+            self.assertEqual('Path/row directory cannot be decoded: `209_110_0_1`.',
+                             str(error.exception))
+
+        self.assertEqual(CacheInfo(hits=0, misses=2, evictions=0, maxsize=4096, currsize=0),
+                         cache_info()['decode_path_row_dir'])
+
+    def test__cache__evictions(self):
+        """Tests if the least recently used results are evicted."""
+
+        enable_cache(maxsize=2)
+
+        for geo_processing_dir in ('2_BC_UTM_WGS84', '3_BC_UTM_WGS84', '2_BC_UTM_WGS84',
+                                   '4_BC_UTM_WGS84', '2_BC_UTM_WGS84', '3_BC_UTM_WGS84'):
+            decoder.decode_geo_processing_dir(geo_processing_dir)
+
+        # `3_...` is evicted by `4_...` and then `4_...` is evicted by `3_...` again
+        self.assertEqual(CacheInfo(hits=2, misses=4, evictions=2, maxsize=2, currsize=2),
+                         cache_info()['decode_geo_processing_dir'])
+
+    def test__cache__disable(self):
+        """Tests if disabling the cache restores the original functions."""
+
+        original_function = decoder.decode_scene_dir
+
+        enable_cache()
+        self.assertIsNot(original_function, decoder.decode_scene_dir)
+
+        # enabling it again just recreates the cache
+        enable_cache(maxsize=1)
+        self.assertEqual(1, cache_info()['decode_scene_dir'].maxsize)
+
+        disable_cache()
+        self.assertIs(original_function, decoder.decode_scene_dir)
+        self.assertEqual({}, cache_info())
+
+        with self.assertRaises(ValueError) as error:
+            enable_cache(maxsize=0)
+
+        self.assertEqual('Cache size must be a positive int, not `0`.', str(error.exception))
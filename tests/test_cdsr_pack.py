@@ -1,8 +1,12 @@
 """Test cases related to other behaviors."""
 
 
+from os.path import dirname
+from subprocess import run
+from sys import executable
 from unittest import TestCase
 
+from src import cdsr_pack
 from src.cdsr_pack import CDSRBuilderException, CDSRDecoderException, \
                           build_collection, build_item, decode_path
 
@@ -198,3 +202,24 @@ class TestCDSRPackErrors(TestCase):
                 build_item(test_case['metadata'])
 
             self.assertEqual(test_case['expected_build_item_error'], str(error.exception))
+
+    def test__lazy_imports(self):
+        """Tests if importing the package does not import the heavy modules, which are
+        just imported when their names are used."""
+
+        code = (
+            'import sys; import src.cdsr_pack as cdsr_pack; '
+            'heavy = ["sqlite3", "multiprocessing", "asyncio", "ctypes", "concurrent.futures"]; '
+            'print([name for name in heavy if name in sys.modules]); '
+            'print(cdsr_pack.CatalogIndex.__module__, cdsr_pack.walk_tiff.__module__); '
+            'print("sqlite3" in sys.modules, "TiffWatcher" in dir(cdsr_pack))'
+        )
+
+        result = run([executable, '-c', code], cwd=dirname(dirname(__file__)),
+                     capture_output=True, text=True, check=True)
+
+        self.assertEqual('[]\nsrc.cdsr_pack.index src.cdsr_pack.walker\nTrue True\n',
+                         result.stdout)
+
+        with self.assertRaises(AttributeError):
+            getattr(cdsr_pack, 'walk_tiff_sync')
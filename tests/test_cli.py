@@ -0,0 +1,110 @@
+"""Test cases related to the `cdsr-pack` command."""
+
+
+from contextlib import redirect_stderr
+from csv import reader as csv_reader
+from io import StringIO
+from json import loads
+from os.path import join
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from src.cdsr_pack.cli import main
+
+
+class TestCDSRPackCLI(TestCase):
+    """TestCDSRPackCLI"""
+
+    paths = [
+        ('/TIFF/CBERS4A/2021_01/CBERS_4A_MUX_RAW_2021_01_01.13_48_30_ETC2/'
+         '209_110_0/2_BC_UTM_WGS84/CBERS_4A_MUX_20210101_209_110_L2_BAND5.tif'),
+        '/TIFF/bad/path',
+        '',
+        '/TIFF/CBERS2B/2010_03/CBERS2B_HRC_20100301.130915/151_B_141_5_0/2_BC_UTM_WGS84'
+    ]
+
+    expected_metadata = [
+        {
+            'satellite': 'CBERS4A', 'sensor': 'MUX', 'path': '209', 'row': '110',
+            'date': '2021-01-01', 'geo_processing': '2', 'radio_processing': 'DN',
+            'antenna': 'ETC2'
+        },
+        {
+            'satellite': 'CBERS2B', 'sensor': 'HRC', 'path': '151', 'row': '141',
+            'date': None, 'geo_processing': '2', 'radio_processing': None,
+            'antenna': 'ND'
+        }
+    ]
+
+    def run_main(self, *args):
+        """Runs the command with the paths as input, returning its output and errors."""
+
+        with TemporaryDirectory() as temp_dir:
+            input_path = join(temp_dir, 'paths.txt')
+            output_path = join(temp_dir, 'output')
+            errors_path = join(temp_dir, 'errors.txt')
+
+            with open(input_path, 'w', encoding='utf-8') as file:
+                file.write('\n'.join(self.paths) + '\n')
+
+            self.assertEqual(0, main([input_path, '-o', output_path, '-e', errors_path,
+                                      '-c', '1', *args]))
+
+            with open(output_path, encoding='utf-8') as file:
+                output = file.read()
+
+            with open(errors_path, encoding='utf-8') as file:
+                errors = file.read()
+
+        return output, errors
+
+    def test__cli__jsonl(self):
+        """Tests the JSON lines output, decoding paths in parallel as well."""
+
+        for args in ([], ['--workers', '2'], ['--engine', 'split']):
+            output, errors = self.run_main(*args)
+
+            self.assertEqual([
+                {
+                    'source_path': self.paths[0], 'collection': 'CBERS4A_MUX_L2_DN',
+                    'item': 'CBERS4A_MUX_209110_20210101_ETC2', **self.expected_metadata[0]
+                },
+                # collection and item cannot be built to paths without asset
+                {
+                    'source_path': self.paths[3], 'collection': None, 'item': None,
+                    **self.expected_metadata[1]
+                }
+            ], [loads(line) for line in output.splitlines()])
+
+            self.assertEqual('/TIFF/bad/path\tInvalid `3` level to path: `/TIFF/bad/path`.\n',
+                             errors)
+
+    def test__cli__csv(self):
+        """Tests the CSV output, without building collections and items."""
+
+        output, errors = self.run_main('--format', 'csv', '--decode-only', '--ignore-errors')
+
+        rows = list(csv_reader(output.splitlines()))
+
+        self.assertEqual(['source_path', 'satellite', 'sensor', 'path', 'row', 'date',
+                          'geo_processing', 'radio_processing', 'antenna'], rows[0])
+        self.assertEqual([self.paths[0], *self.expected_metadata[0].values()], rows[1])
+        # `None` values are empty
+        self.assertEqual([self.paths[3], 'CBERS2B', 'HRC', '151', '141', '', '2', '', 'ND'],
+                         rows[2])
+        self.assertEqual(3, len(rows))
+        self.assertEqual('', errors)
+
+    def test__cli__invalid_arguments(self):
+        """Tests if invalid chunk sizes and numbers of workers are rejected."""
+
+        for args, message in [(['-c', '0'], '-c/--chunk-size: must be at least 1, not 0'),
+                              (['-c', '-5'], '-c/--chunk-size: must be at least 1, not -5'),
+                              (['-w', '-1'], '-w/--workers: must be at least 0, not -1')]:
+            stderr = StringIO()
+
+            with self.assertRaises(SystemExit) as error, redirect_stderr(stderr):
+                main(['-', *args])
+
+            self.assertEqual(2, error.exception.code)
+            self.assertIn(message, stderr.getvalue())
@@ -0,0 +1,130 @@
+"""Test cases related to the encoder, which is the reverse of the decoder."""
+
+
+from os.path import dirname, join
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from src.cdsr_pack import build_collection, build_item, decode_path
+from src.cdsr_pack.encoder import CDSREncoderException, decode_collection_id, \
+                                  decode_item_id, encode_dir_prefixes, \
+                                  encode_scene_dir_prefixes, find_dirs
+
+from test_walker import create_tree
+
+
+class TestCDSRPackEncoder(TestCase):
+    """TestCDSRPackEncoder"""
+
+    assets = [
+        ('/TIFF/AMAZONIA1/2021_03/AMAZONIA_1_WFI_DRD_2021_03_03.12_57_40_CB11/217_015_0/'
+         '2_BC_LCC_WGS84/AMAZONIA_1_WFI_20210303_217_015_L2_BAND4.tif'),
+        ('/TIFF/CBERS2B/2010_03/CBERS2B_HRC_20100301.130915/151_B_141_5_0/2_BC_UTM_WGS84/'
+         'CBERS_2B_HRC_20100301_151_B_141_5_L2_BAND1.tif'),
+        ('/TIFF/CBERS4/2020_07/CBERS_4_MUX_DRD_2020_07_31.13_07_00_CB11/155_103_0/'
+         '4_BC_UTM_WGS84/CBERS_4_MUX_20200731_155_103_L4_BAND5_GRID_SURFACE.tif'),
+        ('/TIFF/CBERS4A/2021_01/CBERS_4A_MUX_RAW_2021_01_01.13_48_30_ETC2/209_110_0/'
+         '2B_BC_UTM_WGS84/CBERS_4A_MUX_20210101_209_110_L2B_BAND5.tif'),
+        ('/TIFF/LANDSAT1/1973_05/LANDSAT1_MSS_19730521.120000/237_059_0/2_BC_UTM_WGS84/'
+         'LANDSAT_1_MSS_19730521_237_059_L2_BAND4.tif'),
+        # passes received after midnight, whose scene directory has got the next date
+        ('/TIFF/CBERS4A/2020_04/CBERS_4A_MUX_RAW_2020_04_23.01_24_22_CP5/266_023_0/'
+         '2_NN_UTM_WGS84/CBERS_4A_MUX_20200422_266_023_L2_BAND7.tif'),
+        ('/TIFF/CBERS4/2021_02/CBERS_4_PAN10M_DRD_2021_02_02.01_32_45_CB11/073_113_0/'
+         '2_BC_UTM_WGS84/CBERS_4_PAN10M_20210201_073_113_L2_BAND2.tif')
+    ]
+
+    def test__encode__round_trip(self):
+        """Tests if the prefixes built to the metadata, to the item and to the collection
+        of an asset are prefixes of the asset path."""
+
+        for asset in self.assets:
+            metadata = decode_path(asset)
+            item, collection = build_item(metadata), build_collection(metadata)
+
+            self.assertEqual({key: metadata[key] for key in decode_item_id(item)},
+                             decode_item_id(item))
+            self.assertEqual({key: metadata[key] for key in decode_collection_id(collection)},
+                             decode_collection_id(collection))
+
+            for value in (metadata, decode_path(asset, record=True), item):
+                self.assertTrue(any(asset.startswith(prefix)
+                                    for prefix in encode_dir_prefixes(value)), asset)
+
+            scene_dir = asset.split('/')[4]
+            self.assertTrue(any(scene_dir.startswith(prefix)
+                                for prefix in encode_scene_dir_prefixes(collection)))
+
+        self.assertEqual(['/TIFF/CBERS4A/2021_01/CBERS_4A_MUX_'],
+                         encode_dir_prefixes('CBERS4A_MUX_209110_20210101_ETC2'))
+        # the scene directory of the last day of a month may be inside the next month
+        self.assertEqual(['/TIFF/CBERS4A/2021_01/CBERS_4A_MUX_',
+                          '/TIFF/CBERS4A/2021_02/CBERS_4A_MUX_'],
+                         encode_dir_prefixes('CBERS4A_MUX_209110_20210131_ETC2'))
+        self.assertEqual(['CBERS2B_CCD_'],
+                         encode_scene_dir_prefixes({'satellite': 'CBERS2B', 'sensor': 'CCD',
+                                                    'date': '2010-03-01'}))
+
+    def test__encode__errors(self):
+        """Tests invalid items, collections and metadata."""
+
+        for value, message in (
+            ('CBERS4A_MUX_20210101', 'Invalid collection: `CBERS4A_MUX_20210101`.'),
+            ('CBERS4A_MUX_2091_202101_ETC2', 'Invalid item: `CBERS4A_MUX_2091_202101_ETC2`.'),
+            ({'satellite': 'SPOT5', 'sensor': 'HRG'}, 'Invalid satellite: `SPOT5`.'),
+            (['CBERS4A'], "Metadata must be a dict, a `Metadata` record or a str, not a "
+                          "`<class 'list'>`.")
+        ):
+            with self.assertRaises(CDSREncoderException) as error:
+                encode_scene_dir_prefixes(value)
+
+            self.assertEqual(message, str(error.exception))
+
+        with self.assertRaises(CDSREncoderException) as error:
+            encode_dir_prefixes('CBERS4A_MUX_L2_DN')
+
+        self.assertEqual('Date is mandatory to encode a directory path.', str(error.exception))
+
+    def test__find_dirs(self):
+        """Tests finding the directories of an item and of a metadata dict."""
+
+        with TemporaryDirectory() as temp_dir:
+            top = join(temp_dir, 'TIFF')
+            create_tree(top, [
+                'CBERS4A/2021_01/CBERS_4A_MUX_RAW_2021_01_01.13_48_30_ETC2/209_110_0/'
+                '2_BC_UTM_WGS84/',
+                'CBERS4A/2021_01/CBERS_4A_MUX_RAW_2021_01_01.13_48_30_ETC2/209_110_0/'
+                '4_BC_UTM_WGS84/',
+                'CBERS4A/2021_01/CBERS_4A_MUX_RAW_2021_01_01.13_48_30_ETC2/209_111_0/'
+                '2_BC_UTM_WGS84/',
+                # another antenna and another day
+                'CBERS4A/2021_01/CBERS_4A_MUX_RAW_2021_01_01.15_48_30_CP5/209_110_0/'
+                '2_BC_UTM_WGS84/',
+                'CBERS4A/2021_01/CBERS_4A_MUX_RAW_2021_01_03.13_48_30_ETC2/209_110_0/'
+                '2_BC_UTM_WGS84/',
+                # a pass received after midnight, with another processing type
+                'CBERS4A/2020_04/CBERS_4A_MUX_RAW_2020_04_23.01_24_22_CP5/266_023_0/'
+                '2_NN_UTM_WGS84/CBERS_4A_MUX_20200422_266_023_L2_BAND7.tif',
+                'CBERS4A/2020_05/CBERS_4A_MUX_XYZ_2020_05_01.01_24_22_CP5/266_023_0/'
+                '2_NN_UTM_WGS84/'
+            ])
+
+            scene_dir = join(top, 'CBERS4A/2021_01/CBERS_4A_MUX_RAW_2021_01_01.13_48_30_ETC2')
+
+            self.assertEqual([join(scene_dir, '209_110_0')],
+                             list(find_dirs('CBERS4A_MUX_209110_20210101_ETC2', top)))
+            self.assertEqual([join(scene_dir, '209_110_0', '4_BC_UTM_WGS84')],
+                             list(find_dirs({**decode_item_id('CBERS4A_MUX_209110_20210101_ETC2'),
+                                             'geo_processing': '4'}, top)))
+            self.assertEqual([], list(find_dirs('CBERS4A_MUX_209110_20210201_ETC2', top)))
+
+            asset = join(top, 'CBERS4A/2020_04/CBERS_4A_MUX_RAW_2020_04_23.01_24_22_CP5/'
+                              '266_023_0/2_NN_UTM_WGS84/CBERS_4A_MUX_20200422_266_023_L2_BAND7.tif')
+
+            self.assertEqual([join(top, 'CBERS4A/2020_04/CBERS_4A_MUX_RAW_2020_04_23.'
+                                        '01_24_22_CP5/266_023_0')],
+                             list(find_dirs('CBERS4A_MUX_266023_20200422_CP5', top)))
+            self.assertEqual([dirname(asset)], list(find_dirs(decode_path(asset), top)))
+            self.assertEqual([join(top, 'CBERS4A/2020_05/CBERS_4A_MUX_XYZ_2020_05_01.'
+                                        '01_24_22_CP5/266_023_0')],
+                             list(find_dirs('CBERS4A_MUX_266023_20200430_CP5', top)))
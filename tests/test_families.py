@@ -0,0 +1,235 @@
+"""Test cases related to the registry of scene directory layouts."""
+
+
+from json import dump
+from os import environ
+from os.path import dirname, join
+from subprocess import run
+from sys import executable
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from src.cdsr_pack import CDSRDecoderException, DecodeErrorCode, SceneDirLayout, \
+                          decode_path, decode_path_result, get_layouts, load_layouts, \
+                          register_layout, set_engine, unregister_layout
+from src.cdsr_pack.decoder import extract_data_from_scene_dir
+from src.cdsr_pack.encoder import CDSREncoderException, encode_dir_prefixes, find_dirs
+from src.cdsr_pack.families import AMAZONIA1_CBERS4_LAYOUT, CBERS2B_LANDSAT_LAYOUT, \
+                                   LAYOUTS_ENV, find_layout
+
+from test_walker import create_tree
+
+
+class TestCDSRPackFamilies(TestCase):
+    """TestCDSRPackFamilies"""
+
+    sentinel_layout = {
+        'name': 'SENTINEL2', 'prefixes': ['SENTINEL_2'],
+        'fields': ['satellite', 'satellite', 'sensor', 'date'],
+        'date_format': '%Y%m%d', 'time_format': '%H%M%S', 'antenna': 'ND'
+    }
+
+    sentinel_asset = ('/TIFF/SENTINEL2A/2021_01/SENTINEL_2A_MSI_20210101.103000/209_110_0/'
+                      '2_BC_UTM_WGS84/SENTINEL_2A_MSI_20210101_209_110_L2_BAND5.tif')
+
+    def tearDown(self):
+        set_engine('split')
+
+        for layout in get_layouts():
+            if layout.name not in ('AMAZONIA1_CBERS4', 'CBERS2B_LANDSAT'):
+                unregister_layout(layout.name)
+
+        for layout in (AMAZONIA1_CBERS4_LAYOUT, CBERS2B_LANDSAT_LAYOUT):
+            register_layout(layout, replace=True)
+
+    def test__find_layout(self):
+        """Tests if scene directories are dispatched to the layout of their family."""
+
+        self.assertEqual(['AMAZONIA1_CBERS4', 'CBERS2B_LANDSAT'],
+                         [layout.name for layout in get_layouts()])
+
+        for scene_dir_first, expected in [('AMAZONIA_1_WFI_DRD_2021_04_01', 'AMAZONIA1_CBERS4'),
+                                          ('CBERS_4A_MUX_RAW_2019_12_27', 'AMAZONIA1_CBERS4'),
+                                          ('CBERS2B_CCD_20070925', 'CBERS2B_LANDSAT'),
+                                          ('LANDSAT1_MSS_19750907', 'CBERS2B_LANDSAT')]:
+            self.assertEqual(expected, find_layout(scene_dir_first).name)
+
+        for scene_dir_first in ('', 'CBERS', 'SENTINEL_2A_MSI_20210101', 'cbers_4'):
+            self.assertIsNone(find_layout(scene_dir_first))
+
+        # the longest prefix wins, whatever the registration order is
+        register_layout(SceneDirLayout('CBERS4A', ('CBERS_4A',), ('satellite', 'satellite',
+                                       'sensor', None, '*date'), '%Y_%m_%d', '%H_%M_%S'))
+
+        self.assertEqual('CBERS4A', find_layout('CBERS_4A_MUX_RAW_2019_12_27').name)
+        self.assertEqual('AMAZONIA1_CBERS4', find_layout('CBERS_4_MUX_DRD_2020_07_31').name)
+
+    def test__register_layout(self):
+        """Tests if a registered family is decoded by all decoders, until it is
+        unregistered."""
+
+        layout = register_layout(self.sentinel_layout)
+
+        self.assertEqual(('SENTINEL_2',), layout.prefixes)
+        self.assertEqual(('SENTINEL2A', 'MSI', '2021-01-01', '10:30:00', 'ND'),
+                         extract_data_from_scene_dir('SENTINEL_2A_MSI_20210101.103000'))
+
+        expected = {
+            'satellite': 'SENTINEL2A', 'sensor': 'MSI', 'path': '209', 'row': '110',
+            'date': '2021-01-01', 'geo_processing': '2', 'radio_processing': 'DN',
+            'antenna': 'ND'
+        }
+
+        for engine in ('split', 'regex'):
+            set_engine(engine)
+            self.assertEqual(expected, decode_path(self.sentinel_asset))
+
+        self.assertTrue(decode_path_result(self.sentinel_asset).ok)
+
+        result = decode_path_result(self.sentinel_asset.replace('20210101.', '202101.'))
+        self.assertEqual(DecodeErrorCode.INVALID_RECEPTION_DATE, result.code)
+
+        unregister_layout('SENTINEL2')
+
+        with self.assertRaises(CDSRDecoderException) as error:
+            decode_path(self.sentinel_asset)
+
+        self.assertEqual('Invalid scene directory: `SENTINEL_2A_MSI_20210101.103000`.',
+                         str(error.exception))
+        self.assertEqual(DecodeErrorCode.INVALID_SCENE_DIR,
+                         decode_path_result(self.sentinel_asset).code)
+
+    def test__replace_built_in_layout(self):
+        """Tests if both engines decode by the registered layouts when the built-in ones
+        are replaced or overridden by a longer prefix."""
+
+        assets = [
+            ('/TIFF/CBERS2B/2010_03/CBERS2B_HRC_20100301.130915/151_B_141_5_0/2_BC_UTM_WGS84/'
+             'CBERS_2B_HRC_20100301_151_B_141_5_L2_BAND1.tif'),
+            ('/TIFF/CBERS4A/2021_01/CBERS_4A_MUX_RAW_2021_01_01.13_48_30_ETC2/209_110_0/'
+             '2_BC_UTM_WGS84/CBERS_4A_MUX_20210101_209_110_L2_BAND5.tif'),
+            ('/TIFF/CBERS4/2020_07/CBERS_4_MUX_DRD_2020_07_31.13_07_00_CB11/155_103_0/'
+             '4_BC_UTM_WGS84/CBERS_4_MUX_20200731_155_103_L4_BAND5_GRID_SURFACE.tif')
+        ]
+
+        register_layout(CBERS2B_LANDSAT_LAYOUT._replace(antenna='XX'), replace=True)
+        register_layout(AMAZONIA1_CBERS4_LAYOUT._replace(name='CBERS4A', prefixes=('CBERS_4A',),
+                                                         antenna='ZZ'))
+
+        for asset, antenna in zip(assets, ('XX', 'ZZ', 'CB11')):
+            for engine in ('split', 'regex'):
+                set_engine(engine)
+                self.assertEqual(antenna, decode_path(asset)['antenna'], engine)
+
+    def test__encode_registered_layout(self):
+        """Tests if the directories of a registered family are found back from their
+        decoded metadata, with the derived and with explicit encode prefixes."""
+
+        kompsat_asset = ('/TIFF/KOMPSAT3/2021_01/KOMPSAT_3_MSC_20210102.003000/209_110_0/'
+                         '2_BC_UTM_WGS84/KOMPSAT_3_MSC_20210101_209_110_L2_BAND5.tif')
+
+        with self.assertRaises(CDSREncoderException):
+            encode_dir_prefixes({'satellite': 'SENTINEL2A', 'sensor': 'MSI',
+                                 'date': '2021-01-01'})
+
+        register_layout(self.sentinel_layout)
+        # the prefix covers the sensor, then the satellite prefix is explicit
+        register_layout({**self.sentinel_layout, 'name': 'KOMPSAT3', 'prefixes': ['KOMPSAT_3_MSC'],
+                         'encode_prefixes': {'KOMPSAT3': 'KOMPSAT_3'}})
+
+        with TemporaryDirectory() as temp_dir:
+            top = join(temp_dir, 'TIFF')
+            create_tree(top, [asset[len('/TIFF/'):]
+                              for asset in (self.sentinel_asset, kompsat_asset)])
+
+            for asset, prefix in [(self.sentinel_asset, 'SENTINEL_2A_MSI_'),
+                                  (kompsat_asset, 'KOMPSAT_3_MSC_')]:
+                metadata = decode_path(asset)
+
+                self.assertEqual(prefix, encode_dir_prefixes(metadata, top)[0][-len(prefix):])
+                self.assertEqual([dirname(join(top, asset[len('/TIFF/'):]))],
+                                 list(find_dirs(metadata, top)))
+
+        with self.assertRaises(ValueError):
+            register_layout({**self.sentinel_layout, 'name': 'KOMPSAT3',
+                             'encode_prefixes': [['KOMPSAT3']]}, replace=True)
+
+    def test__malformed_scene_dir(self):
+        """Tests if malformed scene directories raise the same errors as unpacking their
+        parts."""
+
+        for scene_dir, parts in [('CBERS_4A_MUX.13_53_00_ETC2', ['CBERS', '4A', 'MUX']),
+                                 ('CBERS2B_CCD.145654', ['CBERS2B', 'CCD']),
+                                 ('CBERS2B_CCD_2007_0925.145654', ['CBERS2B', 'CCD', '2007',
+                                                                   '0925'])]:
+            with self.assertRaises(ValueError) as expected:
+                if scene_dir.startswith('CBERS_4A'):
+                    _, _, _, _, *_ = parts
+                else:
+                    _, _, _ = parts
+
+            with self.assertRaises(ValueError) as error:
+                extract_data_from_scene_dir(scene_dir)
+
+            self.assertEqual(str(expected.exception), str(error.exception))
+            self.assertEqual(DecodeErrorCode.MALFORMED_SCENE_DIR,
+                             decode_path_result(f'/TIFF/CBERS4A/2019_12/{scene_dir}/'
+                                                '209_110_0/2_BC_UTM_WGS84').code)
+
+    def test__register_layout__invalid(self):
+        """Tests if invalid and conflicting layouts are not registered."""
+
+        invalid_layouts = [
+            {**self.sentinel_layout, 'prefixes': []},
+            {**self.sentinel_layout, 'fields': ['satellite', 'date']},
+            {**self.sentinel_layout, 'fields': ['*date', 'satellite', 'sensor']},
+            {**self.sentinel_layout, 'date_format': '%d/%m/%Y'},
+            {**self.sentinel_layout, 'time_format': '%H:%M'},
+            {**self.sentinel_layout, 'name': 'AMAZONIA1_CBERS4'},
+            {**self.sentinel_layout, 'prefixes': ['SENTINEL_2', 'LANDSAT']}
+        ]
+
+        for layout in invalid_layouts:
+            with self.assertRaises(ValueError):
+                register_layout(layout)
+
+        self.assertEqual(2, len(get_layouts()))
+
+        with self.assertRaises(ValueError):
+            unregister_layout('SENTINEL2')
+
+        # conflicting layouts are replaced if asked
+        register_layout({**self.sentinel_layout, 'prefixes': ['SENTINEL_2', 'LANDSAT']},
+                        replace=True)
+        self.assertEqual('SENTINEL2', find_layout('LANDSAT1_MSS_19750907').name)
+        self.assertIsNone(find_layout('CBERS2B_CCD_20070925'))
+        self.assertEqual(['AMAZONIA1_CBERS4', 'SENTINEL2'],
+                         [layout.name for layout in get_layouts()])
+
+        register_layout(SceneDirLayout('CBERS2B_LANDSAT', ('CBERS2B', 'LANDSAT'),
+                                       ('satellite', 'sensor', 'date'), '%Y%m%d', '%H%M%S',
+                                       antenna='ND'), replace=True)
+        self.assertIsNone(find_layout('SENTINEL_2A_MSI_20210101'))
+
+    def test__load_layouts(self):
+        """Tests if the layouts of a JSON file are registered, by `load_layouts` and by
+        the environment variable."""
+
+        with TemporaryDirectory() as temp_dir:
+            file_path = join(temp_dir, 'layouts.json')
+
+            with open(file_path, 'w', encoding='utf-8') as file:
+                dump([self.sentinel_layout], file)
+
+            self.assertEqual(['SENTINEL2'],
+                             [layout.name for layout in load_layouts(file_path)])
+            self.assertEqual('SENTINEL2', find_layout('SENTINEL_2B_MSI_20210101').name)
+
+            code = f'import src.cdsr_pack as cdsr_pack; print(cdsr_pack.decode_path(' \
+                   f'{self.sentinel_asset!r})["satellite"])'
+
+            result = run([executable, '-c', code], cwd=dirname(dirname(__file__)),
+                         env={**environ, LAYOUTS_ENV: file_path}, capture_output=True,
+                         text=True, check=True)
+
+        self.assertEqual('SENTINEL2A\n', result.stdout)
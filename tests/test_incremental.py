@@ -0,0 +1,90 @@
+"""Test cases related to incremental scans."""
+
+
+from os import remove, utime, walk
+from os.path import join
+from shutil import rmtree
+from tempfile import TemporaryDirectory
+from time import time
+from unittest import TestCase
+
+from src.cdsr_pack.incremental import incremental_scan, scan_changes
+
+from test_walker import create_tree
+
+
+def age_dirs(top):
+    """Sets the mtime of all directories to one hour ago, then the incremental scan
+    trusts them (i.e. they were not modified in the same mtime tick of the scan)."""
+
+    one_hour_ago = time() - 3600
+
+    for dir_path, _, _ in walk(top):
+        utime(dir_path, (one_hour_ago, one_hour_ago))
+
+
+class TestCDSRPackIncrementalScan(TestCase):
+    """TestCDSRPackIncrementalScan"""
+
+    assets = [
+        ('CBERS4A/2021_01/CBERS_4A_MUX_RAW_2021_01_01.13_48_30_ETC2/209_110_0/2_BC_UTM_WGS84/'
+         'CBERS_4A_MUX_20210101_209_110_L2_BAND5.tif'),
+        ('CBERS4A/2021_01/CBERS_4A_MUX_RAW_2021_01_01.13_48_30_ETC2/209_110_0/2_BC_UTM_WGS84/'
+         'CBERS_4A_MUX_20210101_209_110_L2_BAND5.xml'),
+        ('CBERS2B/2010_03/CBERS2B_HRC_20100301.130915/151_B_141_5_0/2_BC_UTM_WGS84/'
+         'CBERS_2B_HRC_20100301_151_B_141_5_L2_BAND1.tif'),
+        ('LANDSAT1/1973_05/LANDSAT1_MSS_19730521.120000/237_059_0/2_BC_UTM_WGS84/'
+         'LANDSAT_1_MSS_19730521_237_059_L2_BAND4.tif')
+    ]
+
+    def test__incremental_scan(self):
+        """Tests if just added and removed assets are reported and if unchanged
+        directories are not listed again."""
+
+        with TemporaryDirectory() as temp_dir:
+            top = join(temp_dir, 'TIFF')
+            manifest_path = join(temp_dir, 'manifest.json')
+            create_tree(top, self.assets)
+            age_dirs(top)
+
+            # first scan, all assets are new
+            result = incremental_scan(top, manifest_path)
+
+            self.assertEqual(sorted(join(top, asset) for asset in self.assets),
+                             sorted(result.added))
+            self.assertEqual([], result.removed)
+            # top, 3 satellites, months, scenes, path/rows and geo. processings
+            self.assertEqual((16, 0), (result.listed_dirs, result.skipped_dirs))
+
+            # nothing has changed, then nothing is listed
+            result = incremental_scan(top, manifest_path)
+
+            self.assertEqual(([], [], 0, 16), result)
+
+            # add an asset, remove another one and remove a whole satellite
+            create_tree(top, [self.assets[0].replace('BAND5', 'BAND6')])
+            remove(join(top, self.assets[1]))
+            rmtree(join(top, 'LANDSAT1'))
+
+            result = incremental_scan(top, manifest_path)
+
+            self.assertEqual([join(top, self.assets[0].replace('BAND5', 'BAND6'))],
+                             result.added)
+            self.assertEqual([join(top, self.assets[1]), join(top, self.assets[3])],
+                             sorted(result.removed))
+            # just top and the modified geo. processing directory are listed
+            self.assertEqual((2, 9), (result.listed_dirs, result.skipped_dirs))
+
+    def test__scan_changes__missing_top(self):
+        """Tests if a missing top directory raises an error, instead of reporting
+        all assets as removed."""
+
+        with TemporaryDirectory() as temp_dir:
+            top = join(temp_dir, 'TIFF')
+            create_tree(top, self.assets)
+
+            _, manifest = scan_changes(top, {})
+            rmtree(top)
+
+            with self.assertRaises(FileNotFoundError):
+                scan_changes(top, manifest)
@@ -0,0 +1,104 @@
+"""Test cases related to the SQLite catalog index."""
+
+
+from os.path import join
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from src.cdsr_pack import CatalogIndex
+
+
+class TestCDSRPackCatalogIndex(TestCase):
+    """TestCDSRPackCatalogIndex"""
+
+    assets = [
+        ('/TIFF/CBERS4A/2021_01/CBERS_4A_MUX_RAW_2021_01_01.13_48_30_ETC2/209_110_0/'
+         '2_BC_UTM_WGS84/CBERS_4A_MUX_20210101_209_110_L2_BAND5.tif'),
+        ('/TIFF/CBERS4A/2021_01/CBERS_4A_MUX_RAW_2021_01_01.13_48_30_ETC2/209_110_0/'
+         '2_BC_UTM_WGS84/CBERS_4A_MUX_20210101_209_110_L2_BAND5.xml'),
+        ('/TIFF/CBERS4A/2020_12/CBERS_4A_MUX_RAW_2020_12_01.13_47_30_ETC2/209_122_0/'
+         '4_BC_UTM_WGS84/CBERS_4A_MUX_20201201_209_122_L4_BAND5.tif'),
+        ('/TIFF/CBERS4/2020_07/CBERS_4_MUX_DRD_2020_07_31.13_07_00_CB11/155_103_0/'
+         '4_BC_UTM_WGS84/CBERS_4_MUX_20200731_155_103_L4_EVI.tif'),
+        ('/TIFF/LANDSAT1/1973_05/LANDSAT1_MSS_19730521.120000/237_059_0/2_BC_UTM_WGS84/'
+         'LANDSAT_1_MSS_19730521_237_059_L2_BAND4.tif')
+    ]
+
+    invalid_paths = [
+        '/TIFF/LANDSAT1/1973_05/LANDSAT1_MSS_19730521.120000/237_059_0/2_BC_UTM_WGS84',
+        '/TIFF/bad/path'
+    ]
+
+    def test__catalog_index(self):
+        """Tests indexing and querying assets."""
+
+        with CatalogIndex() as index:
+            count, errors = index.add_paths(self.assets + self.invalid_paths, batch_size=2)
+
+            self.assertEqual(5, count)
+            self.assertEqual([
+                (self.invalid_paths[0], 'Just assets can be indexed, not directories.'),
+                (self.invalid_paths[1], 'Invalid `3` level to path: `/TIFF/bad/path`.')
+            ], errors)
+
+            # indexing the same assets again replaces them
+            index.add_paths(self.assets[:2])
+            self.assertEqual(5, len(index))
+
+            self.assertEqual(['CBERS4A_MUX_L2_DN', 'CBERS4A_MUX_L4_DN', 'CBERS4_MUX_L4_SR',
+                              'LANDSAT1_MSS_L2_DN'], index.collections())
+            self.assertEqual(['CBERS4A_MUX_L2_DN', 'CBERS4A_MUX_L4_DN'],
+                             index.collections(satellite='CBERS4A'))
+
+            self.assertEqual([('CBERS4A_MUX_L2_DN', 'CBERS4A_MUX_209110_20210101_ETC2'),
+                              ('CBERS4A_MUX_L4_DN', 'CBERS4A_MUX_209122_20201201_ETC2'),
+                              ('CBERS4_MUX_L4_SR', 'CBERS4_MUX_155103_20200731_CB11')],
+                             index.items(sensor='MUX'))
+            self.assertEqual([('CBERS4A_MUX_L4_DN', 'CBERS4A_MUX_209122_20201201_ETC2')],
+                             index.items(path='209', start_date='2020-12-01',
+                                         end_date='2020-12-31'))
+            self.assertEqual([('CBERS4A_MUX_L2_DN', 'CBERS4A_MUX_209110_20210101_ETC2')],
+                             index.items(limit=1))
+
+            self.assertEqual(self.assets[:2],
+                             index.assets(item='CBERS4A_MUX_209110_20210101_ETC2'))
+
+            index.remove_paths(self.assets[1:])
+            self.assertEqual(self.assets[:1], index.assets())
+
+            with self.assertRaises(ValueError) as error:
+                index.items(year='2021')
+
+            self.assertEqual('Invalid filters: `year`. Available filters: `collection, item, '
+                             'satellite, sensor, path, row, geo_processing, radio_processing, '
+                             'antenna, start_date, end_date`.', str(error.exception))
+
+            for batch_size in (0, -1, 1.5):
+                with self.assertRaises(ValueError) as error:
+                    index.add_paths(self.assets, batch_size=batch_size)
+
+                self.assertEqual(f'Batch size must be a positive int, not `{batch_size}`.',
+                                 str(error.exception))
+
+            self.assertEqual(self.assets[:1], index.assets())
+
+    def test__catalog_index__persistence_and_indexes(self):
+        """Tests if the index is persisted and if lookups use the database indexes."""
+
+        with TemporaryDirectory() as temp_dir:
+            database = join(temp_dir, 'catalog.db')
+
+            with CatalogIndex(database) as index:
+                index.add_paths(self.assets)
+
+            with CatalogIndex(database) as index:
+                self.assertEqual(5, len(index))
+
+                for condition in ("collection = 'CBERS4A_MUX_L2_DN'", "item = 'X'",
+                                  "satellite = 'CBERS4A' AND sensor = 'MUX'",
+                                  "date > '2021-01-01'", "\"path\" = '209' AND \"row\" = '110'"):
+                    plan = index.connection.execute(
+                        f'EXPLAIN QUERY PLAN SELECT asset_path FROM asset WHERE {condition}'
+                    ).fetchall()
+
+                    self.assertIn('USING INDEX', str(plan))
@@ -0,0 +1,82 @@
+"""Test cases related to the interning of metadata values."""
+
+
+from unittest import TestCase
+
+from src.cdsr_pack import build_collection, build_collections, decode_path, decode_paths, \
+                          get_engine, set_engine
+from src.cdsr_pack.interning import disable_interning, enable_interning
+
+
+class TestCDSRPackInterning(TestCase):
+    """TestCDSRPackInterning"""
+
+    paths = [
+        ('/TIFF/CBERS4A/2021_01/CBERS_4A_MUX_RAW_2021_01_01.13_48_30_ETC2/209_110_0/'
+         '2_BC_UTM_WGS84/CBERS_4A_MUX_20210101_209_110_L2_BAND5.tif'),
+        ('/TIFF/CBERS4A/2021_01/CBERS_4A_MUX_RAW_2021_01_02.13_48_30_ETC2/209_110_0/'
+         '2_BC_UTM_WGS84/CBERS_4A_MUX_20210102_209_110_L2_BAND6.tif')
+    ]
+
+    def tearDown(self):
+        disable_interning()
+        set_engine('split')
+
+    def test__interning(self):
+        """Tests if equal values and collections share one str, without changing
+        the decoded metadata nor the built collections."""
+
+        expected = [decode_path(path) for path in self.paths]
+        expected_collections = [build_collection(metadata) for metadata in expected]
+
+        for engine in ('split', 'regex'):
+            set_engine(engine)
+            enable_interning()
+
+            self.assertEqual(engine, get_engine())
+
+            first, second = [decode_path(path) for path in self.paths]
+
+            self.assertEqual(expected, [first, second])
+            for key in ('satellite', 'sensor', 'path', 'row', 'geo_processing',
+                        'radio_processing', 'antenna'):
+                self.assertIs(first[key], second[key], key)
+
+            collections = [build_collection(first), build_collection(second),
+                           build_collection(decode_path(self.paths[0], record=True))]
+            self.assertEqual(expected_collections + expected_collections[:1], collections)
+            self.assertIs(collections[0], collections[1])
+            self.assertIs(collections[0], collections[2])
+
+            batch_collections, _ = build_collections(decode_paths(self.paths))
+            self.assertIs(collections[0], batch_collections[1])
+
+            disable_interning()
+
+            self.assertEqual(engine, get_engine())
+            self.assertIsNot(build_collection(first), build_collection(second))
+
+    def test__enable_interning__invalid_fields(self):
+        """Tests enabling interning with invalid fields."""
+
+        with self.assertRaises(ValueError) as error:
+            enable_interning(['satellite', 'year'])
+
+        self.assertEqual('Invalid fields: `year`. Available fields: `satellite, sensor, path, '
+                         'row, date, geo_processing, radio_processing, antenna`.',
+                         str(error.exception))
+
+    def test__enable_interning__fields(self):
+        """Tests if just the given fields are interned, by pools shared by all engines."""
+
+        enable_interning(['satellite'])
+
+        set_engine('split')
+        first = decode_path(self.paths[0])
+        set_engine('regex')
+        second, third = [decode_path(path) for path in self.paths]
+
+        self.assertIs(first['satellite'], second['satellite'])
+        self.assertIs(first['satellite'], third['satellite'])
+        self.assertIsNot(second['sensor'], third['sensor'])
+        self.assertEqual('MUX', third['sensor'])
@@ -0,0 +1,52 @@
+"""Test cases related to `Metadata` records."""
+
+
+from unittest import TestCase
+
+from src.cdsr_pack import CDSRBuilderException, Metadata, build_collection, build_item, \
+                          decode_path
+
+
+class TestCDSRPackMetadata(TestCase):
+    """TestCDSRPackMetadata"""
+
+    def test__metadata__valid_asset(self):
+        """Tests if a record has the same metadata as the dict and if the builders
+        accept it."""
+
+        asset_path = ('/TIFF/CBERS4/2020_07/CBERS_4_MUX_DRD_2020_07_31.13_07_00_CB11/155_103_0/'
+                      '4_BC_UTM_WGS84/CBERS_4_MUX_20200731_155_103_L4_EVI.tif')
+
+        record = decode_path(asset_path, record=True)
+
+        self.assertEqual(Metadata(satellite='CBERS4', sensor='MUX', path='155', row='103',
+                                  date='2020-07-31', geo_processing='4', radio_processing='SR',
+                                  antenna='CB11'),
+                         record)
+        self.assertEqual(decode_path(asset_path), record.to_dict())
+
+        self.assertEqual('CBERS4_MUX_L4_SR', build_collection(record))
+        self.assertEqual('CBERS4_MUX_155103_20200731_CB11', build_item(record))
+
+        # records are immutable
+        with self.assertRaises(AttributeError):
+            record.satellite = 'CBERS4A'
+
+    def test__metadata__valid_path(self):
+        """Tests if the builders raise the same errors to records and dicts of
+        paths without asset."""
+
+        path = '/TIFF/CBERS2B/2010_03/CBERS2B_HRC_20100301.130915/151_B_141_5_0/2_BC_UTM_WGS84'
+
+        record = decode_path(path, record=True)
+
+        self.assertEqual(decode_path(path), record.to_dict())
+
+        for builder in (build_collection, build_item):
+            with self.assertRaises(CDSRBuilderException) as record_error:
+                builder(record)
+
+            with self.assertRaises(CDSRBuilderException) as dict_error:
+                builder(record.to_dict())
+
+            self.assertEqual(str(dict_error.exception), str(record_error.exception))
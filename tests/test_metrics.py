@@ -0,0 +1,140 @@
+"""Test cases related to the decode metrics registry."""
+
+
+from os.path import join
+from tempfile import TemporaryDirectory
+from threading import Thread
+from unittest import TestCase
+
+from src import cdsr_pack
+from src.cdsr_pack import decoder
+from src.cdsr_pack.metrics import disable_metrics, enable_metrics
+
+
+class TestCDSRPackMetrics(TestCase):
+    """TestCDSRPackMetrics"""
+
+    asset = ('/TIFF/CBERS4A/2021_01/CBERS_4A_MUX_RAW_2021_01_01.13_48_30_ETC2/209_110_0/'
+             '2_BC_UTM_WGS84/CBERS_4A_MUX_20210101_209_110_L2_BAND5.tif')
+
+    invalid_paths = [
+        ('/TIFF/AMAZONIA1/2021_03/AMAZONIA_1_WFI_DRD_2021_03_03.12_57_40/217_015_0/'
+         '2_BC_LCC_WGS84/AMAZONIA_1_WFI_20210303_217_015_L2_BAND4.tif'),
+        ('/TIFF/CBERS4A/2021_01/CBERS_4A_MUX_RAW_2021_01_01.13_48_30_ETC2/209_110_0/'
+         '2_BC_UTM_WGS84/CBERS_4A_MUX_20210101_209_110_L2_BAND5'),
+        '/TIFF/bad/path'
+    ]
+
+    def tearDown(self):
+        disable_metrics()
+        cdsr_pack.set_engine('split')
+
+    def test__metrics(self):
+        """Tests the counters and their Prometheus text format."""
+
+        original_engine = decoder.ENGINES['split']
+        registry = enable_metrics()
+
+        self.assertIs(registry, enable_metrics())
+
+        expected = cdsr_pack.decode_path(self.asset)
+        cdsr_pack.build_collection(expected)
+        cdsr_pack.build_item(expected)
+
+        # return values and errors are the same ones
+        disable_metrics()
+        self.assertIs(original_engine, decoder.ENGINES['split'])
+        errors = cdsr_pack.decode_paths(self.invalid_paths)['error']
+
+        enable_metrics().reset()
+        registry = enable_metrics()
+
+        self.assertEqual(expected, cdsr_pack.decode_path(self.asset))
+        self.assertEqual(errors, cdsr_pack.decode_paths(self.invalid_paths)['error'])
+
+        # the `regex` engine calls the `split` one, but paths are counted once
+        cdsr_pack.set_engine('regex')
+        self.assertEqual(errors, cdsr_pack.decode_paths(self.invalid_paths)['error'])
+        cdsr_pack.decode_path(self.asset, record=True)
+
+        # each thread counts into its own dict
+        thread = Thread(target=cdsr_pack.decode_paths, args=([self.asset] * 3,))
+        thread.start()
+        thread.join()
+
+        cdsr_pack.build_item(cdsr_pack.decode_path(self.asset))
+
+        with self.assertRaises(cdsr_pack.CDSRBuilderException):
+            cdsr_pack.build_item({})
+
+        self.assertEqual(
+            '# HELP cdsr_pack_decoded_paths_total Paths decoded successfully.\n'
+            '# TYPE cdsr_pack_decoded_paths_total counter\n'
+            'cdsr_pack_decoded_paths_total{satellite="CBERS4A",sensor="MUX",'
+            'geo_processing="2"} 6\n'
+            '# HELP cdsr_pack_decode_errors_total Paths that cannot be decoded.\n'
+            '# TYPE cdsr_pack_decode_errors_total counter\n'
+            'cdsr_pack_decode_errors_total{satellite="AMAZONIA1",kind="invalid_antenna"} 2\n'
+            'cdsr_pack_decode_errors_total{satellite="CBERS4A",kind="asset_without_extension"} 2\n'
+            'cdsr_pack_decode_errors_total{satellite="bad",kind="invalid_level"} 2\n'
+            '# HELP cdsr_pack_builds_total Collections and items built.\n'
+            '# TYPE cdsr_pack_builds_total counter\n'
+            'cdsr_pack_builds_total{builder="build_item",outcome="failure"} 1\n'
+            'cdsr_pack_builds_total{builder="build_item",outcome="success"} 1\n',
+            registry.render()
+        )
+
+        with TemporaryDirectory() as temp_dir:
+            file_path = join(temp_dir, 'cdsr_pack.prom')
+            registry.write(file_path)
+
+            with open(file_path, encoding='utf-8') as file:
+                self.assertEqual(registry.render(), file.read())
+
+    def test__metrics__invalid_type(self):
+        """Tests if paths that are not str are counted, although no engine is called."""
+
+        originals = cdsr_pack.decode_path, cdsr_pack.decode_paths
+        registry = enable_metrics()
+
+        with self.assertRaises(cdsr_pack.CDSRDecoderException):
+            cdsr_pack.decode_path(None)
+
+        self.assertEqual(['Path must be a str, not a `<class \'int\'>`.', None],
+                         cdsr_pack.decode_paths([123, self.asset])['error'])
+
+        self.assertEqual({('cdsr_pack_decode_errors_total', '', 'invalid_type'): 2,
+                          ('cdsr_pack_decoded_paths_total', 'CBERS4A', 'MUX', '2'): 1},
+                         registry.snapshot())
+
+        disable_metrics()
+        self.assertEqual(originals, (cdsr_pack.decode_path, cdsr_pack.decode_paths))
+        self.assertEqual(originals, (decoder.decode_path, decoder.decode_paths))
+
+    def test__metrics__batch_builders(self):
+        """Tests if the rows of the batch builders are counted once, whether all of them
+        are valid or not."""
+
+        registry = enable_metrics()
+        columns = cdsr_pack.decode_paths([self.asset] * 3)
+
+        self.assertEqual(3, len(cdsr_pack.build_collections(columns)[0]))
+        self.assertEqual(3, len(cdsr_pack.build_items(columns)[0]))
+
+        # an invalid row makes the rows be built one by one
+        columns = {**columns, 'date': columns['date'][:2] + [None]}
+        self.assertEqual([None, None, 'All mandatory values inside metadata dict must be '
+                          'strings, but the following keys are not: `date`.'],
+                         cdsr_pack.build_items(columns)[1])
+
+        with self.assertRaises(cdsr_pack.CDSRBuilderException):
+            cdsr_pack.build_items({})
+
+        self.assertEqual({'success': 3, 'failure': 0},
+                         {outcome: registry.snapshot().get(('cdsr_pack_builds_total',
+                                                            'build_collection', outcome), 0)
+                          for outcome in ('success', 'failure')})
+        self.assertEqual({'success': 5, 'failure': 1},
+                         {outcome: registry.snapshot().get(('cdsr_pack_builds_total',
+                                                            'build_item', outcome), 0)
+                          for outcome in ('success', 'failure')})
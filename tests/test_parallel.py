@@ -0,0 +1,148 @@
+"""Test cases related to parallel decoding."""
+
+
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+from sys import version_info
+from unittest import TestCase
+from unittest.mock import patch
+
+from src.cdsr_pack import CDSRDecoderException, Metadata, decode_path, \
+                          decode_paths_parallel, get_antennas, get_sr_markers, \
+                          register_layout, set_antennas, set_engine, set_sr_markers, \
+                          unregister_layout
+from src.cdsr_pack import parallel
+from src.cdsr_pack.cache import disable_cache, enable_cache
+
+
+class RecordingProcessPoolExecutor(ProcessPoolExecutor):
+    """Process pool that keeps the futures of the submitted calls."""
+
+    futures = []
+
+    def submit(self, *args, **kwargs):  # pylint: disable=arguments-differ
+        future = super().submit(*args, **kwargs)
+        self.futures.append(future)
+        return future
+
+
+class TestCDSRPackDecodePathsParallel(TestCase):
+    """TestCDSRPackDecodePathsParallel"""
+
+    paths = [
+        ('/TIFF/CBERS4A/2021_01/CBERS_4A_MUX_RAW_2021_01_01.13_48_30_ETC2/'
+         '209_110_0/2_BC_UTM_WGS84/CBERS_4A_MUX_20210101_209_110_L2_BAND5.tif'),
+        ('/TIFF/AMAZONIA1/2021_03/AMAZONIA_1_WFI_DRD_2021_03_03.12_57_40'
+         '/217_015_0/2_BC_LCC_WGS84/AMAZONIA_1_WFI_20210303_217_015_L2_BAND4.tif'),
+        '/TIFF/CBERS2B/2010_03/CBERS2B_HRC_20100301.130915/151_B_141_5_0/2_BC_UTM_WGS84',
+        '/TIFF/CBERS4A/2021_01/CBERS_4A/209_110_0/2_BC_UTM_WGS84',
+        ('/TIFF/LANDSAT1/1973_05/LANDSAT1_MSS_19730521.120000/237_059_0/'
+         '2_BC_UTM_WGS84/LANDSAT_1_MSS_19730521_237_059_L2_BAND4.xml')
+    ] * 3
+
+    def tearDown(self):
+        set_engine('split')
+
+    def expected_results(self):
+        """Returns the expected `(path, metadata, error)` tuples decoding one path at once."""
+
+        results = []
+
+        for path in self.paths:
+            try:
+                results.append((path, decode_path(path), None))
+            except (CDSRDecoderException, ValueError) as error:
+                results.append((path, None, str(error)))
+
+        return results
+
+    def test__decode_paths_parallel__ordered(self):
+        """Tests if results are yielded in the same order as the paths."""
+
+        # the engine of the main process is used by the workers as well
+        set_engine('regex')
+
+        self.assertEqual(self.expected_results(),
+                         list(decode_paths_parallel(iter(self.paths), workers=2, chunk_size=2)))
+
+    def test__decode_paths_parallel__unordered(self):
+        """Tests if all results are yielded when they are not ordered."""
+
+        results = list(decode_paths_parallel(self.paths, workers=2, chunk_size=4,
+                                             ordered=False, record=True))
+
+        self.assertEqual(sorted(map(str, self.expected_results())),
+                         sorted(str((path, metadata and metadata.to_dict(), error))
+                                for path, metadata, error in results))
+        self.assertTrue(all(isinstance(metadata, Metadata)
+                            for _, metadata, error in results if error is None))
+
+    def test__decode_paths_parallel__invalid_chunk_size(self):
+        """Tests if an invalid chunk size raises an error."""
+
+        with self.assertRaises(ValueError) as error:
+            list(decode_paths_parallel(self.paths, chunk_size=0))
+
+        self.assertEqual('Chunk size must be a positive int, not `0`.', str(error.exception))
+
+    def test__decode_paths_parallel__break(self):
+        """Tests if breaking out of `decode_paths_parallel` does not wait for the chunks
+        in flight to be decoded."""
+
+        for ordered in (True, False):
+            RecordingProcessPoolExecutor.futures = []
+
+            with patch.object(parallel, 'ProcessPoolExecutor', RecordingProcessPoolExecutor):
+                for _ in decode_paths_parallel(self.paths * 10000, workers=2, chunk_size=20000,
+                                               ordered=ordered):
+                    break
+
+            futures = RecordingProcessPoolExecutor.futures
+
+            self.assertEqual(4, len(futures))
+            # before Python 3.9, the pool waits for the chunks in flight
+            self.assertEqual(version_info < (3, 9), all(future.done() for future in futures),
+                             ordered)
+
+            for future in futures:
+                if not future.cancelled():
+                    future.result()
+
+    def test__decode_paths_parallel__spawn(self):
+        """Tests if workers started by `spawn` decode paths with the registered layouts,
+        antennas and SR markers of the main process."""
+
+        antennas, sr_markers = get_antennas(), get_sr_markers()
+        paths = self.paths + [
+            ('/TIFF/SENTINEL2A/2021_01/SENTINEL_2A_MSI_20210101.103000/209_110_0/'
+             '2_BC_UTM_WGS84/SENTINEL_2A_MSI_20210101_209_110_L2_BAND5.tif'),
+            ('/TIFF/CBERS4A/2021_01/CBERS_4A_MUX_RAW_2021_01_01.13_48_30_XYZ/209_110_0/'
+             '2_BC_UTM_WGS84/CBERS_4A_MUX_20210101_209_110_L2_BAND5.tif'),
+            ('/TIFF/CBERS4A/2021_01/CBERS_4A_MUX_RAW_2021_01_01.13_48_30_ETC2/209_110_0/'
+             '2_BC_UTM_WGS84/CBERS_4A_MUX_20210101_209_110_L2_BAND5_SAVI.tif')
+        ]
+
+        register_layout({'name': 'SENTINEL2', 'prefixes': ['SENTINEL_2'],
+                         'fields': ['satellite', 'satellite', 'sensor', 'date'],
+                         'date_format': '%Y%m%d', 'time_format': '%H%M%S', 'antenna': 'ND'})
+        set_antennas(antennas + ('XYZ',))
+        set_sr_markers(sr_markers + ('SAVI',))
+        set_engine('regex')
+        enable_cache()
+
+        try:
+            expected = [(path, decode_path(path)) for path in paths[-3:]]
+
+            results = list(decode_paths_parallel(paths, workers=1, chunk_size=4,
+                                                 mp_context=get_context('spawn')))
+        finally:
+            disable_cache()
+            set_antennas(antennas)
+            set_sr_markers(sr_markers)
+            unregister_layout('SENTINEL2')
+
+        self.assertEqual(expected, [(path, metadata) for path, metadata, _ in results[-3:]])
+        self.assertEqual(['SENTINEL2A', 'XYZ', 'SR'],
+                         [results[-3][1]['satellite'], results[-2][1]['antenna'],
+                          results[-1][1]['radio_processing']])
+        self.assertEqual(self.expected_results(), results[:-3])
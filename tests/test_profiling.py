@@ -0,0 +1,105 @@
+"""Test cases related to the profiling of the decoders and builders."""
+
+
+from os import environ
+from os.path import dirname
+from subprocess import run
+from sys import executable
+from unittest import TestCase
+
+from src import cdsr_pack
+from src.cdsr_pack import builder, decoder, walker
+from src.cdsr_pack.profiling import PROFILE_ENV, disable_profiling, enable_profiling, profile
+
+
+class TestCDSRPackProfiling(TestCase):
+    """TestCDSRPackProfiling"""
+
+    asset = ('/TIFF/CBERS4A/2021_01/CBERS_4A_MUX_RAW_2021_01_01.13_48_30_ETC2/209_110_0/'
+             '2_BC_UTM_WGS84/CBERS_4A_MUX_20210101_209_110_L2_BAND5.tif')
+
+    def test__profile(self):
+        """Tests the statistics collected inside a `with` block."""
+
+        originals = (cdsr_pack.decode_path, decoder.decode_scene_dir, walker.decode_scene_dir,
+                     builder.build_collection, decoder.ENGINES['split'])
+
+        with profile() as stats:
+            # functions imported by name are swapped as well
+            self.assertIsNot(originals[2], walker.decode_scene_dir)
+
+            for _ in range(3):
+                cdsr_pack.build_collection(cdsr_pack.decode_path(self.asset))
+
+            with self.assertRaises(cdsr_pack.CDSRDecoderException):
+                cdsr_pack.decode_path('/TIFF/bad/path')
+
+            self.assertIs(stats, enable_profiling())
+
+        self.assertEqual(originals, (cdsr_pack.decode_path, decoder.decode_scene_dir,
+                                     walker.decode_scene_dir, builder.build_collection,
+                                     decoder.ENGINES['split']))
+
+        stages = {stage.stage: stage for stage in stats.stats()}
+
+        self.assertEqual({'decode_path', 'engine:split', 'decode_scene_dir',
+                          'decode_path_row_dir', 'decode_geo_processing_dir', 'decode_asset',
+                          'build_collection'}, set(stages))
+        self.assertEqual((4, 1), stages['decode_path'][1:3])
+        self.assertEqual((4, 1), stages['engine:split'][1:3])
+        self.assertEqual((3, 0), stages['decode_scene_dir'][1:3])
+
+        # the self time of a stage does not include the stages it calls
+        for stage in stages.values():
+            self.assertLessEqual(stage.self_ns, stage.total_ns)
+            self.assertLessEqual(stage.error_ns, stage.total_ns)
+
+        engine = stages['engine:split']
+        self.assertGreaterEqual(engine.total_ns - engine.self_ns,
+                                stages['decode_scene_dir'].total_ns +
+                                stages['decode_asset'].total_ns)
+        self.assertGreaterEqual(stages['decode_path'].total_ns, engine.total_ns)
+
+        table = stats.table().split('\n')
+
+        self.assertEqual(8, len(table))
+        self.assertEqual(['stage', 'calls', 'errors', 'total', 'ms', 'self', 'ms', 'self', '%',
+                          'ns/call', 'error', 'ms'], table[0].split())
+
+        stats.reset()
+        self.assertEqual([], stats.stats())
+
+    def test__profile__engine(self):
+        """Tests if the engine selected while profiling is kept after it."""
+
+        try:
+            with profile() as stats:
+                cdsr_pack.set_engine('regex')
+                cdsr_pack.decode_path(self.asset)
+
+            self.assertEqual('regex', cdsr_pack.get_engine())
+            self.assertIn('engine:regex', [stage.stage for stage in stats.stats()])
+            # disabling profiling again does nothing
+            disable_profiling()
+            self.assertEqual('regex', cdsr_pack.get_engine())
+        finally:
+            cdsr_pack.set_engine('split')
+
+    def test__profile__environment_variable(self):
+        """Tests if the profile table is printed at exit when the environment variable
+        is set."""
+
+        code = f'import src.cdsr_pack as cdsr_pack; cdsr_pack.decode_path({self.asset!r})'
+
+        result = run([executable, '-c', code], cwd=dirname(dirname(__file__)),
+                     env={**environ, PROFILE_ENV: '1'}, capture_output=True, text=True,
+                     check=True)
+
+        self.assertTrue(result.stderr.startswith('stage'))
+        self.assertIn('decode_scene_dir', result.stderr)
+
+        result = run([executable, '-c', code], cwd=dirname(dirname(__file__)),
+                     env={**environ, PROFILE_ENV: '0'}, capture_output=True, text=True,
+                     check=True)
+
+        self.assertEqual('', result.stderr)
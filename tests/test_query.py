@@ -0,0 +1,155 @@
+"""Test cases related to the in-memory query engine."""
+
+
+from random import Random
+from unittest import TestCase
+
+from src.cdsr_pack import Metadata, QueryEngine, build_collection, build_item, decode_path
+
+
+class TestCDSRPackQueryEngine(TestCase):
+    """TestCDSRPackQueryEngine"""
+
+    assets = [
+        ('/TIFF/CBERS4A/2021_01/CBERS_4A_MUX_RAW_2021_01_01.13_48_30_ETC2/209_110_0/'
+         '2_BC_UTM_WGS84/CBERS_4A_MUX_20210101_209_110_L2_BAND5.tif'),
+        ('/TIFF/CBERS4A/2021_01/CBERS_4A_MUX_RAW_2021_01_01.13_48_30_ETC2/209_110_0/'
+         '2_BC_UTM_WGS84/CBERS_4A_MUX_20210101_209_110_L2_BAND5.xml'),
+        ('/TIFF/CBERS4A/2020_12/CBERS_4A_MUX_RAW_2020_12_01.13_47_30_ETC2/209_122_0/'
+         '4_BC_UTM_WGS84/CBERS_4A_MUX_20201201_209_122_L4_BAND5.tif'),
+        ('/TIFF/CBERS4/2020_07/CBERS_4_MUX_DRD_2020_07_31.13_07_00_CB11/155_103_0/'
+         '4_BC_UTM_WGS84/CBERS_4_MUX_20200731_155_103_L4_EVI.tif'),
+        ('/TIFF/LANDSAT1/1973_05/LANDSAT1_MSS_19730521.120000/237_059_0/2_BC_UTM_WGS84/'
+         'LANDSAT_1_MSS_19730521_237_059_L2_BAND4.tif'),
+        # level 6 paths have not got a date, then they are skipped
+        '/TIFF/LANDSAT1/1973_05/LANDSAT1_MSS_19730521.120000/237_059_0/2_BC_UTM_WGS84'
+    ]
+
+    def test__query_engine(self):
+        """Tests adding items and querying them."""
+
+        engine = QueryEngine(decode_path(path) for path in self.assets)
+
+        self.assertEqual(4, len(engine))
+        # assets of the same item are added once
+        self.assertEqual(0, engine.add([decode_path(self.assets[1], record=True)]))
+
+        self.assertEqual([('CBERS4A_MUX_L2_DN', 'CBERS4A_MUX_209110_20210101_ETC2'),
+                          ('CBERS4A_MUX_L4_DN', 'CBERS4A_MUX_209122_20201201_ETC2'),
+                          ('CBERS4_MUX_L4_SR', 'CBERS4_MUX_155103_20200731_CB11')],
+                         engine.items(sensor='MUX'))
+        self.assertEqual([('CBERS4_MUX_L4_SR', 'CBERS4_MUX_155103_20200731_CB11'),
+                          ('CBERS4A_MUX_L4_DN', 'CBERS4A_MUX_209122_20201201_ETC2')],
+                         engine.items(order='date', geo_processing='4'))
+        self.assertEqual([('CBERS4A_MUX_L4_DN', 'CBERS4A_MUX_209122_20201201_ETC2')],
+                         engine.items(path='209', start_date='2020-12-01',
+                                      end_date='2020-12-31'))
+        self.assertEqual([('CBERS4A_MUX_L2_DN', 'CBERS4A_MUX_209110_20210101_ETC2'),
+                          ('CBERS4A_MUX_L4_DN', 'CBERS4A_MUX_209122_20201201_ETC2')],
+                         engine.items(path=209, row=(100, 130)))
+        self.assertEqual([('LANDSAT1_MSS_L2_DN', 'LANDSAT1_MSS_237059_19730521_ND')],
+                         engine.items(row='059'))
+        self.assertEqual([('CBERS4_MUX_L4_SR', 'CBERS4_MUX_155103_20200731_CB11')],
+                         engine.items(item='CBERS4_MUX_155103_20200731_CB11', antenna='CB11'))
+        self.assertEqual([('CBERS4A_MUX_L2_DN', 'CBERS4A_MUX_209110_20210101_ETC2')],
+                         engine.items(limit=1))
+        self.assertEqual([], engine.items(collection='CBERS4A_MUX_L2_DN', antenna='CB11'))
+        self.assertEqual([], engine.items(satellite='CBERS2B'))
+
+    def test__query_engine__invalid_path_row(self):
+        """Tests adding items whose path or row cannot be indexed."""
+
+        records = [
+            Metadata('CBERS4A', 'MUX', '209', '110', '2021-01-01', '2', 'DN', 'ETC2'),
+            Metadata('CBERS4A', 'MUX', 'A01', '110', '2021-01-02', '2', 'DN', 'ETC2'),
+            Metadata('CBERS4A', 'MUX', '209', '10000', '2021-01-03', '2', 'DN', 'ETC2'),
+            Metadata('CBERS4A', 'MUX', '209', '-1', '2021-01-04', '2', 'DN', 'ETC2'),
+            Metadata('CBERS4A', 'MUX', None, '110', '2021-01-05', '2', 'DN', 'ETC2'),
+            Metadata('CBERS4A', 'MUX', '209', '111', '2021-01-06', '2', 'DN', 'ETC2')
+        ]
+
+        engine = QueryEngine()
+
+        # the invalid records are skipped, instead of aborting the whole batch
+        self.assertEqual(2, engine.add(records))
+        self.assertEqual([('CBERS4A_MUX_L2_DN', 'CBERS4A_MUX_209111_20210106_ETC2'),
+                          ('CBERS4A_MUX_L2_DN', 'CBERS4A_MUX_209110_20210101_ETC2')],
+                         engine.items(path=209))
+
+    def test__query_engine__against_linear_scan(self):
+        """Tests random queries against a linear scan of the same items."""
+
+        generator = Random(42)
+        records = [
+            Metadata(satellite, sensor, f'{generator.randint(1, 20):03d}',
+                     f'{generator.randint(1, 20):03d}',
+                     f'2021-{generator.randint(1, 12):02d}-{generator.randint(1, 28):02d}',
+                     geo_processing, radio_processing, generator.choice(['CB11', 'CP5', 'ETC2']))
+            for _ in range(3000)
+            for satellite, sensor, geo_processing, radio_processing in [generator.choice([
+                ('CBERS4A', 'WFI', '4', 'SR'), ('CBERS4A', 'WFI', '2', 'DN'),
+                ('CBERS4', 'MUX', '4', 'SR'), ('AMAZONIA1', 'WFI', '4', 'DN')
+            ])]
+        ]
+
+        engine = QueryEngine(records)
+
+        # distinct items, from the newest to the oldest one
+        rows = sorted({(record.date, build_collection(record), build_item(record), record)
+                       for record in records}, reverse=True)
+
+        for _ in range(200):
+            filters = generator.choice([
+                {'collection': 'CBERS4A_WFI_L4_SR'},
+                {'satellite': 'CBERS4A', 'path': (5, 9), 'row': (3, 15)},
+                {'path': '015', 'start_date': '2021-03-01', 'end_date': '2021-06-30'},
+                {'row': 7, 'antenna': 'CP5'},
+                {'sensor': 'WFI', 'start_date': '2021-11-15'},
+                {}
+            ])
+            limit = generator.choice([None, 1, 10])
+
+            def matches(record: Metadata, filters=filters) -> bool:
+                for key, value in filters.items():
+                    if key == 'collection' and build_collection(record) != value:
+                        return False
+                    if key in ('path', 'row'):
+                        low, high = value if isinstance(value, tuple) else (value, value)
+                        if not int(low) <= int(getattr(record, key)) <= int(high):
+                            return False
+                    if key == 'start_date' and record.date < value:
+                        return False
+                    if key == 'end_date' and record.date > value:
+                        return False
+                    if key in ('satellite', 'sensor', 'antenna') and \
+                            getattr(record, key) != value:
+                        return False
+                return True
+
+            expected = [(collection, item) for _, collection, item, record in rows
+                        if matches(record)][:limit]
+
+            self.assertEqual(expected, engine.items(limit=limit, **filters), filters)
+
+            if limit is None:
+                self.assertEqual(expected[::-1], engine.items(order='date', **filters))
+
+    def test__query_engine__invalid_filters(self):
+        """Tests querying with invalid filters and orders."""
+
+        engine = QueryEngine()
+
+        self.assertEqual([], engine.items())
+
+        with self.assertRaises(ValueError) as error:
+            engine.items(band='BAND5')
+
+        self.assertEqual('Invalid filters: `band`. Available filters: `collection, item, '
+                         'satellite, sensor, geo_processing, radio_processing, path, row, '
+                         'antenna, start_date, end_date`.', str(error.exception))
+
+        with self.assertRaises(ValueError) as error:
+            engine.items(order='path')
+
+        self.assertEqual('Invalid order: `path`. Available orders: `date, -date`.',
+                         str(error.exception))
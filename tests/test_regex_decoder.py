@@ -0,0 +1,96 @@
+"""Test cases related to the `regex` decoding engine."""
+
+
+from unittest import TestCase
+from unittest.mock import patch
+
+from src.cdsr_pack import decode_path, get_engine, regex_decoder, set_engine
+from src.cdsr_pack.decoder import ENGINES
+
+
+class TestCDSRPackRegexEngine(TestCase):
+    """TestCDSRPackRegexEngine"""
+
+    valid_resources = [
+        ('/TIFF/AMAZONIA1/2021_04/AMAZONIA_1_WFI_DRD_2021_04_01.13_22_45_CP5_COROT/'
+         '035_016_0/4_BC_LCC_WGS84/AMAZONIA_1_WFI_20210401_035_016_L4_BAND1.tif'),
+        ('/TIFF/CBERS4/2020_07/CBERS_4_MUX_DRD_2020_07_31.13_07_00_CB11/155_103_0/'
+         '4_BC_UTM_WGS84/CBERS_4_MUX_20200731_155_103_L4_BAND5_GRID_SURFACE.xml'),
+        ('/TIFF/CBERS4A/2020_12/CBERS_4A_WFI_RAW_2020_12_07.13_29_30_ETC2/214_108_0/'
+         '4_BC_UTM_WGS84/CBERS_4A_WFI_20201207_214_108_L4_LEFT_NDVI.tif'),
+        ('/TIFF/CBERS4A/2020_12/CBERS_4A_WFI_RAW_2020_12_22.13_35_00_ETC2/211_108_0/'
+         '2B_BC_UTM_WGS84/CBERS_4A_WFI_20201222_211_108_L2B_BAND13.tif'),
+        ('/TIFF/CBERS2B/2010_03/CBERS2B_HRC_20100301.130915/151_B_141_5_0/2_BC_UTM_WGS84/'
+         'CBERS_2B_HRC_20100301_151_B_141_5_L2_BAND1.tif'),
+        ('/TIFF/LANDSAT7/1999_07/LANDSAT7_ETM_19990731.131533/004_072_0/2_BC_UTM_WGS84/'
+         'LANDSAT_7_ETMXS_19990731_004_072_L2_BAND1.xml'),
+        # level 6 paths
+        '/TIFF/CBERS4/2016_01/CBERS_4_MUX_DRD_2016_01_01.13_28_32_CB11/151_098_0/3_BC_UTM_WGS84/',
+        '/TIFF/CBERS2B/2010_03/CBERS2B_WFI_20100301.144734/177_092_0/2_BC_LCC_WGS84'
+    ]
+
+    invalid_resources = [
+        '',
+        '//',
+        '/TIFF/AMAZONIA1/2021_03/AMAZONIA_1_WFI_DRD_2021_03_03.12_57_40_XYZ/217_015_0/'
+        '2_BC_LCC_WGS84/AMAZONIA_1_WFI_20210303_217_015_L2_BAND4.tif',
+        '/TIFF/AMAZONIA1/2021_03/AMAZONIA_1_WFI_DRD_2021_03_03.12_40_CB11/217_015_0/'
+        '2_BC_LCC_WGS84/AMAZONIA_1_WFI_20210303_217_015_L2_BAND4.tif',
+        '/TIFF/CBERS2B/2010_03/CBERS2B_CCD_201001.130915/151_098_0/2_BC_UTM_WGS84/'
+        'CBERS_2B_CCD2XS_20100301_151_098_L2_BAND1.tif',
+        '/TIFF/LANDSAT1/1973_05/LANDSAT1_MSS_19730521.120000/237_059_0/2_BC_UTM_WGS84/'
+        'LANDSAT_1_MSS_1973521_237_059_L2_BAND4.tif',
+        '/TIFF/CBERS4A/2021_01/CBERS_4A_MUX_RAW_2021_01_01.13_48_30_ETC2/209_110_0/'
+        '2_BC_UTM_WGS84/CBERS_4A_MUX_20210101_209_110_L2_BAND5',
+        '/TIFF/CBERS2B/2010_03/CBERS2B_HRC_20100301.130915/151_A_142_1_0/8_BC_UTM_WGS84/'
+        'CBERS_2B_HRC_20100301_151_A_142_1_L2_BAND1.tif',
+        '/TIFF/CBERS4A/2021_01/CBERS_4A_MUX_RAW_2021_01_01.13_48_30_ETC2/209_110_0_1/'
+        '2_BC_UTM_WGS84/CBERS_4A_MUX_20210101_209_110_L2_BAND5.tif',
+        # scene directory without a dot raises a `ValueError`
+        '/TIFF/CBERS4A/2021_01/CBERS_4A/209_110_0/2_BC_UTM_WGS84'
+    ]
+
+    def tearDown(self):
+        set_engine('split')
+
+    def decode_path_with_engine(self, engine, path):
+        """Decodes a path with an engine, returning either its metadata or its error."""
+
+        set_engine(engine)
+
+        try:
+            return decode_path(path)
+        except Exception as error:  # pylint: disable=broad-except
+            return type(error), str(error)
+
+    def test__regex_engine__same_results(self):
+        """Tests if the `regex` engine has the same results and errors as the `split` one."""
+
+        for path in self.valid_resources + self.invalid_resources:
+            self.assertEqual(self.decode_path_with_engine('split', path),
+                             self.decode_path_with_engine('regex', path))
+
+    def test__regex_engine__valid_paths_match(self):
+        """Tests if valid paths are decoded by the regular expressions, without
+        falling back to the `split` engine."""
+
+        set_engine('regex')
+
+        with patch.object(regex_decoder, '_split_engine', side_effect=AssertionError):
+            for path in self.valid_resources:
+                decode_path(path)
+
+    def test__set_engine(self):
+        """Tests engine selection."""
+
+        self.assertEqual('split', get_engine())
+
+        set_engine('regex')
+        self.assertEqual('regex', get_engine())
+
+        with self.assertRaises(ValueError) as error:
+            set_engine('other')
+
+        self.assertEqual('Invalid engine: `other`. Available engines: `split, regex`.',
+                         str(error.exception))
+        self.assertEqual(['split', 'regex'], list(ENGINES))
@@ -0,0 +1,81 @@
+"""Test cases related to the non-raising decoder."""
+
+
+from unittest import TestCase
+
+from src.cdsr_pack import CDSRDecoderException, Metadata, decode_path
+from src.cdsr_pack.result_decoder import DecodeErrorCode, decode_path_result
+
+
+class TestCDSRPackDecodePathResult(TestCase):
+    """TestCDSRPackDecodePathResult"""
+
+    scene_dir = '/TIFF/CBERS4A/2021_01/CBERS_4A_MUX_RAW_2021_01_01.13_48_30_ETC2'
+    asset = 'CBERS_4A_MUX_20210101_209_110_L2_BAND5.tif'
+
+    def test__decode_path_result(self):
+        """Tests if valid paths are decoded like `decode_path` does."""
+
+        for path in (f'{self.scene_dir}/209_110_0/2_BC_UTM_WGS84/{self.asset}',
+                     '/TIFF/CBERS2B/2010_03/CBERS2B_HRC_20100301.130915/151_B_141_5_0/'
+                     '2_BC_UTM_WGS84/',
+                     '/TIFF/LANDSAT1/1973_05/LANDSAT1_MSS_19730521.120000/237_059_0/'
+                     '4_BC_UTM_WGS84/LANDSAT_1_MSS_19730521_237_059_L4_NDVI.tif'):
+            result = decode_path_result(path)
+
+            self.assertTrue(result.ok)
+            self.assertEqual(decode_path(path), result.metadata)
+            self.assertIsNone(result.message)
+            self.assertIsNone(result.exception())
+
+            result = decode_path_result(path, record=True)
+
+            self.assertIsInstance(result.metadata, Metadata)
+            self.assertEqual(decode_path(path, record=True), result.metadata)
+
+    def test__decode_path_result__errors(self):
+        """Tests if invalid paths return the error code, the offending component and the
+        same error that `decode_path` raises."""
+
+        for path, code, component in (
+            (1, DecodeErrorCode.INVALID_TYPE, int),
+            ('/TIFF/bad/path/', DecodeErrorCode.INVALID_LEVEL, '/TIFF/bad/path'),
+            (f'{self.scene_dir}/209_110_0/2_BC_UTM_WGS84/thumbnail',
+             DecodeErrorCode.ASSET_WITHOUT_EXTENSION, 'thumbnail'),
+            (f'{self.scene_dir}/209_110_0/2_BC_UTM_WGS84/BAND5.tif',
+             DecodeErrorCode.MALFORMED_ASSET, 'BAND5.tif'),
+            (f'{self.scene_dir}/209_110_0/2_BC_UTM_WGS84/CBERS_4A_MUX_202101_209_110_L2.tif',
+             DecodeErrorCode.INVALID_ASSET_DATE, '202101'),
+            ('/TIFF/CBERS4A/2021_01/CBERS_4A_MUX_RAW_2021_01_01/209_110_0/2_BC_UTM_WGS84',
+             DecodeErrorCode.MALFORMED_SCENE_DIR, 'CBERS_4A_MUX_RAW_2021_01_01'),
+            ('/TIFF/CBERS4A/2021_01/CBERS_4A.13_48_30/209_110_0/2_BC_UTM_WGS84',
+             DecodeErrorCode.MALFORMED_SCENE_DIR, 'CBERS_4A.13_48_30'),
+            ('/TIFF/SPOT5/2021_01/SPOT_5_HRG.13_48_30/209_110_0/2_BC_UTM_WGS84',
+             DecodeErrorCode.INVALID_SCENE_DIR, 'SPOT_5_HRG.13_48_30'),
+            ('/TIFF/CBERS4A/2021_01/CBERS_4A_MUX_RAW_2021_01.13_48_30_ETC2/209_110_0/'
+             '2_BC_UTM_WGS84', DecodeErrorCode.INVALID_RECEPTION_DATE,
+             'CBERS_4A_MUX_RAW_2021_01.13_48_30_ETC2'),
+            ('/TIFF/CBERS4A/2021_01/CBERS_4A_MUX_RAW_2021_01_01.13_48_ETC2/209_110_0/'
+             '2_BC_UTM_WGS84', DecodeErrorCode.INVALID_RECEPTION_TIME,
+             'CBERS_4A_MUX_RAW_2021_01_01.13_48_ETC2'),
+            ('/TIFF/CBERS4A/2021_01/CBERS_4A_MUX_RAW_2021_01_01.13_48_30_XYZ/209_110_0/'
+             '2_BC_UTM_WGS84', DecodeErrorCode.INVALID_ANTENNA,
+             'CBERS_4A_MUX_RAW_2021_01_01.13_48_30_XYZ'),
+            (f'{self.scene_dir}/209_110/2_BC_UTM_WGS84', DecodeErrorCode.INVALID_PATH_ROW_DIR,
+             '209_110'),
+            (f'{self.scene_dir}/209_110_0/8_BC_UTM_WGS84',
+             DecodeErrorCode.INVALID_GEO_PROCESSING_DIR, '8_BC_UTM_WGS84')
+        ):
+            result = decode_path_result(path)
+
+            self.assertFalse(result.ok)
+            self.assertIsNone(result.metadata)
+            self.assertEqual((code, component), (result.code, result.component))
+
+            with self.assertRaises(Exception) as error:
+                decode_path(path)
+
+            self.assertIs(type(error.exception), type(result.exception()))
+            self.assertEqual(str(error.exception), result.message)
+
+        self.assertIsInstance(decode_path_result('/TIFF').exception(), CDSRDecoderException)
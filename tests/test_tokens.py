@@ -0,0 +1,79 @@
+"""Test cases related to the matchers of antennas and SR markers."""
+
+
+from random import Random
+from unittest import TestCase
+
+from src.cdsr_pack import DecodeErrorCode, decode_path, decode_path_result, get_antennas, \
+                          get_sr_markers, set_antennas, set_engine, set_sr_markers
+from src.cdsr_pack.tokens import ANTENNAS, SR_MARKERS, SUBSTRING_LIMIT, TokenMatcher
+
+
+class TestCDSRPackTokens(TestCase):
+    """TestCDSRPackTokens"""
+
+    asset = ('/TIFF/CBERS4A/2020_12/CBERS_4A_WFI_RAW_2020_12_07.13_29_30_XYZ1/214_108_0/'
+             '4_BC_UTM_WGS84/CBERS_4A_WFI_20201207_214_108_L4_LEFT_SAVI.tif')
+
+    def tearDown(self):
+        set_engine('split')
+        set_antennas(ANTENNAS)
+        set_sr_markers(SR_MARKERS)
+
+    def test__token_matcher(self):
+        """Tests if tokens are found in priority order, whatever the matching strategy is."""
+
+        small = TokenMatcher(('CB11', 'CP5', 'ETC2'))
+        big = TokenMatcher(('CB11', 'CP5', 'ETC2') + tuple(f'ST{index}' for index in
+                                                            range(SUBSTRING_LIMIT)))
+
+        for matcher in (small, big):
+            self.assertEqual('CB11', matcher.find('13_53_00_ETC2_CB11'))
+            self.assertEqual('CP5', matcher.find('13_22_45_CP5_COROT'))
+            self.assertIsNone(matcher.find('13_53_00'))
+            self.assertTrue(matcher.contains('13_53_00_ETC2'))
+            self.assertFalse(matcher.contains('13_53_00'))
+
+        # overlapping tokens are found as well
+        overlapping = TokenMatcher(('BC', 'ABCD') + tuple(f'ST{index}' for index in
+                                                          range(SUBSTRING_LIMIT)))
+        self.assertEqual('BC', overlapping.find('xABCDx'))
+
+        # the strategies find the same tokens
+        tokens = ('AB', 'BA', 'B', 'CAB', 'ABC', 'C', 'BB', 'CA')
+        random = Random(1)
+
+        for _ in range(1000):
+            size = random.randint(1, len(tokens))
+            substrings = TokenMatcher(tokens[:size][:SUBSTRING_LIMIT])
+            # tokens that are never found make the set big enough to a regular expression
+            regex = TokenMatcher(substrings.tokens + ('Z',) * SUBSTRING_LIMIT)
+            text = ''.join(random.choice('ABC_') for _ in range(random.randint(0, 12)))
+
+            self.assertEqual(substrings.find(text), regex.find(text))
+            self.assertEqual(substrings.contains(text), regex.contains(text))
+
+        with self.assertRaises(ValueError):
+            TokenMatcher(('CB11', ''))
+
+    def test__set_antennas_and_sr_markers(self):
+        """Tests if the antennas and SR markers that are set are used by all decoders."""
+
+        self.assertEqual(ANTENNAS, get_antennas())
+        self.assertEqual(SR_MARKERS, get_sr_markers())
+        self.assertEqual(DecodeErrorCode.INVALID_ANTENNA, decode_path_result(self.asset).code)
+
+        set_antennas(['XYZ1', *ANTENNAS])
+        set_sr_markers([*SR_MARKERS, 'SAVI'])
+
+        self.assertEqual(('XYZ1', 'CB11', 'CP5', 'ETC2'), get_antennas())
+
+        for engine in ('split', 'regex'):
+            set_engine(engine)
+            metadata = decode_path(self.asset)
+
+            self.assertEqual(('XYZ1', 'SR'), (metadata['antenna'],
+                                              metadata['radio_processing']))
+
+        self.assertTrue(decode_path_result(self.asset).ok)
+        self.assertEqual('SR', decode_path_result(self.asset).metadata['radio_processing'])
@@ -0,0 +1,177 @@
+"""Test cases related to the `/TIFF` tree walker."""
+
+
+from os import makedirs
+from os.path import join
+from tempfile import TemporaryDirectory
+from threading import Lock
+from time import sleep
+from unittest import TestCase
+from unittest.mock import patch
+
+from src.cdsr_pack import decode_path, walk_tiff, walk_tiff_parallel
+from src.cdsr_pack import walker
+from src.cdsr_pack.walker import PartitionTiming, partition_report
+
+
+def create_tree(top, relative_paths):
+    """Creates empty files (or directories, if the path ends with a slash) inside `top`."""
+
+    for relative_path in relative_paths:
+        path = join(top, relative_path)
+
+        if path.endswith('/'):
+            makedirs(path, exist_ok=True)
+            continue
+
+        makedirs(path.rsplit('/', 1)[0], exist_ok=True)
+        with open(path, 'w', encoding='utf-8'):
+            pass
+
+
+class TestCDSRPackWalkTIFF(TestCase):
+    """TestCDSRPackWalkTIFF"""
+
+    valid_assets = [
+        ('CBERS4A/2021_01/CBERS_4A_MUX_RAW_2021_01_01.13_48_30_ETC2/209_110_0/2_BC_UTM_WGS84/'
+         'CBERS_4A_MUX_20210101_209_110_L2_BAND5.tif'),
+        ('CBERS4A/2021_01/CBERS_4A_MUX_RAW_2021_01_01.13_48_30_ETC2/209_110_0/2_BC_UTM_WGS84/'
+         'CBERS_4A_MUX_20210101_209_110_L2_BAND5.xml'),
+        ('CBERS4A/2021_01/CBERS_4A_MUX_RAW_2021_01_01.13_48_30_ETC2/209_110_0/4_BC_UTM_WGS84/'
+         'CBERS_4A_MUX_20210101_209_110_L4_BAND5_GRID_SURFACE.tif'),
+        ('CBERS2B/2010_03/CBERS2B_HRC_20100301.130915/151_B_141_5_0/2_BC_UTM_WGS84/'
+         'CBERS_2B_HRC_20100301_151_B_141_5_L2_BAND1.tif'),
+        ('LANDSAT1/1973_05/LANDSAT1_MSS_19730521.120000/237_059_0/2_BC_UTM_WGS84/'
+         'LANDSAT_1_MSS_19730521_237_059_L2_BAND4.tif')
+    ]
+
+    invalid_resources = [
+        # invalid antenna
+        ('AMAZONIA1/2021_03/AMAZONIA_1_WFI_DRD_2021_03_03.12_57_40/217_015_0/2_BC_LCC_WGS84/'
+         'AMAZONIA_1_WFI_20210303_217_015_L2_BAND4.tif'),
+        # invalid path/row directory
+        ('CBERS4A/2021_01/CBERS_4A_MUX_RAW_2021_01_01.13_48_30_ETC2/209_110_0_1/'
+         '2_BC_UTM_WGS84/CBERS_4A_MUX_20210101_209_110_L2_BAND5.tif'),
+        # invalid geo. processing directory
+        ('CBERS4A/2021_01/CBERS_4A_MUX_RAW_2021_01_01.13_48_30_ETC2/209_110_0/8_BC_UTM_WGS84/'
+         'CBERS_4A_MUX_20210101_209_110_L8_BAND5.tif'),
+        # asset without extension
+        ('CBERS4A/2021_01/CBERS_4A_MUX_RAW_2021_01_01.13_48_30_ETC2/209_110_0/2_BC_UTM_WGS84/'
+         'CBERS_4A_MUX_20210101_209_110_L2_BAND5'),
+        # directories inside the geo. processing directory are not assets
+        ('CBERS4A/2021_01/CBERS_4A_MUX_RAW_2021_01_01.13_48_30_ETC2/209_110_0/2_BC_UTM_WGS84/'
+         'thumbnail/'),
+        # files above the asset level are ignored
+        'CBERS4A/2021_01/README.txt'
+    ]
+
+    def test__walk_tiff(self):
+        """Tests if `walk_tiff` yields the same metadata as `decode_path` for valid assets
+        and reports the invalid ones."""
+
+        with TemporaryDirectory() as temp_dir:
+            top = join(temp_dir, 'TIFF')
+            create_tree(top, self.valid_assets + self.invalid_resources)
+
+            errors = []
+            result = sorted(walk_tiff(top, onerror=errors.append))
+
+            self.assertEqual(sorted(join(top, asset) for asset in self.valid_assets),
+                             [path for path, _ in result])
+
+            for path, metadata in result:
+                self.assertEqual(decode_path(path), metadata)
+
+            self.assertEqual(sorted([
+                'An asset must have an extension.',
+                'Geo. processing directory cannot be decoded: `8_BC_UTM_WGS84`.',
+                'Invalid antenna in scene_dir: `AMAZONIA_1_WFI_DRD_2021_03_03.12_57_40`.',
+                'Path/row directory cannot be decoded: `209_110_0_1`.'
+            ]), sorted(str(error) for error in errors))
+
+    def test__walk_tiff__missing_top(self):
+        """Tests if `walk_tiff` reports a missing top directory, like `os.walk` does."""
+
+        with TemporaryDirectory() as temp_dir:
+            errors = []
+
+            self.assertEqual([], list(walk_tiff(join(temp_dir, 'TIFF'), onerror=errors.append)))
+            self.assertEqual(1, len(errors))
+            self.assertIsInstance(errors[0], FileNotFoundError)
+
+            # without `onerror`, errors are ignored
+            self.assertEqual([], list(walk_tiff(join(temp_dir, 'TIFF'))))
+
+    def test__walk_tiff_parallel(self):
+        """Tests if `walk_tiff_parallel` yields the same assets and reports the same
+        errors as `walk_tiff`, with the timing of each partition."""
+
+        with TemporaryDirectory() as temp_dir:
+            top = join(temp_dir, 'TIFF')
+            create_tree(top, self.valid_assets + self.invalid_resources +
+                        ['CBERS4A/2021_02/', 'CBERS4A/2021_03/'])
+
+            errors = []
+            expected = list(walk_tiff(top, onerror=errors.append))
+
+            for workers in (1, 3):
+                parallel_errors, timings = [], []
+
+                self.assertEqual(expected, list(walk_tiff_parallel(
+                    top, workers=workers, ordered=True, onerror=parallel_errors.append)))
+                self.assertEqual(sorted(expected), sorted(walk_tiff_parallel(
+                    top, workers=workers, onerror=parallel_errors.append,
+                    onpartition=timings.append)))
+
+                self.assertEqual(sorted(map(str, errors * 2)), sorted(map(str, parallel_errors)))
+
+                self.assertEqual([('AMAZONIA1', '2021_03', 0, 1), ('CBERS2B', '2010_03', 1, 0),
+                                  ('CBERS4A', '2021_01', 3, 3), ('CBERS4A', '2021_02', 0, 0),
+                                  ('CBERS4A', '2021_03', 0, 0), ('LANDSAT1', '1973_05', 1, 0)],
+                                 sorted(timing[:4] for timing in timings))
+
+    def test__walk_tiff_parallel__break(self):
+        """Tests if breaking out of `walk_tiff_parallel` cancels the partitions that are
+        not being walked yet, instead of walking them before the pool shuts down."""
+
+        walk_partition = walker._walk_partition  # pylint: disable=protected-access
+        lock = Lock()
+
+        def slow_walk_partition(*args):
+            with lock:
+                calls.append(args)
+
+            # the first partition is walked at once, then the others keep both workers busy
+            if len(calls) > 1:
+                sleep(0.3)
+
+            return walk_partition(*args)
+
+        with TemporaryDirectory() as temp_dir:
+            top = join(temp_dir, 'TIFF')
+            create_tree(top, [f'CBERS4A/2021_{month:02d}/CBERS_4A_MUX_RAW_2021_{month:02d}_01.'
+                              f'13_48_30_ETC2/209_110_0/2_BC_UTM_WGS84/CBERS_4A_MUX_2021'
+                              f'{month:02d}01_209_110_L2_BAND5.tif' for month in range(1, 9)])
+
+            for ordered in (True, False):
+                calls = []
+
+                with patch.object(walker, '_walk_partition', slow_walk_partition):
+                    for _ in walk_tiff_parallel(top, workers=2, ordered=ordered):
+                        break
+
+                # four partitions are in flight, but the ones that are not being walked yet
+                # are cancelled
+                self.assertLess(len(calls), 4, ordered)
+
+    def test__partition_report(self):
+        """Tests the table of the partition timings."""
+
+        self.assertEqual(
+            'satellite   month         assets  errors   seconds    assets/s\n'
+            'CBERS4A     2021_01         1000       2     2.000         500\n'
+            'LANDSAT1    1973_05            0       0     0.000           0',
+            partition_report([PartitionTiming('LANDSAT1', '1973_05', 0, 0, 0.0),
+                              PartitionTiming('CBERS4A', '2021_01', 1000, 2, 2.0),
+                              PartitionTiming('CBERS2B', '2010_03', 10, 0, 0.0)], limit=2)
+        )
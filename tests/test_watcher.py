@@ -0,0 +1,207 @@
+"""Test cases related to the `/TIFF` tree watcher."""
+
+
+from ctypes import CDLL
+from os import read
+from os.path import join
+from struct import pack
+from tempfile import TemporaryDirectory
+from time import monotonic
+from unittest import TestCase
+from unittest.mock import patch
+
+from src.cdsr_pack import watcher as watcher_module
+from src.cdsr_pack.watcher import LatencyMetrics, LatencySummary, TiffWatcher
+
+from test_walker import create_tree
+
+
+class FailingWatchLibC:  # pylint: disable=too-few-public-methods
+    """C library whose `inotify_add_watch` fails, as when `max_user_watches` is reached."""
+
+    def __init__(self, *args, **kwargs):
+        self.libc = CDLL(*args, **kwargs)
+        self.inotify_init1 = self.libc.inotify_init1
+
+    @staticmethod
+    def inotify_add_watch(*_):
+        """Fails to watch a directory."""
+
+        return -1
+
+
+def poll_paths(watcher, count):
+    """Polls a watcher until `count` events are emitted, returning their paths."""
+
+    events = []
+    deadline = monotonic() + 5
+
+    while len(events) < count and monotonic() < deadline:
+        events.extend(watcher.poll(0.2))
+
+    return sorted(event.path for event in events)
+
+
+class TestCDSRPackTiffWatcher(TestCase):
+    """TestCDSRPackTiffWatcher"""
+
+    existing_asset = ('CBERS4A/2021_01/CBERS_4A_MUX_RAW_2021_01_01.13_48_30_ETC2/209_110_0/'
+                      '2_BC_UTM_WGS84/CBERS_4A_MUX_20210101_209_110_L2_BAND5.tif')
+
+    new_assets = [
+        ('CBERS4A/2021_01/CBERS_4A_MUX_RAW_2021_01_01.13_48_30_ETC2/209_110_0/'
+         '2_BC_UTM_WGS84/CBERS_4A_MUX_20210101_209_110_L2_BAND6.tif'),
+        # a whole new scene directory
+        ('AMAZONIA1/2021_03/AMAZONIA_1_WFI_DRD_2021_03_03.12_57_40_CB11/035_020_0/'
+         '4_BC_UTM_WGS84/AMAZONIA_1_WFI_20210303_035_020_L4_BAND2.xml')
+    ]
+
+    def watch(self, use_inotify):
+        """Creates assets while watching a tree, returning the emitted events and
+        the errors."""
+
+        errors = []
+
+        with TemporaryDirectory() as temp_dir:
+            top = join(temp_dir, 'TIFF')
+            create_tree(top, [self.existing_asset])
+
+            with TiffWatcher(top, debounce=0.1, poll_interval=0.05,
+                             use_inotify=use_inotify, onerror=errors.append) as watcher:
+                # a burst of writes to the same asset, a file that is not an asset
+                # and an asset that cannot be decoded
+                create_tree(top, self.new_assets * 3 + [
+                    self.new_assets[0].replace('.tif', '.png'),
+                    'CBERS4A/2021_01/bad_scene/209_110_0/2_BC_UTM_WGS84/bad.tif'
+                ])
+
+                events = []
+                deadline = monotonic() + 5
+
+                while len(events) < 2 and monotonic() < deadline:
+                    events.extend(watcher.poll(0.5))
+
+                summary = watcher.metrics.summary()
+
+        return top, events, errors, summary
+
+    def assert_events(self, top, events, errors, summary):
+        """Asserts that just one event has been emitted to each new asset."""
+
+        self.assertEqual(sorted(join(top, asset) for asset in self.new_assets),
+                         sorted(event.path for event in events))
+
+        events = {event.path: event for event in events}
+        event = events[join(top, self.new_assets[1])]
+
+        self.assertEqual('AMAZONIA1_WFI_L4_DN', event.collection)
+        self.assertEqual('AMAZONIA1_WFI_035020_20210303_CB11', event.item)
+        self.assertEqual('2021-03-03', event.metadata['date'])
+        self.assertGreaterEqual(event.latency, 0.0)
+
+        self.assertEqual(1, len(errors))
+        self.assertEqual(2, summary.count)
+        self.assertGreaterEqual(summary.max, summary.p50)
+
+    def test__watcher__inotify(self):
+        """Tests the watcher with inotify."""
+
+        try:
+            result = self.watch(True)
+        except (OSError, AttributeError):
+            self.skipTest('inotify is not available.')
+
+        self.assert_events(*result)
+
+    def test__watcher__polling(self):
+        """Tests the watcher polling the tree."""
+
+        self.assert_events(*self.watch(False))
+
+    def inotify_watcher(self, top, errors):
+        """Returns a watcher with inotify, or skips the test if it is not available."""
+
+        try:
+            return TiffWatcher(top, debounce=0.05, poll_interval=0.05, use_inotify=True,
+                               onerror=errors.append)
+        except (OSError, AttributeError):
+            self.skipTest('inotify is not available.')
+
+    def test__watcher__inotify_watch_failures(self):
+        """Tests if the watcher falls back to polling if the tree cannot be watched, and
+        if the directories that cannot be watched later are scanned."""
+
+        errors = []
+
+        with TemporaryDirectory() as temp_dir:
+            top = join(temp_dir, 'TIFF')
+            create_tree(top, [self.existing_asset])
+
+            # the watcher is not created at all if it is not available
+            self.inotify_watcher(top, errors).close()
+
+            with patch.object(watcher_module, 'CDLL', FailingWatchLibC):
+                with self.assertRaises(OSError):
+                    TiffWatcher(top, use_inotify=True)
+
+                with TiffWatcher(top, poll_interval=0.05) as watcher:
+                    self.assertEqual('polling', watcher.backend.name)
+
+            with self.inotify_watcher(top, errors) as watcher:
+                watcher.backend.libc = FailingWatchLibC(None)
+                create_tree(top, self.new_assets)
+
+                self.assertEqual(sorted(join(top, asset) for asset in self.new_assets),
+                                 poll_paths(watcher, 2))
+
+        self.assertTrue(errors)
+        self.assertTrue(all(isinstance(error, OSError) for error in errors))
+
+    def test__watcher__inotify_overflow(self):
+        """Tests if the assets whose events are lost by an overflow are emitted, and if
+        the assets already emitted are not emitted again."""
+
+        errors = []
+
+        with TemporaryDirectory() as temp_dir:
+            top = join(temp_dir, 'TIFF')
+            create_tree(top, [self.existing_asset])
+
+            with self.inotify_watcher(top, errors) as watcher:
+                create_tree(top, self.new_assets[:1])
+                self.assertEqual([join(top, self.new_assets[0])], poll_paths(watcher, 1))
+
+                # the events of a new asset are lost, then the queue overflows
+                lost_asset = self.new_assets[0].replace('BAND6', 'BAND7')
+                create_tree(top, [lost_asset])
+
+                try:
+                    while read(watcher.backend.fd, 65536):
+                        pass
+                except BlockingIOError:
+                    pass
+
+                # pylint: disable=protected-access
+                overflow = pack('iIII', -1, watcher_module._IN_Q_OVERFLOW, 0, 0)
+                watcher.backend._read_events(overflow)
+
+                self.assertEqual([join(top, lost_asset)], poll_paths(watcher, 1))
+                self.assertEqual([], watcher.poll(0.3))
+
+        self.assertEqual(1, len(errors))
+
+    def test__latency_metrics__bounded(self):
+        """Tests if the percentiles are computed over the latest events, while the count,
+        mean and maximum are computed over all events."""
+
+        metrics = LatencyMetrics(window=10)
+
+        for latency in [100.0] + [1.0] * 19:
+            metrics.record(latency)
+
+        self.assertEqual(10, len(metrics.latencies))
+        self.assertEqual(LatencySummary(20, 5.95, 1.0, 1.0, 100.0), metrics.summary())
+        self.assertEqual(LatencySummary(0, 0.0, 0.0, 0.0, 0.0), LatencyMetrics().summary())
+
+        with self.assertRaises(ValueError):
+            LatencyMetrics(window=0)